@@ -0,0 +1,3 @@
+"""
+Benchmarks of dit's most frequently used code paths, for use with asv.
+"""
@@ -0,0 +1,68 @@
+"""
+Benchmarks for constructing, manipulating and sampling distributions.
+"""
+
+from __future__ import division
+
+import numpy as np
+
+import dit
+
+
+class Construction(object):
+    """
+    Construct distributions from outcomes and from arrays.
+    """
+    params = ([2, 4, 8], [2, 4])
+    param_names = ['n', 'k']
+
+    def setup(self, n, k):
+        np.random.seed(0)
+        d = dit.random_distribution(n, k)
+        self.outcomes = d.outcomes
+        self.pmf = d.pmf
+        self.array = d.pmf.reshape([k] * n)
+
+    def time_from_outcomes(self, n, k):
+        dit.Distribution(self.outcomes, self.pmf)
+
+    def time_from_ndarray(self, n, k):
+        dit.Distribution.from_ndarray(self.array)
+
+
+class Marginalization(object):
+    """
+    Marginalize, coalesce and condition distributions.
+    """
+    params = ([2, 4, 8], [2, 4])
+    param_names = ['n', 'k']
+
+    def setup(self, n, k):
+        np.random.seed(0)
+        self.d = dit.random_distribution(n, k)
+        self.half = list(range(n // 2))
+        self.rest = list(range(n // 2, n))
+
+    def time_marginal(self, n, k):
+        self.d.marginal(self.half)
+
+    def time_coalesce(self, n, k):
+        self.d.coalesce([self.half, self.rest, self.half])
+
+    def time_condition_on(self, n, k):
+        self.d.condition_on(self.half)
+
+
+class Sampling(object):
+    """
+    Draw samples from a distribution.
+    """
+    params = ([2, 8], [10, 10000])
+    param_names = ['n', 'size']
+
+    def setup(self, n, size):
+        np.random.seed(0)
+        self.d = dit.random_distribution(n, 2)
+
+    def time_rand(self, n, size):
+        self.d.rand(size)
@@ -0,0 +1,64 @@
+"""
+Benchmarks for divergences between distributions.
+"""
+
+from __future__ import division
+
+import numpy as np
+
+import dit
+from dit.divergences import earth_movers_distance, earth_movers_distances, pairwise
+from dit.divergences.pmf import earth_movers_distance as earth_movers_distance_pmf
+
+
+class EarthMovers(object):
+    """
+    Compute the Earth Mover's Distance with each kind of distance.
+    """
+    params = ([10, 100], ['categorical', 'numerical', 'matrix'])
+    param_names = ['size', 'kind']
+    timeout = 300
+
+    def setup(self, size, kind):
+        np.random.seed(0)
+        self.p, self.q = np.random.dirichlet(np.ones(size), 2)
+        if kind == 'categorical':
+            outcomes = ['{:03d}'.format(i) for i in range(size)]
+            self.d1 = dit.Distribution(outcomes, self.p)
+            self.d2 = dit.Distribution(outcomes, self.q)
+            self.distances = None
+        else:
+            self.d1 = dit.ScalarDistribution(range(size), self.p)
+            self.d2 = dit.ScalarDistribution(range(size), self.q)
+            self.distances = np.random.rand(size, size) if kind == 'matrix' else None
+        self.dists = [dit.ScalarDistribution(self.d1.outcomes, p) if kind != 'categorical'
+                      else dit.Distribution(self.d1.outcomes, p)
+                      for p in np.random.dirichlet(np.ones(size), 100)]
+
+    def time_earth_movers_distance(self, size, kind):
+        earth_movers_distance(self.d1, self.d2, distances=self.distances)
+
+    def time_earth_movers_distance_pmf(self, size, kind):
+        earth_movers_distance_pmf(self.p, self.q, distances=self.distances)
+
+    def time_earth_movers_distances(self, size, kind):
+        if self.distances is not None:
+            raise NotImplementedError
+        earth_movers_distances(self.d1, self.dists)
+
+
+class Pairwise(object):
+    """
+    Compute divergence matrices over collections of distributions.
+    """
+    params = ([10, 100, 300], ['jensen_shannon_divergence', 'kullback_leibler_divergence',
+                               'hellinger_distance', 'variational_distance'])
+    param_names = ['count', 'metric']
+    timeout = 300
+
+    def setup(self, count, metric):
+        np.random.seed(0)
+        self.dists = [dit.random_distribution(3, 3) for _ in range(count)]
+
+    def time_pairwise(self, count, metric):
+        pairwise(self.dists, metric=metric)
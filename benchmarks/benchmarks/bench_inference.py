@@ -0,0 +1,46 @@
+"""
+Benchmarks for inferring distributions and measures from data.
+"""
+
+from __future__ import division
+
+import numpy as np
+
+from dit.inference import distribution_from_data, total_correlation_ksg
+from dit.inference.counts import counts_from_data
+
+
+class Counts(object):
+    """
+    Count words in a time series.
+    """
+    params = ([10**4, 10**6], [2, 4], [1, 4])
+    param_names = ['size', 'k', 'hLength']
+    timeout = 300
+
+    def setup(self, size, k, hLength):
+        np.random.seed(0)
+        self.data = np.random.randint(0, k, size)
+
+    def time_counts_from_data(self, size, k, hLength):
+        counts_from_data(self.data, hLength, 1)
+
+    def time_distribution_from_data(self, size, k, hLength):
+        distribution_from_data(self.data, hLength + 1)
+
+
+class KSG(object):
+    """
+    Estimate the total correlation of continuous data.
+    """
+    params = ([100, 1000, 10000], [False, True])
+    param_names = ['size', 'conditional']
+    timeout = 300
+
+    def setup(self, size, conditional):
+        np.random.seed(0)
+        self.data = np.random.multivariate_normal([0, 0, 0], [[1, .5, .3], [.5, 1, .2], [.3, .2, 1]], size)
+        self.crvs = [2] if conditional else None
+
+    def time_total_correlation_ksg(self, size, conditional):
+        total_correlation_ksg(self.data, [[0], [1]], self.crvs)
@@ -0,0 +1,69 @@
+"""
+Benchmarks for measures computed by numerical optimization.
+"""
+
+from __future__ import division
+
+from itertools import combinations
+
+import numpy as np
+
+import dit
+from dit.algorithms import maxent_dist
+from dit.example_dists.intrinsic import intrinsic_1, intrinsic_2
+from dit.multivariate import intrinsic_total_correlation, wyner_common_information
+
+
+class Intrinsic(object):
+    """
+    Compute intrinsic mutual informations.
+    """
+    params = (['intrinsic_1', 'intrinsic_2'],)
+    param_names = ['dist']
+    timeout = 600
+
+    def setup(self, dist):
+        self.d = {'intrinsic_1': intrinsic_1,
+                  'intrinsic_2': intrinsic_2,
+                  }[dist]
+
+    def time_intrinsic_total_correlation(self, dist):
+        np.random.seed(0)
+        intrinsic_total_correlation(self.d, [[0], [1]], [2], niter=5)
+
+
+class Wyner(object):
+    """
+    Compute the Wyner common information.
+    """
+    params = ([2, 3],)
+    param_names = ['k']
+    timeout = 600
+
+    def setup(self, k):
+        np.random.seed(0)
+        self.d = dit.random_distribution(2, k)
+
+    def time_wyner_common_information(self, k):
+        np.random.seed(0)
+        wyner_common_information(self.d, niter=5)
+
+
+class MaxEnt(object):
+    """
+    Compute pairwise-marginal maximum entropy distributions.
+    """
+    params = ([3, 6, 10], ['ipf', 'sp'])
+    param_names = ['n', 'method']
+    timeout = 600
+
+    def setup(self, n, method):
+        if method == 'sp' and n > 6:
+            raise NotImplementedError
+        np.random.seed(0)
+        pmf = np.random.dirichlet(np.ones(2**n)).reshape([2]*n)
+        self.d = dit.Distribution.from_ndarray(pmf)
+        self.rvs = list(combinations(range(n), 2))
+
+    def time_maxent_dist(self, n, method):
+        maxent_dist(self.d, self.rvs, method=method)
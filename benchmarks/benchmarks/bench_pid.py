@@ -0,0 +1,71 @@
+"""
+Benchmarks for partial information decompositions.
+"""
+
+from __future__ import division
+
+import numpy as np
+
+from dit import Distribution
+from dit.pid import (PID_BROJA, PID_CCS, PID_GK, PID_MMI, PID_PM, PID_Proj,
+                     PID_RAV, PID_RR, PID_WB, PID_dep, PID_downarrow,
+                     bivariates, trivariates)
+
+
+PIDS = {pid.__name__: pid for pid in [PID_BROJA, PID_CCS, PID_GK, PID_MMI,
+                                      PID_PM, PID_Proj, PID_RAV, PID_RR,
+                                      PID_WB, PID_dep, PID_downarrow]}
+
+# Measures which remain tractable with three inputs.
+FAST_PIDS = ['PID_CCS', 'PID_GK', 'PID_MMI', 'PID_PM', 'PID_Proj', 'PID_WB']
+
+
+class Bivariate(object):
+    """
+    Decompose the standard bivariate distributions.
+    """
+    params = (sorted(PIDS), ['and', 'diff', 'rdn xor', 'sum'])
+    param_names = ['pid', 'dist']
+    timeout = 600
+
+    def setup(self, pid, dist):
+        self.pid = PIDS[pid]
+        self.d = bivariates[dist]
+
+    def time_pid(self, pid, dist):
+        np.random.seed(0)
+        self.pid(self.d)
+
+
+class Trivariate(object):
+    """
+    Decompose trivariate distributions, whose lattice has 18 nodes.
+    """
+    params = (FAST_PIDS, ['sum', 'xor cat'])
+    param_names = ['pid', 'dist']
+    timeout = 600
+
+    def setup(self, pid, dist):
+        self.pid = PIDS[pid]
+        self.d = trivariates[dist]
+
+    def time_pid(self, pid, dist):
+        self.pid(self.d)
+
+
+class Batch(object):
+    """
+    Decompose many random bivariate distributions sharing their layout.
+    """
+    params = (['PID_BROJA', 'PID_CCS', 'PID_MMI', 'PID_PM', 'PID_WB'], [10, 100])
+    param_names = ['pid', 'size']
+    timeout = 600
+
+    def setup(self, pid, size):
+        np.random.seed(0)
+        self.pid = PIDS[pid]
+        self.dists = [Distribution.from_ndarray(np.random.dirichlet(np.ones(8)).reshape(2, 2, 2))
+                      for _ in range(size)]
+
+    def time_batch(self, pid, size):
+        self.pid.batch(self.dists)
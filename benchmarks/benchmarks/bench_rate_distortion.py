@@ -0,0 +1,42 @@
+"""
+Benchmarks for rate-distortion and information bottleneck curves.
+"""
+
+from __future__ import division
+
+import numpy as np
+
+from dit.example_dists import Xor, giant_bit
+from dit.rate_distortion import IBCurve, RDCurve
+
+
+class RateDistortion(object):
+    """
+    Compute rate-distortion curves.
+    """
+    params = (['sp', 'ba'],)
+    param_names = ['method']
+    timeout = 600
+
+    def setup(self, method):
+        self.d = giant_bit(1, 4)
+
+    def time_rd_curve(self, method):
+        np.random.seed(0)
+        RDCurve(self.d, beta_num=11, method=method)
+
+
+class InformationBottleneck(object):
+    """
+    Compute information bottleneck curves.
+    """
+    params = (['sp', 'ba'],)
+    param_names = ['method']
+    timeout = 600
+
+    def setup(self, method):
+        self.d = Xor()
+
+    def time_ib_curve(self, method):
+        np.random.seed(0)
+        IBCurve(self.d, rvs=[[0, 1], [2]], beta_num=11, method=method)
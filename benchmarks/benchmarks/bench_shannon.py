@@ -0,0 +1,67 @@
+"""
+Benchmarks for Shannon and multivariate information measures.
+"""
+
+from __future__ import division
+
+import numpy as np
+
+import dit
+from dit.multivariate.deweese import deweese_constructor
+from dit.shannon import all_entropies
+
+
+class Measures(object):
+    """
+    Compute information measures of distributions over growing numbers of
+    variables and alphabet sizes.
+    """
+    params = ([2, 4, 6, 8], [2, 4])
+    param_names = ['n', 'k']
+
+    def setup(self, n, k):
+        np.random.seed(0)
+        self.d = dit.random_distribution(n, k)
+        self.rvs = [[i] for i in range(n)]
+
+    def _fresh(self):
+        # Measures are cached on the distribution, so forget them first.
+        self.d._clear_cache()
+        return self.d
+
+    def time_entropy(self, n, k):
+        dit.shannon.entropy(self._fresh())
+
+    def time_conditional_entropy(self, n, k):
+        dit.shannon.conditional_entropy(self._fresh(), [0], list(range(1, n)))
+
+    def time_all_entropies(self, n, k):
+        all_entropies(self._fresh())
+
+    def time_coinformation(self, n, k):
+        dit.multivariate.coinformation(self._fresh(), self.rvs)
+
+    def time_total_correlation(self, n, k):
+        dit.multivariate.total_correlation(self._fresh(), self.rvs)
+
+    def time_dual_total_correlation(self, n, k):
+        dit.multivariate.dual_total_correlation(self._fresh(), self.rvs)
+
+
+class DeWeese(object):
+    """
+    Compute the exact DeWeese co-information over growing alphabets.
+    """
+    params = ([2, 3], [3, 4, 6])
+    param_names = ['n', 'k']
+    timeout = 300
+
+    def setup(self, n, k):
+        if n == 3 and k == 6:
+            raise NotImplementedError
+        np.random.seed(0)
+        self.d = dit.random_distribution(n, k)
+        self.f = deweese_constructor(dit.multivariate.coinformation)
+
+    def time_deweese_coinformation(self, n, k):
+        self.f(self.d)
@@ -25,6 +25,7 @@ from .samplespace import ScalarSampleSpace, SampleSpace, CartesianProduct
 from .distconst import *
 from .bgm import *
 from .helpers import copypmf
+from .cdist import ConditionalDistribution
 from .cdisthelpers import joint_from_factors
 from .algorithms import pruned_samplespace, expanded_samplespace
 
@@ -22,10 +22,10 @@ def channel_capacity(cdists, marginal=None, rtol=None, atol=None):
 
     Parameters
     ----------
-    cdists : list, ndarray
+    cdists : list, ConditionalDistribution, ndarray
         A list of conditional distributions. For each ``x=outcomes[i]``, the
         corresponding element ``cdists[i]`` should represent P(Y | X=x); or
-        the conditional distribution as an array.
+        the conditional distribution as a ConditionalDistribution or an array.
     marginal : distribution | None
         The marginal distribution P(X) that goes with P(Y|X). This is optional,
         but if provided, then it is used to construct a Distribution object
@@ -139,7 +139,7 @@ def channel_capacity_joint(dist, input, output, marginal=False, rv_mode=None):
         The marginal distribution that achieves the channel capacity.
         Only returned if `marginal` is True.
     """
-    marg, cdists = dist.condition_on(crvs=input, rvs=output, rv_mode=rv_mode)
+    marg, cdists = dist.condition_on(crvs=input, rvs=output, rv_mode=rv_mode, conditional=True)
     cc, marg_opt = channel_capacity(cdists)
     if marginal:
         marg.pmf = marg_opt
@@ -10,6 +10,7 @@ from itertools import combinations
 from debtcollector import removals
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from .maxentropy import marginal_constraints_generic
 from .optimization import BaseOptimizer, BaseConvexOptimizer, BaseNonConvexOptimizer
@@ -17,7 +18,8 @@ from .optutil import prepare_dist
 from .pid_broja import (extra_constraints as broja_extra_constraints,
                         prepare_dist as broja_prepare_dist)
 from .. import Distribution, product_distribution
-from ..helpers import RV_MODES
+from ..exceptions import ditException
+from ..helpers import RV_MODES, parse_rvs
 from ..multivariate import coinformation as I
 from ..utils import flatten
 
@@ -33,28 +35,121 @@ def infer_free_values(A, b):
 
     Parameters
     ----------
-    A : np.ndarray
-        The constraint matrix.
+    A : np.ndarray, scipy.sparse matrix
+        The constraint matrix, whose elements are zero or one.
     b : np.ndarray
         The constraint values.
 
     Returns
     -------
-    fixed : list
-        The list of fixed indices.
+    free : list
+        The list of free indices.
     """
+    A = csr_matrix(A)
     # find locations of b == 0, since pmf values are non-negative, this means they are identically zero.
-    free = [i for i, n in enumerate(A[b == 0, :].sum(axis=0)) if n == 0]
+    free = np.asarray(A[b == 0, :].sum(axis=0)).ravel() == 0
     while True:
         # now find rows of A with only a single free value in them. those values must also be fixed.
-        fixed = A[:, free].sum(axis=1) == 1
-        new_fixed = [[i for i, n in enumerate(row) if n and (i in free)][0] for i, row in enumerate(A) if fixed[i]]
-        free = list(sorted(set(free) - set(new_fixed)))
-        if not new_fixed:
+        fixed = A.dot(free.astype(float)) == 1
+        new_fixed = A[fixed, :].multiply(free).nonzero()[1]
+        if not len(new_fixed):
             break
+        free[new_fixed] = False
+    return np.flatnonzero(free).tolist()
+
+
+def _ipf_free(pmf, axes):
+    """
+    Find the entries of `pmf` which are not determined by its marginals.
+
+    This mirrors `infer_free_values` for the dense pmf: entries in a null
+    marginal probability are zero, and an entry which is the only remaining
+    free one in some marginal probability is fixed by it.
+
+    Parameters
+    ----------
+    pmf : np.ndarray
+        The joint distribution.
+    axes : list of tuples
+        For each marginal, the axes summed over to form it.
+
+    Returns
+    -------
+    free : np.ndarray
+        A boolean mask of the free entries.
+    """
+    free = np.ones(pmf.shape, dtype=bool)
+    for axis in axes:
+        free &= pmf.sum(axis=axis, keepdims=True) > 0
+
+    # the normalization constraint fixes a lone free entry, too
+    axes = axes + [tuple(range(pmf.ndim))]
+    while True:
+        fixed = np.zeros(pmf.shape, dtype=bool)
+        for axis in axes:
+            fixed |= free & (free.sum(axis=axis, keepdims=True) == 1)
+        if not fixed.any():
+            break
+        free &= ~fixed
+
     return free
 
 
+def _ipf(pmf, marginals, maxiter=None, tol=1e-10):
+    """
+    Find the maximum entropy pmf matching some marginals of `pmf` by iterative
+    proportional fitting.
+
+    Starting from the uniform distribution over the entries not determined by
+    the marginals, each constrained marginal is in turn matched by rescaling
+    the joint along the remaining axes. The limit is the I-projection of the
+    uniform distribution onto the distributions with the given marginals,
+    which is their maximum entropy distribution.
+
+    Parameters
+    ----------
+    pmf : np.ndarray
+        The joint distribution whose marginals should be matched, with one
+        axis per random variable.
+    marginals : list of lists
+        The axes of each marginal to match.
+    maxiter : int, None
+        The maximum number of sweeps through the marginals. Defaults to 1000.
+    tol : float
+        The largest deviation of any marginal probability at which to stop.
+
+    Returns
+    -------
+    me : np.ndarray
+        The maximum entropy pmf.
+    """
+    n = pmf.ndim
+    axes = [tuple(i for i in range(n) if i not in marginal) for marginal in marginals]
+
+    if maxiter is None:
+        maxiter = 1000
+
+    # Entries fixed by the marginals keep their values, which are then
+    # removed from the marginals the free entries must match.
+    free = _ipf_free(pmf, axes)
+    fixed = np.where(free, 0, pmf)
+    targets = [np.clip(pmf.sum(axis=axis, keepdims=True) - fixed.sum(axis=axis, keepdims=True), 0, None)
+               for axis in axes]
+
+    me = free / max(free.sum(), 1) * (1 - fixed.sum())
+    for _ in range(maxiter):
+        error = 0
+        for axis, target in zip(axes, targets):
+            current = me.sum(axis=axis, keepdims=True)
+            error = max(error, np.abs(current - target).max())
+            with np.errstate(divide='ignore', invalid='ignore'):
+                me *= np.where(current > 0, target / current, 0)
+        if error < tol:
+            break
+
+    return me + fixed
+
+
 class BaseDistOptimizer(BaseOptimizer):
     """
     Calculate an optimized distribution consistent with the given marginal constraints.
@@ -105,7 +200,8 @@ class BaseDistOptimizer(BaseOptimizer):
                                                 }
                                     }
 
-    def optimize(self, x0=None, niter=None, maxiter=None, polish=1e-8, callback=False):
+    def optimize(self, x0=None, niter=None, maxiter=None, polish=1e-8, callback=False,
+                 n_jobs=None, executor=None):
         """
         Optimize this distribution w.r.t the objective.
 
@@ -124,6 +220,12 @@ class BaseDistOptimizer(BaseOptimizer):
             Whether to use a callback to track the performance of the optimization.
             Generally, this should be False as it adds some significant time to the
             optimization.
+        n_jobs : int, None
+            The number of workers for the random restarts. See
+            :meth:`BaseOptimizer.optimize`.
+        executor : str, Executor, None
+            How to run the random restarts in parallel. See
+            :meth:`BaseOptimizer.optimize`.
 
         Returns
         -------
@@ -141,7 +243,9 @@ class BaseDistOptimizer(BaseOptimizer):
                                                              niter=niter,
                                                              maxiter=maxiter,
                                                              polish=polish,
-                                                             callback=callback)
+                                                             callback=callback,
+                                                             n_jobs=n_jobs,
+                                                             executor=executor)
             return result
 
     def construct_vector(self, x):
@@ -180,6 +284,26 @@ class BaseDistOptimizer(BaseOptimizer):
         pmf = vec.reshape(self._shape)
         return pmf
 
+    def _backprop_joint(self, x, grad):
+        """
+        Pull a gradient with respect to the joint distribution back through
+        `construct_joint` to the optimization vector.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            An optimization vector.
+        grad : np.ndarray
+            The gradient of some function with respect to the joint
+            distribution, ``construct_joint(x)``.
+
+        Returns
+        -------
+        jac : np.ndarray
+            The gradient of that function with respect to `x`.
+        """
+        return np.ravel(grad)[self._free]
+
     def constraint_match_marginals(self, x):
         """
         Ensure that the joint distribution represented by the optimization
@@ -196,7 +320,7 @@ class BaseDistOptimizer(BaseOptimizer):
             The deviation from the constraint.
         """
         pmf = self.construct_vector(x)
-        return sum((np.dot(self._A, pmf) - self._b)**2)
+        return sum((self._A.dot(pmf) - self._b)**2)
 
     def construct_dist(self, x=None, cutoff=1e-6, sparse=True):
         """
@@ -240,6 +364,83 @@ class MaxEntOptimizer(BaseDistOptimizer, BaseConvexOptimizer):
     Compute maximum entropy distributions.
     """
 
+    def __init__(self, dist, marginals, rv_mode=None):
+        """
+        Initialize the optimizer.
+
+        Parameters
+        ----------
+        dist : Distribution
+            The distribution whose marginals should be matched.
+        marginals : list, None
+            The list of sets of variables whose marginals will be constrained to
+            match the given distribution.
+        rv_mode : str, None
+            Specifies how to interpret `rvs` and `crvs`. Valid options are:
+            {'indices', 'names'}. If equal to 'indices', then the elements of
+            `crvs` and `rvs` are interpreted as random variable indices. If
+            equal to 'names', the the elements are interpreted as random
+            variable names. If `None`, then the value of `dist._rv_mode` is
+            consulted, which defaults to 'indices'.
+        """
+        super(MaxEntOptimizer, self).__init__(dist, marginals, rv_mode=rv_mode)
+        self._marginals = [parse_rvs(self.dist, rvs, rv_mode=rv_mode)[1]
+                           for rvs in marginals]
+
+    def optimize(self, x0=None, niter=None, maxiter=None, polish=1e-8, callback=False,
+                 n_jobs=None, executor=None, method=None):
+        """
+        Find the maximum entropy distribution.
+
+        Parameters
+        ----------
+        x0 : np.ndarray
+            An initial optimization vector. Only used when `method` is 'sp'.
+        niter : int
+            The number of optimization iterations to perform.
+        maxiter : int
+            The number of steps for an optimization subroutine to perform, or
+            the number of sweeps through the marginals when `method` is 'ipf'.
+        polish : float
+            The threshold for valid optimization elements. If 0, no polishing is
+            performed.
+        callback : bool
+            Whether to use a callback to track the performance of the optimization.
+        n_jobs : int, None
+            The number of workers for the random restarts. See
+            :meth:`BaseOptimizer.optimize`.
+        executor : str, Executor, None
+            How to run the random restarts in parallel. See
+            :meth:`BaseOptimizer.optimize`.
+        method : {'ipf', 'sp', None}
+            The method to utilize. If 'ipf', use iterative proportional
+            fitting on the joint pmf; if 'sp', utilize scipy.optimize over the
+            free entries of the pmf. Defaults to None, in which case 'ipf' is
+            used.
+
+        Returns
+        -------
+        result : OptimizeResult, None
+            Return the optimization result, or None if scipy.optimize was not
+            used.
+        """
+        if method is None:
+            method = 'ipf'
+
+        if method == 'sp':
+            return super(MaxEntOptimizer, self).optimize(x0=x0,
+                                                         niter=niter,
+                                                         maxiter=maxiter,
+                                                         polish=polish,
+                                                         callback=callback,
+                                                         n_jobs=n_jobs,
+                                                         executor=executor)
+        elif method != 'ipf':
+            raise ditException("`method` must be one of 'ipf', 'sp', or None.")
+
+        pmf = _ipf(self.dist.pmf.reshape(self._shape), self._marginals, maxiter=maxiter)
+        self._optima = pmf.ravel()[self._free]
+
     def _objective(self):
         """
         Compute the negative entropy.
@@ -268,7 +469,7 @@ class MaxEntOptimizer(BaseDistOptimizer, BaseConvexOptimizer):
             pmf = self.construct_joint(x)
             return -entropy(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, entropy.gradient, sign=-1)
 
 
 class MinEntOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer):
@@ -304,7 +505,7 @@ class MinEntOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer):
             pmf = self.construct_joint(x)
             return entropy(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, entropy.gradient)
 
 
 class MaxCoInfoOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer):
@@ -340,7 +541,7 @@ class MaxCoInfoOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer):
             pmf = self.construct_joint(x)
             return -coinformation(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, coinformation.gradient, sign=-1)
 
 
 class MinCoInfoOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer):
@@ -376,7 +577,7 @@ class MinCoInfoOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer):
             pmf = self.construct_joint(x)
             return coinformation(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, coinformation.gradient)
 
 
 class MaxDualTotalCorrelationOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer):
@@ -412,7 +613,7 @@ class MaxDualTotalCorrelationOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer
             pmf = self.construct_joint(x)
             return -dual_total_correlation(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, dual_total_correlation.gradient, sign=-1)
 
 
 class MinDualTotalCorrelationOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer):
@@ -448,7 +649,7 @@ class MinDualTotalCorrelationOptimizer(BaseDistOptimizer, BaseNonConvexOptimizer
             pmf = self.construct_joint(x)
             return dual_total_correlation(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, dual_total_correlation.gradient)
 
 
 class BROJABivariateOptimizer(MaxCoInfoOptimizer):
@@ -492,7 +693,8 @@ class BROJABivariateOptimizer(MaxCoInfoOptimizer):
         self._optvec_size = len(self._free)
 
 
-def maxent_dist(dist, rvs, x0=None, maxiter=1000, sparse=True, rv_mode=None):
+def maxent_dist(dist, rvs, x0=None, maxiter=1000, sparse=True, rv_mode=None,
+                method=None):
     """
     Return the maximum entropy distribution consistent with the marginals from
     `dist` specified in `rvs`.
@@ -504,7 +706,7 @@ def maxent_dist(dist, rvs, x0=None, maxiter=1000, sparse=True, rv_mode=None):
     rvs : list of lists
         The marginals from `dist` to constrain.
     x0 : np.ndarray
-        Initial condition for the optimizer.
+        Initial condition for the optimizer. Only used when `method` is 'sp'.
     maxiter : int
         The number of optimization iterations to perform.
     sparse : bool
@@ -516,14 +718,35 @@ def maxent_dist(dist, rvs, x0=None, maxiter=1000, sparse=True, rv_mode=None):
         equal to 'names', the the elements are interpreted as random
         variable names. If `None`, then the value of `dist._rv_mode` is
         consulted, which defaults to 'indices'.
+    method : {'ipf', 'sp', None}
+        The method to utilize. If 'ipf', use iterative proportional fitting
+        on the joint pmf; if 'sp', utilize scipy.optimize over the free
+        entries of the pmf. Defaults to None, in which case 'ipf' is used.
 
     Returns
     -------
     me : Distribution
         The maximum entropy distribution.
     """
+    if method in [None, 'ipf']:
+        # Fitting needs only the joint pmf, so skip building the optimizer's
+        # constraint matrix, which grows with the size of the sample space.
+        dist = prepare_dist(dist)
+        shape = list(map(len, dist.alphabet))
+        marginals = [parse_rvs(dist, rv, rv_mode=rv_mode)[1] for rv in rvs]
+        pmf = _ipf(dist.pmf.reshape(shape), marginals, maxiter=maxiter).ravel()
+
+        pmf[pmf < 1e-6] = 0
+        pmf /= pmf.sum()
+
+        me = dist.copy()
+        me.pmf = pmf
+        if sparse:
+            me.make_sparse()
+        return me
+
     meo = MaxEntOptimizer(dist, rvs, rv_mode)
-    meo.optimize(x0=x0, maxiter=maxiter)
+    meo.optimize(x0=x0, maxiter=maxiter, method=method)
     dist = meo.construct_dist(sparse=sparse)
     return dist
 
@@ -46,16 +46,31 @@ If the behavior of [1] is desired, one must make sure to prune the sample space
 of any outcomes that have zero probability. Then, the implementation here will
 give the same results as [1].
 
+Partitions
+----------
+A sigma-algebra on a finite sample space is determined by its atoms, which
+partition the sample space, but it has 2^k elements when there are k atoms.
+The meet, join and their insertion into distributions are therefore computed
+directly on partitions, represented internally as an array assigning a block
+label to each outcome: the join is the common refinement of the labelings,
+and the meet is the finest common coarsening, found as the connected
+components of outcomes sharing a label in any of the labelings. The
+sigma-algebras themselves are only generated when explicitly requested.
+
 [1] "Intersection Information based on Common Randomness"
     http://arxiv.org/abs/1310.1538
 
 """
 from collections import defaultdict
 
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
 from six.moves import map, range, zip # pylint: disable=redefined-builtin
 
 import dit
-from ..helpers import parse_rvs, RV_MODES
+from ..helpers import parse_rvs
 from ..math import sigma_algebra, atom_set
 from ..utils import quasilexico_key
 
@@ -69,6 +84,224 @@ def sigma_algebra_sort(sigalg):
     return sigalg
 
 
+def _induced_labels(outcomes, indexes):
+    """
+    Label each outcome by its projection onto `indexes`.
+
+    Parameters
+    ----------
+    outcomes : list
+        The outcomes to label.
+    indexes : list
+        The indexes of the random variable.
+
+    Returns
+    -------
+    labels : np.ndarray
+        The block of each outcome, labeled 0, 1, ... in order of appearance.
+
+    """
+    index = {}
+    labels = [index.setdefault(tuple(outcome[i] for i in indexes), len(index))
+              for outcome in outcomes]
+    return np.array(labels, dtype=int)
+
+
+def _join_labels(labels):
+    """
+    Label each outcome by its block in the common refinement of `labels`.
+
+    Parameters
+    ----------
+    labels : list of np.ndarray
+        The labelings to join.
+
+    Returns
+    -------
+    joined : np.ndarray
+        The labeling of the join.
+
+    """
+    labels = np.column_stack(labels)
+    return np.unique(labels, axis=0, return_inverse=True)[1]
+
+
+def _meet_labels(labels):
+    """
+    Label each outcome by its block in the finest common coarsening of
+    `labels`.
+
+    Two outcomes lie in the same block of the meet if they are connected by a
+    chain of outcomes, each sharing a block with the next in one of the
+    labelings. Each outcome is linked to the first outcome of each of its
+    blocks, and the blocks are the connected components of those links.
+
+    Parameters
+    ----------
+    labels : list of np.ndarray
+        The labelings to meet. Each must use the labels 0, 1, ..., m-1.
+
+    Returns
+    -------
+    met : np.ndarray
+        The labeling of the meet.
+
+    """
+    n = len(labels[0])
+    nodes = np.arange(n)
+    heads = [np.unique(label, return_index=True)[1][label] for label in labels]
+    rows = np.concatenate([nodes] * len(heads))
+    cols = np.concatenate(heads)
+    links = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+    return connected_components(links, directed=False)[1]
+
+
+def _partition(outcomes, labels):
+    """
+    Collect outcomes into the blocks of a labeling.
+
+    Parameters
+    ----------
+    outcomes : list
+        The outcomes which were labeled.
+    labels : np.ndarray
+        The block of each outcome.
+
+    Returns
+    -------
+    partition : frozenset of frozensets
+        The blocks of the partition.
+
+    """
+    blocks = defaultdict(list)
+    for outcome, label in zip(outcomes, labels):
+        blocks[label].append(outcome)
+    return frozenset(map(frozenset, blocks.values()))
+
+
+def _rv_labels(dist, rvs, rv_mode=None):
+    """
+    Label the sample space of `dist` by each of the random variables `rvs`.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution which defines the sample space.
+    rvs : list
+        A list of lists, each specifying a random variable.
+    rv_mode : str, None
+        Specifies how to interpret the elements of `rvs`.
+
+    Returns
+    -------
+    outcomes : list
+        The outcomes of the sample space.
+    labels : list of np.ndarray
+        The labeling induced by each random variable.
+
+    """
+    # We require unique indexes within each random variable and want the
+    # indexes in distribution order. We don't need the names.
+    parse = lambda rv: parse_rvs(dist, rv, rv_mode=rv_mode,
+                                 unique=False, sort=True)[1]
+    indexes = [parse(rv) for rv in rvs]
+
+    # We need to iterate over all atoms, not just those in pmf since
+    # we are trying to partition the sample space.
+    outcomes = [outcome for outcome, _ in dist.zipped(mode='atoms')]
+    labels = [_induced_labels(outcomes, idx) for idx in indexes]
+    return outcomes, labels
+
+
+def induced_partition(dist, rvs, rv_mode=None):
+    """
+    Returns the partition of the sample space induced by the random variable
+    defined by `rvs`. These are the atoms of its induced sigma-algebra.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution which defines the base sigma-algebra.
+    rvs : list
+        The indexes of the random variable used to calculate the induced
+        partition.
+    rv_mode : str, None
+        Specifies how to interpret the elements of `rvs`. Valid options are:
+        {'indices', 'names'}. If equal to 'indices', then the elements of
+        `rvs` are interpreted as random variable indices. If equal to 'names',
+        the the elements are interpreted as random variable names. If `None`,
+        then the value of `dist._rv_mode` is consulted.
+
+    Returns
+    -------
+    P : frozenset of frozensets
+        The induced partition.
+
+    """
+    outcomes, labels = _rv_labels(dist, [rvs], rv_mode=rv_mode)
+    return _partition(outcomes, labels[0])
+
+
+def join_partition(dist, rvs, rv_mode=None):
+    """
+    Returns the partition of the join of random variables defined by `rvs`.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution which defines the base sigma-algebra.
+    rvs : list
+        A list of lists.  Each list specifies a random variable to be
+        joined with the other lists.  Each random variable can defined as a
+        series of unique indexes.  Multiple random variables can use the same
+        index. For example, [[0,1],[1,2]].
+    rv_mode : str, None
+        Specifies how to interpret the elements of `rvs`. Valid options are:
+        {'indices', 'names'}. If equal to 'indices', then the elements of
+        `rvs` are interpreted as random variable indices. If equal to 'names',
+        the the elements are interpreted as random variable names. If `None`,
+        then the value of `dist._rv_mode` is consulted.
+
+    Returns
+    -------
+    jp : frozenset of frozensets
+        The partition of the join.
+
+    """
+    outcomes, labels = _rv_labels(dist, rvs, rv_mode=rv_mode)
+    return _partition(outcomes, _join_labels(labels))
+
+
+def meet_partition(dist, rvs, rv_mode=None):
+    """
+    Returns the partition of the meet of random variables defined by `rvs`.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution which defines the base sigma-algebra.
+    rvs : list
+        A list of lists.  Each list specifies a random variable to be
+        met with the other lists.  Each random variable can defined as a
+        series of unique indexes.  Multiple random variables can use the same
+        index. For example, [[0,1],[1,2]].
+    rv_mode : str, None
+        Specifies how to interpret the elements of `rvs`. Valid options are:
+        {'indices', 'names'}. If equal to 'indices', then the elements of
+        `rvs` are interpreted as random variable indices. If equal to 'names',
+        the the elements are interpreted as random variable names. If `None`,
+        then the value of `dist._rv_mode` is consulted.
+
+    Returns
+    -------
+    mp : frozenset of frozensets
+        The partition of the meet.
+
+    """
+    outcomes, labels = _rv_labels(dist, rvs, rv_mode=rv_mode)
+    return _partition(outcomes, _meet_labels(labels))
+
+
 def induced_sigalg(dist, rvs, rv_mode=None):
     """
     Returns the induced sigma-algebra of the random variable defined by `rvs`.
@@ -93,32 +326,7 @@ def induced_sigalg(dist, rvs, rv_mode=None):
         The induced sigma-algebra.
 
     """
-    # This is brute force and ugly.
-    #
-    # Implementation:
-    #   1) Find induced atoms from atoms of new sigma-algebra:
-    #           X^{-1}(A) = { w : X(w) \in A }
-    #       where A = \{a\} and a is a nonzero outcome in the marginal.
-    #   2) Generate sigma algebra from induced atoms.
-    #
-    # Step 2 may not be necessary.
-    #
-    indexes = parse_rvs(dist, rvs, rv_mode=rv_mode, unique=True, sort=True)[1]
-
-    # This creates a mapping from new outcomes (defined by rvs) to the
-    # original outcomes which map to those new outcomes. This defines a
-    # partition of the original outcomes.
-    d = defaultdict(list)
-    ctor = dist._outcome_ctor
-    for outcome, _ in dist.zipped(mode='atoms'):
-        # Build a list of inner outcomes. "c" stands for "constructed".
-        # We need to iterate over all atoms, not just those in pmf since
-        # we are trying to partition the sample space.
-        c_outcome = ctor([outcome[i] for i in indexes])
-        d[c_outcome].append(outcome)
-
-    atoms = frozenset(map(frozenset, d.values()))
-    F = sigma_algebra(atoms)
+    F = sigma_algebra(induced_partition(dist, rvs, rv_mode=rv_mode))
     return F
 
 
@@ -148,19 +356,8 @@ def join_sigalg(dist, rvs, rv_mode=None):
         The induced sigma-algebra of the join.
 
     """
-    # We require unique indexes within each random variable and want the
-    # indexes in distribution order. We don't need the names.
-    parse = lambda rv: parse_rvs(dist, rv, rv_mode=rv_mode,
-                                 unique=False, sort=True)[1]
-    indexes = [parse(rv) for rv in rvs]
-
-    sigalgs = [induced_sigalg(dist, rv, rv_mode=RV_MODES.INDICES)
-               for rv in indexes]
-
-    # \sigma( X join Y ) = \sigma( \sigma(X) \cup \sigma(Y) )
-    # Union all the sigma algebras.
-    union_sa = frozenset().union(*sigalgs)
-    jsa = sigma_algebra(union_sa)
+    # \sigma( X join Y ) is generated by the common refinement of the atoms.
+    jsa = sigma_algebra(join_partition(dist, rvs, rv_mode=rv_mode))
     return jsa
 
 
@@ -190,48 +387,36 @@ def meet_sigalg(dist, rvs, rv_mode=None):
         The induced sigma-algebra of the meet.
 
     """
-    # We require unique indexes within each random variable and want the
-    # indexes in distribution order. We don't need the names.
-    parse = lambda rv: parse_rvs(dist, rv, rv_mode=rv_mode,
-                                           unique=False, sort=True)[1]
-    indexes = [parse(rv) for rv in rvs]
-
-    sigalgs = [induced_sigalg(dist, rv, rv_mode=RV_MODES.INDICES)
-               for rv in indexes]
-
-    # \sigma( X meet Y ) = \sigma(X) \cap \sigma(Y) )
-    # Intersect all the sigma algebras.
-    first_sa = sigalgs[0]
-    msa = first_sa.intersection(*sigalgs[1:])
+    # \sigma( X meet Y ) = \sigma(X) \cap \sigma(Y), which is generated by
+    # the finest common coarsening of the atoms.
+    msa = sigma_algebra(meet_partition(dist, rvs, rv_mode=rv_mode))
     return msa
 
 
-def dist_from_induced_sigalg(dist, sigalg, int_outcomes=True):
+def dist_from_partition(dist, partition, int_outcomes=True):
     """
-    Returns the distribution associated with an induced sigma algebra.
-
-    The sigma algebra is induced by a random variable from a probability
-    space defined by `dist`.
+    Returns the distribution associated with a partition of the sample space.
 
     Parameters
     ----------
     dist : Distribution
         The distribution which defines the base sigma-algebra.
-    sigalg : frozenset
-        A sigma-algebra induced by a random variable from `dist`.
+    partition : frozenset
+        A partition of the sample space of `dist`, such as one induced by a
+        random variable from `dist`.
     int_outcomes : bool
         If `True`, then the outcomes of the induced distribution are relabeled
-        as integers instead of the atoms of the induced sigma-algebra.
+        as integers instead of the blocks of the partition.
 
     Returns
     -------
     d : ScalarDistribution
-        The distribution of the induced sigma algebra.
+        The distribution of the partition.
 
     """
     from dit import ScalarDistribution
 
-    atoms = atom_set(sigalg)
+    atoms = partition
     if int_outcomes:
         atoms = [sorted(atom) for atom in atoms]
         atoms.sort(key=quasilexico_key)
@@ -247,6 +432,32 @@ def dist_from_induced_sigalg(dist, sigalg, int_outcomes=True):
     return d
 
 
+def dist_from_induced_sigalg(dist, sigalg, int_outcomes=True):
+    """
+    Returns the distribution associated with an induced sigma algebra.
+
+    The sigma algebra is induced by a random variable from a probability
+    space defined by `dist`.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution which defines the base sigma-algebra.
+    sigalg : frozenset
+        A sigma-algebra induced by a random variable from `dist`.
+    int_outcomes : bool
+        If `True`, then the outcomes of the induced distribution are relabeled
+        as integers instead of the atoms of the induced sigma-algebra.
+
+    Returns
+    -------
+    d : ScalarDistribution
+        The distribution of the induced sigma algebra.
+
+    """
+    return dist_from_partition(dist, atom_set(sigalg), int_outcomes)
+
+
 def join(dist, rvs, rv_mode=None, int_outcomes=True):
     """
     Returns the distribution of the join of random variables defined by `rvs`.
@@ -276,8 +487,8 @@ def join(dist, rvs, rv_mode=None, int_outcomes=True):
         The distribution of the join.
 
     """
-    join_sa = join_sigalg(dist, rvs, rv_mode)
-    d = dist_from_induced_sigalg(dist, join_sa, int_outcomes)
+    join_p = join_partition(dist, rvs, rv_mode)
+    d = dist_from_partition(dist, join_p, int_outcomes)
     return d
 
 
@@ -310,8 +521,8 @@ def meet(dist, rvs, rv_mode=None, int_outcomes=True):
         The distribution of the meet.
 
     """
-    meet_sa = meet_sigalg(dist, rvs, rv_mode)
-    d = dist_from_induced_sigalg(dist, meet_sa, int_outcomes)
+    meet_p = meet_partition(dist, rvs, rv_mode)
+    d = dist_from_partition(dist, meet_p, int_outcomes)
     return d
 
 
@@ -336,6 +547,32 @@ def insert_rv(dist, idx, sigalg):
     d : Distribution
         The new distribution.
 
+    """
+    return insert_partition(dist, idx, atom_set(sigalg))
+
+
+def insert_partition(dist, idx, partition):
+    """
+    Returns a new distribution with a random variable inserted at index `idx`.
+
+    The random variable is constructed according to the partition of the
+    sample space it induces.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution which defines the base sigma-algebra.
+    idx : int
+        The index at which to insert the random variable. To append, set `idx`
+        to be equal to -1 or dist.outcome_length().
+    partition : frozenset
+        The partition induced by the random variable.
+
+    Returns
+    -------
+    d : Distribution
+        The new distribution.
+
     """
     from itertools import chain
 
@@ -346,8 +583,7 @@ def insert_rv(dist, idx, sigalg):
         raise IndexError('Invalid insertion index.')
 
     # Provide sane sorting of atoms
-    atoms = atom_set(sigalg)
-    atoms = [sorted(atom) for atom in atoms]
+    atoms = [sorted(atom) for atom in partition]
     atoms.sort(key=quasilexico_key)
     labels = range(len(atoms))
     if dist._outcome_class == str:
@@ -412,8 +648,8 @@ def insert_join(dist, idx, rvs, rv_mode=None):
         The new distribution with the join at index `idx`.
 
     """
-    jsa = join_sigalg(dist, rvs, rv_mode)
-    d = insert_rv(dist, idx, jsa)
+    jp = join_partition(dist, rvs, rv_mode)
+    d = insert_partition(dist, idx, jp)
     return d
 
 
@@ -449,6 +685,6 @@ def insert_meet(dist, idx, rvs, rv_mode=None):
         The new distribution with the meet at index `idx`.
 
     """
-    msa = meet_sigalg(dist, rvs, rv_mode)
-    d = insert_rv(dist, idx, msa)
+    mp = meet_partition(dist, rvs, rv_mode)
+    d = insert_partition(dist, idx, mp)
     return d
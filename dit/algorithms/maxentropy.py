@@ -28,13 +28,14 @@ from debtcollector import removals
 import itertools
 
 import numpy as np
+from scipy.sparse import csr_matrix, diags
 
 import dit
 
 from dit.abstractdist import AbstractDenseDistribution, get_abstract_dist
 
 from ..helpers import RV_MODES, parse_rvs
-from .optutil import as_full_rank, CVXOPT_Template, prepare_dist, Bunch
+from .optutil import as_full_rank, CVXOPT_Template, prepare_dist, Bunch, _as_cvxopt
 from ..utils import flatten
 # from ..utils import powerset
 
@@ -135,7 +136,9 @@ def marginal_constraints_generic(dist, rvs, rv_mode=None,
     """
     Returns `A` and `b` in `A x = b`, for a system of marginal constraints.
 
-    In general, the resulting matrix `A` will not have full rank.
+    In general, the resulting matrix `A` will not have full rank. Since each
+    row of `A` has a nonzero element only for the outcomes contributing to
+    one marginal probability, it is returned as a sparse matrix.
 
     Parameters
     ----------
@@ -156,6 +159,15 @@ def marginal_constraints_generic(dist, rvs, rv_mode=None,
         'names', the the elements are interpreted as random variable names.
         If `None`, then the value of `dist._rv_mode` is consulted.
 
+    Returns
+    -------
+    A : scipy.sparse.csr_matrix, shape (p, q)
+        The matrix defining the marginal equality constraints and, optionally,
+        the normalization constraint.
+
+    b : array-like, (p,)
+        The RHS of the linear equality constraints.
+
     """
     assert dist.is_dense()
     assert dist.get_base() == 'linear'
@@ -171,24 +183,26 @@ def marginal_constraints_generic(dist, rvs, rv_mode=None,
 
     d = get_abstract_dist(dist)
 
-    A = []
+    # The column indices of the nonzero elements of each row.
+    cols = []
     b = []
 
     # Begin with the normalization constraint.
     if with_normalization:
-        A.append(np.ones(d.n_elements))
+        cols.append(np.arange(d.n_elements))
         b.append(1)
 
     # Now add all the marginal constraints.
     cache = {}
     for rvec in indexes:
         for idx in d.parameter_array(rvec, cache=cache):
-            bvec = np.zeros(d.n_elements)
-            bvec[idx] = 1
-            A.append(bvec)
+            cols.append(np.asarray(idx, dtype=int))
             b.append(pmf[idx].sum())
 
-    A = np.asarray(A, dtype=float)
+    indptr = np.cumsum([0] + [len(col) for col in cols])
+    indices = np.concatenate(cols) if cols else np.array([], dtype=int)
+    A = csr_matrix((np.ones(len(indices)), indices, indptr),
+                   shape=(len(cols), d.n_elements))
     b = np.asarray(b, dtype=float)
 
     return A, b
@@ -215,7 +229,7 @@ def marginal_constraints(dist, m, with_normalization=True):
 
     Returns
     -------
-    A : array-like, shape (p, q)
+    A : scipy.sparse.csr_matrix, shape (p, q)
         The matrix defining the marginal equality constraints and also the
         normalization constraint. The number of rows is:
             p = C(n_variables, m) * n_symbols ** m + 1
@@ -494,7 +508,7 @@ class MarginalMaximumEntropy(MaximumEntropy):
         if rank > Asmall.shape[1]:
             raise ValueError('More independent constraints than free parameters.')
 
-        Asmall = matrix(Asmall)
+        Asmall = _as_cvxopt(Asmall)
         b = matrix(b)  # now a column vector
 
         self.A = Asmall
@@ -526,7 +540,7 @@ class MarginalMaximumEntropy(MaximumEntropy):
             bad_x = xarr <= 0
             diag = 1 / xarr / ln2
             diag[bad_x] = 0
-            return np.diag(diag)
+            return diags(diag)
 
         self.gradient = gradient
         self.hessian = hessian
@@ -22,7 +22,7 @@ from dit.utils import basic_logger
 
 from .frankwolfe import frank_wolfe
 
-from .optutil import as_full_rank, prepare_dist, op_runner
+from .optutil import as_full_rank, prepare_dist, op_runner, _as_cvxopt
 from .maxentropy import (
     marginal_constraints, marginal_constraints_generic, isolate_zeros_generic
 )
@@ -54,7 +54,7 @@ def initial_point_generic(dist, rvs, A=None, b=None, isolated=None, **kwargs):
         # Also make it full rank.
         Asmall = A[:, variables.nonzero] # pylint: disable=no-member
         Asmall, b, _ = as_full_rank(Asmall, b)
-        Asmall = matrix(Asmall)
+        Asmall = _as_cvxopt(Asmall)
         b = matrix(b)
     else:
         # Assume they are already CVXOPT matrices
@@ -143,7 +143,7 @@ def check_feasibility(dist, k, **kwargs):
     from cvxopt.modeling import variable
 
     A, b = marginal_constraints(dist, k)
-    A = matrix(A)
+    A = _as_cvxopt(A)
     b = matrix(b)
 
     n = len(dist.pmf)
@@ -192,7 +192,7 @@ def marginal_maxent_generic(dist, rvs, **kwargs):
     variables = isolate_zeros_generic(dist, rvs)
     Asmall = A[:, variables.nonzero] # pylint: disable=no-member
     Asmall, b, rank = as_full_rank(Asmall, b)
-    Asmall = matrix(Asmall)
+    Asmall = _as_cvxopt(Asmall)
     b = matrix(b)
 
     # Set cvx info level based on logging.INFO level.
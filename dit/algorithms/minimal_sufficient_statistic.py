@@ -5,39 +5,116 @@ Functions for computing minimal sufficient statistics.
 
 from collections import defaultdict
 
-from .lattice import dist_from_induced_sigalg, insert_join, insert_rv
+import numpy as np
+
+from .lattice import dist_from_partition, insert_join, insert_partition
 from .prune_expand import pruned_samplespace
-from ..helpers import flatten, parse_rvs, normalize_rvs
+from ..helpers import (flatten, group_labels, parse_rvs, normalize_rvs,
+                       variable_labels)
 from ..math import sigma_algebra
+from ..params import ditParams
 from ..samplespace import CartesianProduct
 
 __all__ = ['info_trim',
            'insert_mss',
            'mss',
+           'mss_partition',
            'mss_sigalg',
           ]
 
 
-def partial_match(first, second, places):
+def mss_partition(dist, rvs, about=None, rv_mode=None):
     """
-    Returns whether `second` is a marginal outcome at `places` of `first`.
+    Construct the partition of the outcomes induced by the minimal sufficient
+    statistic of `rvs` about `about`. These are the atoms of `mss_sigalg`.
 
     Parameters
     ----------
-    first : iterable
-        The un-marginalized outcome.
-    second : iterable
-        The smaller, marginalized outcome.
-    places : list
-        The locations of `second` in `first`.
+    dist : Distribution
+        The distribution which defines the base sigma-algebra.
+    rvs : list
+        A list of random variables to be compressed into a minimal sufficient
+        statistic.
+    about : list
+        A list of random variables for which the minimal sufficient static will
+        retain all information about.
+    rv_mode : str, None
+        Specifies how to interpret the elements of `rvs`. Valid options are:
+        {'indices', 'names'}. If equal to 'indices', then the elements of
+        `rvs` are interpreted as random variable indices. If equal to 'names',
+        the the elements are interpreted as random variable names. If `None`,
+        then the value of `dist._rv_mode` is consulted.
 
     Returns
     -------
-    match : bool
-        Whether `first` and `second` match or not.
+    mss_p : frozenset of frozensets
+        The partition induced by the minimal sufficient statistic.
+
+    Examples
+    --------
+    >>> d = Xor()
+    >>> mss_partition(d, [0], [1, 2])
+    frozenset({frozenset({'000', '011'}), frozenset({'101', '110'})})
 
     """
-    return tuple([first[i] for i in places]) == tuple(second)
+    indexes = parse_rvs(dist, rvs, rv_mode=rv_mode)[1]
+    if about is None:
+        about = sorted(set(range(dist.outcome_length())) - set(indexes))
+    else:
+        about = parse_rvs(dist, about, rv_mode=rv_mode)[1]
+
+    pmf = dist.pmf
+    if dist.is_log():
+        pmf = dist.get_base(numerical=True)**pmf
+
+    labels = variable_labels(dist)
+    x = group_labels(labels[:, list(indexes)])
+    y = group_labels(labels[:, list(about)])
+
+    # The joint distribution of `rvs` and `about` as a matrix, whose rows
+    # are then the conditional distributions p(about | rvs = x).
+    joint = np.zeros((x.max() + 1, y.max() + 1))
+    np.add.at(joint, (x, y), pmf)
+    marginal = joint.sum(axis=1)
+    support = marginal > 0
+    conditional = joint[support] / marginal[support, np.newaxis]
+
+    # Equivalent conditional distributions are grouped by hashing their
+    # rows, after rounding them to the comparison tolerance.
+    rtol, atol = ditParams['rtol'], ditParams['atol']
+    rows = np.round(conditional / (atol + rtol)).astype(np.int64)
+    keys, first, buckets = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+
+    # Rows on either side of a rounding boundary fall in different buckets,
+    # so buckets whose first rows are approximately equal are then merged,
+    # in order of appearance, as is_approx_equal would merge them. Such
+    # buckets are neighbors, so only leaders whose keys begin within one of
+    # each other's are compared.
+    representatives = conditional[first]
+    merged = np.empty(len(first), dtype=int)
+    leaders = defaultdict(list)
+    for bucket in np.argsort(first):
+        start = keys[bucket, 0]
+        candidates = leaders[start - 1] + leaders[start] + leaders[start + 1]
+        close = np.isclose(representatives[candidates], representatives[bucket],
+                           rtol=rtol, atol=atol).all(axis=1)
+        if close.any():
+            merged[bucket] = min(np.compress(close, candidates), key=first.__getitem__)
+        else:
+            merged[bucket] = bucket
+            leaders[start].append(bucket)
+
+    classes = np.full(len(marginal), -1, dtype=int)
+    classes[support] = merged[buckets.ravel()]
+
+    # Outcomes of `rvs` with zero probability have no conditional
+    # distribution and are left out of the partition.
+    partition = defaultdict(list)
+    for o, label in zip(dist.outcomes, classes[x]):
+        if label >= 0:
+            partition[label].append(o)
+
+    return frozenset(map(frozenset, partition.values()))
 
 
 def mss_sigalg(dist, rvs, about=None, rv_mode=None):
@@ -77,22 +154,7 @@ def mss_sigalg(dist, rvs, about=None, rv_mode=None):
                frozenset({'000', '011', '101', '110'})})
 
     """
-    mapping = parse_rvs(dist, rvs, rv_mode=rv_mode)[1]
-
-    partition = defaultdict(list)
-
-    md, cds = dist.condition_on(rvs=about, crvs=rvs, rv_mode=rv_mode)
-
-    for marg, cd in zip(md.outcomes, cds):
-        matches = [o for o in dist.outcomes if partial_match(o, marg, mapping)]
-        for c in partition.keys():
-            if c.is_approx_equal(cd):
-                partition[c].extend(matches)
-                break
-        else:
-            partition[cd].extend(matches)
-
-    mss_sa = sigma_algebra(map(frozenset, partition.values()))
+    mss_sa = sigma_algebra(mss_partition(dist, rvs, about, rv_mode))
 
     return mss_sa
 
@@ -145,8 +207,8 @@ def insert_mss(dist, idx, rvs, about=None, rv_mode=None):
     1101   0.25
 
     """
-    mss_sa = mss_sigalg(dist, rvs, about, rv_mode)
-    new_dist = insert_rv(dist, idx, mss_sa)
+    mss_p = mss_partition(dist, rvs, about, rv_mode)
+    new_dist = insert_partition(dist, idx, mss_p)
     return pruned_samplespace(new_dist)
 
 
@@ -190,8 +252,8 @@ def mss(dist, rvs, about=None, rv_mode=None, int_outcomes=True):
     1   0.5
 
     """
-    mss_sa = mss_sigalg(dist, rvs, about, rv_mode)
-    d = dist_from_induced_sigalg(dist, mss_sa, int_outcomes)
+    mss_p = mss_partition(dist, rvs, about, rv_mode)
+    d = dist_from_partition(dist, mss_p, int_outcomes)
     return d
 
 
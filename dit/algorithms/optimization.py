@@ -36,6 +36,7 @@ from ..utils.optimization import (BasinHoppingCallBack,
                                   basinhop_status,
                                   colon,
                                   )
+from ..utils.parallel import map_in_pool
 
 __all__ = [
     'BaseOptimizer',
@@ -47,11 +48,42 @@ __all__ = [
 
 svdvals = lambda m: np.linalg.svd(m, compute_uv=False)
 
+
+# The smallest probability used when differentiating a logarithm. This matches
+# the step of a finite difference, and keeps the slope on the boundary of the
+# simplex from overwhelming the line searches.
+_TINY = 1e-8
+
+
+def _minimize_restart(objective, minimizer_kwargs, x0):
+    """
+    Perform a single restart of a shotgun optimization.
+
+    Parameters
+    ----------
+    objective : func
+        The objective to minimize.
+    minimizer_kwargs : dict
+        A dictionary of keyword arguments to pass to the optimizer.
+    x0 : np.ndarray
+        The initial optimization vector.
+
+    Returns
+    -------
+    result : OptimizeResult
+        The result of the optimization.
+    """
+    return minimize(fun=objective, x0=x0, **minimizer_kwargs)
+
+
 class BaseOptimizer(with_metaclass(ABCMeta, object)):
     """
     Base class for performing optimizations.
     """
 
+    _n_jobs = None
+    _executor = None
+
     def __init__(self, dist, rvs=None, crvs=None, rv_mode=None):
         """
         Initialize the optimizer.
@@ -187,6 +219,49 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
     ###########################################################################
     # Convenience functions for constructing objectives.
 
+    @staticmethod
+    def _attach_jacobian(objective, gradient, sign=1):
+        """
+        Give `objective` a jacobian, pulling the gradient of its measure with
+        respect to the joint distribution back to the optimization vector.
+
+        Parameters
+        ----------
+        objective : func
+            The objective, a function of the optimizer and an optimization
+            vector.
+        gradient : func
+            The gradient of the measure with respect to the joint
+            distribution, such as the `gradient` of the measures below.
+        sign : int
+            The sign with which the objective takes the measure.
+
+        Returns
+        -------
+        objective : func
+            `objective`, with its `jacobian` attached.
+        """
+        def jacobian(self, x):
+            """
+            Compute the gradient of the objective.
+
+            Parameters
+            ----------
+            x : np.ndarray
+                An optimization vector.
+
+            Returns
+            -------
+            jac : np.ndarray
+                The gradient of the objective.
+            """
+            pmf = self.construct_joint(x)
+            return sign * self._backprop_joint(x, gradient(pmf))
+
+        objective.jacobian = jacobian
+
+        return objective
+
     @staticmethod
     def _h(p):
         """
@@ -204,6 +279,25 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
         """
         return -np.nansum(p*np.log2(p))
 
+    @staticmethod
+    def _dh(p):
+        """
+        Compute the gradient of the entropy of the marginal `p` with respect to
+        the joint distribution it was summed from.
+
+        Parameters
+        ----------
+        p : np.ndarray
+            A marginal distribution, with the summed axes kept.
+
+        Returns
+        -------
+        dh : np.ndarray
+            The gradient, broadcastable against the joint distribution. Small
+            probabilities are floored so that the gradient remains moderate.
+        """
+        return -(np.log2(np.maximum(p, _TINY)) + 1/np.log(2))
+
     def _entropy(self, rvs, crvs=None):
         """
         Compute the conditional entropy, H[X|Y]
@@ -249,6 +343,29 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
 
             return ch
 
+        def entropy_gradient(pmf):
+            """
+            Compute the gradient of the specified entropy.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            pmf_joint = pmf.sum(axis=idx_joint, keepdims=True)
+            pmf_crvs = pmf_joint.sum(axis=idx_crvs, keepdims=True)
+
+            grad = self._dh(pmf_joint) - self._dh(pmf_crvs)
+
+            return np.broadcast_to(grad, pmf.shape)
+
+        entropy.gradient = entropy_gradient
+
         return entropy
 
     def _mutual_information(self, rv_x, rv_y):
@@ -293,6 +410,30 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
 
             return mi
 
+        def mutual_information_gradient(pmf):
+            """
+            Compute the gradient of the specified mutual information.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            pmf_xy = pmf.sum(axis=idx_xy, keepdims=True)
+            pmf_x = pmf_xy.sum(axis=idx_x, keepdims=True)
+            pmf_y = pmf_xy.sum(axis=idx_y, keepdims=True)
+
+            grad = self._dh(pmf_x) + self._dh(pmf_y) - self._dh(pmf_xy)
+
+            return np.broadcast_to(grad, pmf.shape)
+
+        mutual_information.gradient = mutual_information_gradient
+
         return mutual_information
 
     def _conditional_mutual_information(self, rv_x, rv_y, rv_z):
@@ -341,6 +482,31 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
 
             return cmi
 
+        def conditional_mutual_information_gradient(pmf):
+            """
+            Compute the gradient of the specified conditional mutual information.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            pmf_xyz = pmf.sum(axis=idx_xyz, keepdims=True)
+            pmf_xz = pmf_xyz.sum(axis=idx_xz, keepdims=True)
+            pmf_yz = pmf_xyz.sum(axis=idx_yz, keepdims=True)
+            pmf_z = pmf_xz.sum(axis=idx_z, keepdims=True)
+
+            grad = self._dh(pmf_xz) + self._dh(pmf_yz) - self._dh(pmf_z) - self._dh(pmf_xyz)
+
+            return np.broadcast_to(grad, pmf.shape)
+
+        conditional_mutual_information.gradient = conditional_mutual_information_gradient
+
         return conditional_mutual_information
 
     def _coinformation(self, rvs, crvs=None):
@@ -392,6 +558,31 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
 
             return ci
 
+        def coinformation_gradient(pmf):
+            """
+            Compute the gradient of the specified co-information.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            pmf_joint = pmf.sum(axis=idx_joint, keepdims=True)
+            pmf_crvs = pmf_joint.sum(axis=idx_crvs, keepdims=True)
+            pmf_subrvs = [pmf_joint.sum(axis=idx, keepdims=True) for idx in idx_subrvs] + [pmf_joint, pmf_crvs]
+
+            # The co-information is -sum(p * H[sub]) over the marginals.
+            grad = -sum(p * self._dh(marg) for marg, p in zip(pmf_subrvs, power))
+
+            return np.broadcast_to(grad, pmf.shape)
+
+        coinformation.gradient = coinformation_gradient
+
         return coinformation
 
     def _total_correlation(self, rvs, crvs=None):
@@ -443,6 +634,30 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
 
             return tc
 
+        def total_correlation_gradient(pmf):
+            """
+            Compute the gradient of the specified total correlation.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            pmf_joint = pmf.sum(axis=idx_joint, keepdims=True)
+            pmf_margs = [pmf_joint.sum(axis=marg, keepdims=True) for marg in idx_margs]
+            pmf_crvs = pmf_margs[0].sum(axis=idx_crvs, keepdims=True)
+
+            grad = sum(self._dh(p) for p in pmf_margs) - self._dh(pmf_joint) - n*self._dh(pmf_crvs)
+
+            return np.broadcast_to(grad, pmf.shape)
+
+        total_correlation.gradient = total_correlation_gradient
+
         return total_correlation
 
     def _dual_total_correlation(self, rvs, crvs=None):
@@ -494,6 +709,34 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
 
             return dtc
 
+        def dual_total_correlation_gradient(pmf):
+            """
+            Compute the gradient of the specified dual total correlation.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            pmf_joint = pmf.sum(axis=idx_joint, keepdims=True)
+            pmf_margs = [pmf_joint.sum(axis=marg, keepdims=True) for marg in idx_margs]
+            pmf_crvs = pmf_joint.sum(axis=idx_crvs, keepdims=True)
+
+            dh_crvs = self._dh(pmf_crvs)
+            dh_joint = self._dh(pmf_joint) - dh_crvs
+            dh_margs = [self._dh(marg) - dh_crvs for marg in pmf_margs]
+
+            grad = sum(dh_margs) - n*dh_joint
+
+            return np.broadcast_to(grad, pmf.shape)
+
+        dual_total_correlation.gradient = dual_total_correlation_gradient
+
         return dual_total_correlation
 
     def _caekl_mutual_information(self, rvs, crvs=None):
@@ -552,6 +795,41 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
 
             return caekl
 
+        def caekl_mutual_information_gradient(pmf):
+            """
+            Compute the gradient of the specified CAEKL mutual information,
+            that is, the gradient of the minimizing partition.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            pmf_joint = pmf.sum(axis=idx_joint, keepdims=True)
+            pmf_parts = {p: pmf_joint.sum(axis=idx, keepdims=True) for p, idx in idx_parts.items()}
+            pmf_crvs = pmf_joint.sum(axis=idx_crvs, keepdims=True)
+
+            h_crvs = self._h(pmf_crvs)
+            h_joint = self._h(pmf_joint) - h_crvs
+
+            pairs = list(zip(parts, part_norms))
+            candidates = [(sum(self._h(pmf_parts[p]) - h_crvs for p in part)-h_joint)/norm for part, norm in pairs]
+            part, norm = pairs[int(np.argmin(candidates))]
+
+            dh_crvs = self._dh(pmf_crvs)
+            dh_joint = self._dh(pmf_joint) - dh_crvs
+
+            grad = (sum(self._dh(pmf_parts[p]) - dh_crvs for p in part) - dh_joint)/norm
+
+            return np.broadcast_to(grad, pmf.shape)
+
+        caekl_mutual_information.gradient = caekl_mutual_information_gradient
+
         return caekl_mutual_information
 
     def _maximum_correlation(self, rv_x, rv_y):
@@ -700,7 +978,8 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
     ###########################################################################
     # Optimization methods.
 
-    def optimize(self, x0=None, niter=None, maxiter=None, polish=1e-6, callback=False):
+    def optimize(self, x0=None, niter=None, maxiter=None, polish=1e-6, callback=False,
+                 n_jobs=None, executor=None):
         """
         Perform the optimization.
 
@@ -719,16 +998,34 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
             Whether to use a callback to track the performance of the optimization.
             Generally, this should be False as it adds some significant time to the
             optimization.
+        n_jobs : int, None
+            The number of workers among which the random restarts of a shotgun
+            optimization are divided. If -1, use one worker per core. If None
+            and `executor` is None, the restarts are performed serially.
+        executor : str, Executor, None
+            How to run the random restarts in parallel. Either 'process' (the
+            default when `n_jobs` is given) or 'thread' to create a pool of
+            `n_jobs` workers, or a `concurrent.futures.Executor` to submit the
+            restarts to. A process-based executor must be able to pickle the
+            objective.
 
         Returns
         -------
         result : OptimizeResult
             The result of the optimization.
         """
+        self._n_jobs = n_jobs
+        self._executor = executor
+
         try:
             callable(self.objective)
         except AttributeError:
-            self.objective = MethodType(self._objective(), self)
+            objective = self._objective()
+            self.objective = MethodType(objective, self)
+            # Objectives may provide an analytic jacobian. Entropy slopes are
+            # floored at p = _TINY, so it is approximate near the boundary.
+            if hasattr(objective, 'jacobian') and not hasattr(self, '_jacobian'):
+                self._jacobian = MethodType(objective.jacobian, self)
 
         x0 = x0.copy() if x0 is not None else self.construct_initial()
 
@@ -793,33 +1090,31 @@ class BaseOptimizer(with_metaclass(ABCMeta, object)):
         result : OptimizeResult, None
             The result of the optimization. Returns None if the optimization failed.
 
+        Notes
+        -----
+        The initial conditions are all drawn up front, in order, so the result
+        does not depend on whether or how the restarts are run in parallel.
+
         TODO
         ----
          * Rather than random initial conditions, use latin hypercube sampling.
-         * Make parallel in some fashion (threads, processes).
         """
         if niter is None:
             niter = self._default_hops
 
-        results = []
+        ics = []
 
         if x0 is not None:
-            res = minimize(fun=self.objective,
-                           x0=x0,
-                           **minimizer_kwargs
-                           )
-            if res.success:
-                results.append(res)
+            ics.append(x0)
             niter -= 1
 
-        ics = (self.construct_random_initial() for _ in range(niter))
-        for initial in ics:
-            res = minimize(fun=self.objective,
-                           x0=initial,
-                           **minimizer_kwargs
-                           )
-            if res.success:
-                results.append(res)
+        ics.extend(self.construct_random_initial() for _ in range(niter))
+
+        results = map_in_pool(_minimize_restart, [(initial,) for initial in ics],
+                              n_jobs=self._n_jobs, executor=self._executor,
+                              shared=(self.objective, minimizer_kwargs))
+
+        results = [res for res in results if res.success]
 
         try:
             result = min(results, key=lambda r: self.objective(r.x))
@@ -1068,7 +1363,7 @@ class BaseAuxVarOptimizer(BaseNonConvexOptimizer):
 
         for part, auxvar in zip(parts, self._aux_vars):
             channel = part.reshape(auxvar.shape)
-            channel /= channel.sum(axis=(-1,), keepdims=True)
+            channel = channel / channel.sum(axis=(-1,), keepdims=True)
             channel[np.isnan(channel)] = auxvar.mask[np.isnan(channel)]
 
             yield channel
@@ -1114,13 +1409,57 @@ class BaseAuxVarOptimizer(BaseNonConvexOptimizer):
         """
         _, _, shape, mask, _ = self._aux_vars[0]
         channel = x.reshape(shape)
-        channel /= channel.sum(axis=-1, keepdims=True)
+        channel = channel / channel.sum(axis=-1, keepdims=True)
         channel[np.isnan(channel)] = mask[np.isnan(channel)]
 
         joint = self._pmf[..., np.newaxis] * channel[self._slices[0]]
 
         return joint
 
+    def _backprop_joint(self, x, grad):
+        """
+        Pull a gradient with respect to the joint distribution back through
+        `construct_joint` to the optimization vector.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            An optimization vector.
+        grad : np.ndarray
+            The gradient of some function with respect to the joint
+            distribution, ``construct_joint(x)``.
+
+        Returns
+        -------
+        jac : np.ndarray
+            The gradient of that function with respect to `x`.
+        """
+        x = np.asarray(x, dtype=float)
+        channels = list(self._construct_channels(x))
+
+        joints = [self._pmf]
+        for channel, slc in zip(channels[:-1], self._slices):
+            joints.append(joints[-1][..., np.newaxis] * channel[tuple(slc)])
+
+        # Reverse through the products with each channel.
+        grads = []
+        for joint, channel, slc in reversed(list(zip(joints, channels, self._slices))):
+            axes = tuple(i for i, s in enumerate(slc) if s is np.newaxis)
+            grads.append((grad * joint[..., np.newaxis]).sum(axis=axes))
+            grad = (grad * channel[tuple(slc)]).sum(axis=-1)
+        grads.reverse()
+
+        # Reverse through the normalization of each channel.
+        jac = []
+        for grad, channel, (a, b) in zip(grads, channels, self._parts):
+            total = x[a:b].reshape(channel.shape).sum(axis=-1, keepdims=True)
+            grad = grad - (grad * channel).sum(axis=-1, keepdims=True)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                grad = np.where(total > 0, grad / total, 0)
+            jac.append(grad.ravel())
+
+        return np.concatenate(jac, axis=0)
+
     def construct_full_joint(self, x):
         """
         Construct the joint distribution.
@@ -1388,6 +1727,23 @@ class BaseAuxVarOptimizer(BaseNonConvexOptimizer):
             ent = entropy(self.construct_joint(x))
             return sign * ent
 
+        def jacobian_entropy(x):
+            """
+            The gradient of the post-processed entropy.
+
+            Parameters
+            ----------
+            x : np.ndarray
+                An optimization vector.
+
+            Returns
+            -------
+            jac : np.ndarray
+                The gradient.
+            """
+            grad = entropy.gradient(self.construct_joint(x))
+            return sign * self._backprop_joint(x, grad)
+
         def objective_channelcapacity(x):
             """
             Post-process the channel capacity.
@@ -1447,8 +1803,17 @@ class BaseAuxVarOptimizer(BaseNonConvexOptimizer):
 
         self.__old_objective, self.objective = self.objective, objective
 
+        # the jacobian of the true objective does not apply.
+        old_jacobian = self.__dict__.pop('_jacobian', None)
+        if style == 'entropy':
+            self._jacobian = jacobian_entropy
+
         self.optimize(x0=self._optima.copy(), niter=niter, maxiter=maxiter)
 
+        self.__dict__.pop('_jacobian', None)
+        if old_jacobian is not None:
+            self._jacobian = old_jacobian
+
         # and remove them again.
         self.constraints = self.constraints[:-1]
         if not self.constraints:
@@ -7,6 +7,7 @@ from __future__ import division, print_function
 from debtcollector import removals
 
 import numpy as np
+from scipy.sparse import issparse
 import dit
 
 
@@ -37,16 +38,22 @@ def as_full_rank(A, b):
     take only the cols of U (which are rows in U^{-1}) and rows of \\Sigma that
     have nonzero singular values.
 
+    If A is a sparse matrix, then \\Sigma V^* would generally be dense. So we
+    instead keep a maximal set of linearly independent rows of A, found by a
+    rank-revealing (pivoted) QR decomposition of the (p, p) Gram matrix
+    A A^T. Then B is the sparse matrix of those rows, and c the corresponding
+    elements of b.
+
     Parameters
     ----------
-    A : array-like, shape (p, n)
+    A : array-like or sparse matrix, shape (p, n)
         The LHS for the linear constraints.
     b : array-like, shape (p,) or (p, 1)
         The RHS for the linear constraints.
 
     Returns
     -------
-    B : array-like, shape (q, n)
+    B : array-like or sparse matrix, shape (q, n)
         The LHS for the linear constraints.
     c : array-like, shape (q,) or (q, 1)
         The RHS for the linear constraints.
@@ -61,6 +68,9 @@ def as_full_rank(A, b):
 
     import scipy.linalg as splinalg
 
+    if issparse(A):
+        return _sparse_full_rank(A, b)
+
     A = np.atleast_2d(A)
     b = np.asarray(b)
 
@@ -77,6 +87,74 @@ def as_full_rank(A, b):
     return B, c, rank
 
 
+def _sparse_full_rank(A, b):
+    """
+    From a sparse linear system Ax = b, return the independent equations.
+
+    See :func:`as_full_rank`.
+
+    Parameters
+    ----------
+    A : sparse matrix, shape (p, n)
+        The LHS for the linear constraints.
+    b : array-like, shape (p,) or (p, 1)
+        The RHS for the linear constraints.
+
+    Returns
+    -------
+    B : scipy.sparse.csr_matrix, shape (q, n)
+        The LHS for the linear constraints.
+    c : array-like, shape (q,) or (q, 1)
+        The RHS for the linear constraints.
+    rank : int
+        The rank of B.
+
+    """
+    import scipy.linalg as splinalg
+
+    A = A.tocsr()
+    b = np.asarray(b)
+
+    if A.shape[0] == 0:
+        return A, b, 0
+
+    gram = A.dot(A.T).toarray()
+    R, piv = splinalg.qr(gram, mode='r', pivoting=True)
+
+    diag = np.abs(np.diag(R))
+    tol = diag.max() * max(A.shape) * np.finfo(diag.dtype).eps
+    rank = np.sum(diag > tol)
+
+    rows = np.sort(piv[:rank])
+
+    return A[rows], b[rows], rank
+
+
+def _as_cvxopt(A):
+    """
+    Convert `A` to a CVXOPT matrix, preserving its sparsity.
+
+    Parameters
+    ----------
+    A : array-like or sparse matrix
+        The matrix to convert.
+
+    Returns
+    -------
+    M : cvxopt.matrix or cvxopt.spmatrix
+        A sparse CVXOPT matrix if `A` is sparse, and a dense one otherwise.
+
+    """
+    from cvxopt import matrix, spmatrix
+
+    if issparse(A):
+        A = A.tocoo()
+        return spmatrix(A.data.tolist(), A.row.tolist(), A.col.tolist(),
+                        size=A.shape)
+    else:
+        return matrix(A)
+
+
 @removals.removed_class('CVXOPT_Template',
                         message="Please see methods in dit.algorithms.distribution_optimizers.py.",
                         version='1.0.1')
@@ -149,7 +227,7 @@ class CVXOPT_Template(object):
 
 
     def build_linear_inequality_constraints(self):
-        from cvxopt import matrix
+        from cvxopt import matrix, spmatrix
 
         # Dimension of optimization variable
         n = self.n
@@ -159,7 +237,7 @@ class CVXOPT_Template(object):
         # We have M = N = 0 (no 2nd order cones or positive semidefinite cones)
         # So, K = l where l is the dimension of the nonnegative orthant. Thus,
         # we have l = n.
-        G = matrix(-1 * np.eye(n))   # G should have shape: (K,n) = (n,n)
+        G = spmatrix(-1.0, range(n), range(n))   # G should have shape: (K,n) = (n,n)
         h = matrix(np.zeros((n,1)))  # h should have shape: (K,1) = (n,1)
 
         self.G = G
@@ -216,9 +294,9 @@ class CVXOPT_Template(object):
             if z is None:
                 return (f, Df)
             else:
-                # Hessian
+                # Hessian, which may be sparse (e.g. diagonal)
                 H = self.hessian(xarr)
-                H = matrix(H)
+                H = _as_cvxopt(H)
                 return (f, Df, z[0] * H)
 
         self.F = F
@@ -15,12 +15,13 @@ from collections import defaultdict
 import itertools
 
 import numpy as np
+from scipy.sparse import csr_matrix
 import dit
 
 from ..utils import basic_logger
 from ..abstractdist import get_abstract_dist
 from .frankwolfe import frank_wolfe
-from .optutil import CVXOPT_Template, as_full_rank, Bunch, op_runner
+from .optutil import CVXOPT_Template, as_full_rank, Bunch, op_runner, _as_cvxopt
 from ..exceptions import ditException
 
 __all__ = ['unique_informations', 'k_informations', 'k_synergy']
@@ -94,6 +95,8 @@ def marginal_constraints(dist, k, normalization=True, source_marginal=False): #
 
     For unique information, k=2 is used, but we allow more general constraints.
 
+    The constraint matrix `A` is returned as a sparse matrix.
+
     """
     assert dist.is_dense()
     assert dist.get_base() == 'linear'
@@ -107,12 +110,13 @@ def marginal_constraints(dist, k, normalization=True, source_marginal=False): #
     #
     # Linear equality constraints (these are not independent constraints)
     #
-    A = []
+    # The column indices of the nonzero elements of each row.
+    cols = []
     b = []
 
     # Normalization: \sum_i q_i = 1
     if normalization:
-        A.append(np.ones(n_elements))
+        cols.append(np.arange(n_elements))
         b.append(1)
 
     # Random variables
@@ -137,21 +141,19 @@ def marginal_constraints(dist, k, normalization=True, source_marginal=False): #
         marg_rvs = subrvs + target_rvs
         marray = d.parameter_array(marg_rvs, cache=cache)
         for idx in marray:
-            # Convert the sparse nonzero elements to a dense boolean array
-            bvec = np.zeros(n_elements)
-            bvec[idx] = 1
-            A.append(bvec)
+            cols.append(np.asarray(idx, dtype=int))
             b.append(pmf[idx].sum())
 
     if source_marginal:
         marray = d.parameter_array(source_rvs, cache=cache)
         for idx in marray:
-            bvec = np.zeros(n_elements)
-            bvec[idx] = 1
-            A.append(bvec)
+            cols.append(np.asarray(idx, dtype=int))
             b.append(pmf[idx].sum())
 
-    A = np.asarray(A, dtype=float)
+    indptr = np.cumsum([0] + [len(col) for col in cols])
+    indices = np.concatenate(cols) if cols else np.array([], dtype=int)
+    A = csr_matrix((np.ones(len(indices)), indices, indptr),
+                   shape=(len(cols), n_elements))
     b = np.asarray(b, dtype=float)
     return A, b
 
@@ -250,10 +252,9 @@ def extra_constraints(dist, k):
     # If there is no source rv because k=1, then nothing can be determined.
     if submarginal_size:
         for i, source_rv in enumerate(source_rvs):
-            md, cdists = dist.condition_on(target_rvs, rvs=[source_rv])
-            for target_outcome, cdist in zip(md.outcomes, cdists):
-                # cdist is dense
-                if np.isclose(cdist.pmf, 1).sum() == 1:
+            md, cdists = dist.condition_on(target_rvs, rvs=[source_rv], conditional=True)
+            for target_outcome, cpmf in zip(md.outcomes, cdists.to_array(base=None)):
+                if np.isclose(cpmf, 1).sum() == 1:
                     # Then p(source_rv | target_rvs) = 1
                     determined[target_outcome][i] = 1
 
@@ -315,7 +316,9 @@ def extra_constraints(dist, k):
     return variables
 
 
-@removals.remove(message="Please see dit.pid.PID_BROJA.", version='1.0.1')
+@removals.removed_class('MaximumConditionalEntropy',
+                        message="Please see dit.pid.PID_BROJA.",
+                        version='1.0.1')
 class MaximumConditionalEntropy(CVXOPT_Template):
     """
     An optimizer for the unique information.
@@ -484,7 +487,7 @@ class MaximumConditionalEntropy(CVXOPT_Template):
             Asmall = A[:, self.vartypes.free] # pylint: disable=no-member
             # The shape of b is unchanged, but fixed nonzero values modify it.
             fnz = self.vartypes.fixed_nonzeros # pylint: disable=no-member
-            b = b - np.dot(A[:, fnz], self.pmf[fnz])
+            b = b - A[:, fnz].dot(self.pmf[fnz])
         else:
             Asmall = A
 
@@ -500,7 +503,7 @@ class MaximumConditionalEntropy(CVXOPT_Template):
                 msg = 'More independent constraints than free parameters.'
                 raise ValueError(msg)
 
-            Asmall = matrix(Asmall)
+            Asmall = _as_cvxopt(Asmall)
             b = matrix(b)  # now a column vector
 
         self.A = Asmall
@@ -643,8 +646,9 @@ class MaximumConditionalEntropy(CVXOPT_Template):
             opt = self.func(matrix(xfinal_free))
             return xfinal, opt
 
-        A = matrix(self.A)
-        b = matrix(self.b)
+        # These are already CVXOPT matrices; A is sparse.
+        A = self.A
+        b = self.b
         self.logger.info("Finding initial distribution.")
         initial_x = matrix(self.initial_dist()[0])
 
@@ -691,7 +695,7 @@ def pi_decomp(d, d_opt):
 def calculate_synergy(pmf_opt, ui):
     d = ui.dist
     d_opt = d.copy()
-    d_opt.pmf[:] = pmf_opt
+    d_opt.pmf = np.array(pmf_opt, dtype=float)
     # Original sources
     original_sources = ui._params.sources
     sources = list(range(len(original_sources)))
@@ -708,7 +712,7 @@ def dice(a, b):
     x = MaximumConditionalEntropy(d, [[0], [1]], [2], extra_constraints=True)
     pmf_opt, _ = x.optimize()
     d_opt = x.dist.copy()
-    d_opt.pmf[:] = pmf_opt
+    d_opt.pmf = np.array(pmf_opt, dtype=float)
     print(pi_decomp(x.dist, d_opt))
     return x
 
@@ -729,7 +733,7 @@ def demo():
                                           extra_constraints=True, verbose=20)
             pmf_opt, _ = x.optimize()
             d_opt = x.dist.copy()
-            d_opt.pmf[:] = pmf_opt
+            d_opt.pmf = np.array(pmf_opt, dtype=float)
             decomps.append(pi_decomp(x.dist, d_opt))
         decomps = np.asarray(decomps)
         # redundancy
@@ -817,7 +821,7 @@ def k_synergy(d, sources, target, k=2, rv_mode=None, extra_constraints=True,
     pmf, _ = x.optimize()
     d_orig = x.dist
     d_opt = d_orig.copy()
-    d_opt.pmf[:] = pmf
+    d_opt.pmf = np.array(pmf, dtype=float)
     H_opt = dit.multivariate.entropy(d_opt)
     H_orig = dit.multivariate.entropy(d_orig)
     return H_opt - H_orig
@@ -886,7 +890,7 @@ def k_informations(d, sources, target, rv_mode=None, extra_constraints=True,
         pmf, _ = x.optimize()
         d_orig = x.dist
         d_opt = d_orig.copy()
-        d_opt.pmf[:] = pmf
+        d_opt.pmf = np.array(pmf, dtype=float)
         H_opt = dit.multivariate.entropy(d_opt)
         H_orig = dit.multivariate.entropy(d_orig)
         nonkinfo = H_opt - H_orig
@@ -968,7 +972,7 @@ def unique_informations(d, sources, target, k=2, rv_mode=None,
     pmf, _ = x.optimize()
     d_orig = x.dist
     d_opt = d_orig.copy()
-    d_opt.pmf[:] = pmf
+    d_opt.pmf = np.array(pmf, dtype=float)
     n = d_opt.outcome_length()
     uis = []
     for rv in range(n-1):
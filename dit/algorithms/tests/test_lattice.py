@@ -10,8 +10,10 @@ import numpy as np
 
 from dit import Distribution, ScalarDistribution
 from dit.algorithms.lattice import (dist_from_induced_sigalg, insert_join,
-                                    join, join_sigalg, meet, meet_sigalg,
-                                    sigma_algebra_sort)
+                                    insert_meet, join, join_partition,
+                                    join_sigalg, meet, meet_partition,
+                                    meet_sigalg, sigma_algebra_sort)
+from dit.math import atom_set
 from dit.utils import powerset
 
 
@@ -47,6 +49,50 @@ def test_meet_sigalg():
     assert sigalg == meeted
 
 
+_LATTICE_OUTCOMES = ['000', '011', '101', '110', '222', '333']
+_SINGLETONS = [[outcome] for outcome in _LATTICE_OUTCOMES]
+_XOR_CLASSES = [['000', '011', '101', '110'], ['222'], ['333']]
+
+
+@pytest.mark.parametrize(('rvs', 'joined', 'meeted'), [
+    ([[0], [1]], _SINGLETONS, _XOR_CLASSES),
+    ([[0, 1], [1, 2]], _SINGLETONS, _SINGLETONS),
+    ([[0], [1], [2]], _SINGLETONS, _XOR_CLASSES),
+    ([[0], [0]], [['000', '011'], ['101', '110'], ['222'], ['333']],
+                 [['000', '011'], ['101', '110'], ['222'], ['333']]),
+    ([[2], [0, 1]], _SINGLETONS, [['000', '110'], ['011', '101'], ['222'], ['333']]),
+])
+def test_partitions(rvs, joined, meeted):
+    """ Test join_partition and meet_partition against known partitions """
+    pmf = [1/8]*4 + [1/4]*2
+    d = Distribution(_LATTICE_OUTCOMES, pmf, sample_space=_LATTICE_OUTCOMES)
+    assert join_partition(d, rvs) == frozenset(map(frozenset, joined))
+    assert meet_partition(d, rvs) == frozenset(map(frozenset, meeted))
+    assert atom_set(join_sigalg(d, rvs)) == frozenset(map(frozenset, joined))
+    assert atom_set(meet_sigalg(d, rvs)) == frozenset(map(frozenset, meeted))
+
+
+def test_meet_chain():
+    """ Test that the meet links outcomes transitively """
+    outcomes = ['00', '01', '11', '12', '22', '33']
+    pmf = [1/6]*6
+    d = Distribution(outcomes, pmf, sample_space=outcomes)
+    mp = meet_partition(d, [[0], [1]])
+    assert mp == frozenset([frozenset(outcomes[:5]), frozenset(outcomes[5:])])
+
+
+def test_meet_large():
+    """ Test the meet of a distribution with many outcomes """
+    n = 2000
+    outcomes = [(i, i // 2, i % 4) for i in range(n)]
+    d = Distribution(outcomes, [1/n]*n, sample_space=outcomes)
+    d2 = meet(d, [[1], [2]])
+    assert np.allclose(d2.pmf, [1/2, 1/2])
+    d3 = insert_meet(d, -1, [[0], [1]])
+    assert d3.outcome_length() == 4
+    assert len(d3.marginal([3]).outcomes) == n // 2
+
+
 def test_dist_from_induced():
     """ Test dist_from_induced_sigalg """
     outcomes = [(0,), (1,), (2,)]
@@ -1,9 +1,13 @@
 from __future__ import division
 
+import pytest
+
 import numpy as np
+from scipy.sparse import issparse
 
 import dit
 from dit.algorithms.maxentropy import marginal_constraints
+from dit.algorithms.optutil import as_full_rank
 
 
 def test_marginal_constraints():
@@ -30,5 +34,65 @@ def test_marginal_constraints():
 
     b_ = np.array([1] + [0.25] * 12)
 
-    assert np.allclose(A, A_)
+    assert issparse(A)
+    assert np.allclose(A.toarray(), A_)
     assert np.allclose(b, b_)
+
+
+def test_as_full_rank_sparse():
+    d = dit.random_distribution(3, 3, prng=np.random.RandomState(0))
+    d.make_dense()
+
+    A, b = marginal_constraints(d, 2)
+    B, c, rank = as_full_rank(A, b)
+    _, _, rank_ = as_full_rank(A.toarray(), b)
+
+    assert issparse(B)
+    assert rank == rank_ == B.shape[0]
+    assert np.linalg.matrix_rank(B.toarray()) == rank
+    assert np.allclose(B.dot(d.pmf), c)
+
+
+def test_marginal_maxent_generic():
+    pytest.importorskip('cvxopt')
+    from dit.algorithms.maxentropyfw import marginal_maxent_generic
+
+    d = dit.example_dists.Xor()
+    d.make_dense()
+
+    pmf, _ = marginal_maxent_generic(d, [[0], [1], [2]])
+
+    assert np.allclose(pmf, 1/8, atol=1e-3)
+
+
+@pytest.mark.parametrize(('k', 'pmf'), [
+    (1, [1/8]*8),
+    (2, [1/8]*8),
+    (3, [1/4]*4),
+])
+def test_marginal_maximum_entropy(k, pmf):
+    pytest.importorskip('cvxopt')
+    from dit.algorithms.maxentropy import MarginalMaximumEntropy
+
+    d = dit.example_dists.Xor()
+    d.make_dense()
+
+    opt = MarginalMaximumEntropy(d, k)
+    x = opt.optimize(show_progress=False)
+
+    assert np.allclose(x.ravel(), pmf, atol=1e-6)
+
+
+@pytest.mark.parametrize(('outcomes', 'uniques'), [
+    (['000', '011', '101', '110'], [0, 0]),
+    (['000', '011', '102', '113'], [1, 1]),
+])
+def test_unique_informations(outcomes, uniques):
+    pytest.importorskip('cvxopt')
+    from dit.algorithms.pid_broja import unique_informations
+
+    d = dit.Distribution(outcomes, [1/4]*4)
+
+    ui = unique_informations(d, [[0], [1]], [2])[0]
+
+    assert np.allclose(ui, uniques, atol=1e-4)
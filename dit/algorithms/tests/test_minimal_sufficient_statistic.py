@@ -5,7 +5,8 @@ Tests for dit.algorithms.minimal_sufficient_statistic.
 from __future__ import division
 
 from dit import Distribution, ScalarDistribution, pruned_samplespace
-from dit.algorithms import insert_mss, mss, info_trim
+from dit.algorithms import insert_mss, mss, mss_partition, mss_sigalg, info_trim
+from dit.math import atom_set
 
 
 def get_gm():
@@ -29,6 +30,29 @@ def test_mss():
     assert d1.is_approx_equal(d2)
 
 
+def test_mss_partition():
+    """
+    Test that the partition is the atoms of the sigma algebra.
+    """
+    d = get_gm()
+    p = mss_partition(d, [0, 1], [2, 3])
+    assert p == atom_set(mss_sigalg(d, [0, 1], [2, 3]))
+    assert p == frozenset([frozenset(['1010', '1011']),
+                           frozenset(['0101', '0110', '0111', '1101', '1110', '1111'])])
+
+
+def test_mss_tolerance():
+    """
+    Test that conditional distributions equal up to tolerance are merged.
+    """
+    eps = 1e-12
+    outcomes = ['00', '01', '10', '11', '20', '21']
+    pmf = [1/8, 1/8, 1/8 + eps, 1/8 - eps, 1/2, 0]
+    d = Distribution(outcomes, pmf, trim=False)
+    d1 = mss(d, [0], [1])
+    assert d1.is_approx_equal(ScalarDistribution([0, 1], [1/2, 1/2]))
+
+
 def test_insert_mss():
     """
     Test the insertion of minimal sufficient statistics.
@@ -59,3 +83,20 @@ def test_info_trim2():
     d2 = Distribution(['000', '111', '222', '332'], [1/4]*4)
     d3 = info_trim(d1)
     assert d3.is_approx_equal(d2)
+
+
+def test_mss_rounding_boundary():
+    """
+    Test that conditionals straddling a rounding boundary are still merged.
+    """
+    quantum = 1e-9 + 1e-7
+    outcomes, pmf = [], []
+    for i, center in enumerate([3000000.5 * quantum, 1000000.5 * quantum]):
+        for j, p in enumerate([center + 1e-12, center - 1e-12]):
+            x = str(2 * i + j)
+            outcomes += [x + '0', x + '1']
+            pmf += [p/4, (1 - p)/4]
+    d = Distribution(outcomes, pmf)
+    assert mss_partition(d, [0], [1]) == frozenset([frozenset(['00', '01', '10', '11']),
+                                                    frozenset(['20', '21', '30', '31'])])
+    assert len(atom_set(mss_sigalg(d, [0], [1]))) == 2
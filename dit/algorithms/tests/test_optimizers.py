@@ -6,18 +6,32 @@ from __future__ import division
 
 import pytest
 
+from concurrent.futures import ThreadPoolExecutor
+
 from itertools import product
 
+import multiprocessing
+
+from types import MethodType
+
+import numpy as np
+
+from scipy.optimize import approx_fprime
+
 from dit.algorithms import maxent_dist, pid_broja
 from dit.algorithms.distribution_optimizers import (
+    BROJABivariateOptimizer,
+    MaxEntOptimizer,
     MinEntOptimizer,
     MinCoInfoOptimizer,
     MaxDualTotalCorrelationOptimizer,
     MinDualTotalCorrelationOptimizer
 )
-from dit.distconst import uniform
+from dit.distconst import random_distribution, uniform
+from dit.exceptions import ditException
 from dit.example_dists import Rdn, Unq, Xor
 from dit.multivariate import entropy as H, coinformation as I, dual_total_correlation as B
+from dit.multivariate.secret_key_agreement.intrinsic_mutual_informations import IntrinsicDualTotalCorrelation
 
 
 @pytest.mark.parametrize('vars', [
@@ -63,6 +77,35 @@ def test_maxent_3():
     assert H(d) == pytest.approx(6)
 
 
+@pytest.mark.parametrize('vars', [
+    [[0], [1], [2]],
+    [[0, 1], [2]],
+    [[0, 1], [0, 2], [1, 2]],
+])
+def test_maxent_methods(vars):
+    """
+    Test that iterative proportional fitting agrees with scipy.optimize.
+    """
+    d = random_distribution(3, 2, prng=np.random.RandomState(0))
+    d_ipf = maxent_dist(d.copy(), vars, method='ipf')
+    d_sp = maxent_dist(d.copy(), vars, method='sp')
+    assert H(d_ipf) == pytest.approx(H(d_sp), abs=1e-4)
+    for rvs in vars:
+        assert d_ipf.marginal(rvs).is_approx_equal(d.marginal(rvs), atol=1e-6)
+
+
+def test_maxent_optimizer_ipf():
+    """
+    Test MaxEntOptimizer with iterative proportional fitting.
+    """
+    d = uniform(['000', '011', '101', '110'])
+    meo = MaxEntOptimizer(d, [[0, 1], [2]])
+    assert meo.optimize(method='ipf') is None
+    assert H(meo.construct_dist()) == pytest.approx(3)
+    with pytest.raises(ditException):
+        meo.optimize(method='newton')
+
+
 def test_minent_1():
     """
     Test minent
@@ -121,3 +164,48 @@ def test_dtc_2():
     max_dtc.optimize()
     dp = max_dtc.construct_dist()
     assert B(dp) == pytest.approx(0.0, abs=1e-4)
+
+
+@pytest.mark.parametrize('executor', [None, 'thread', ThreadPoolExecutor(2)])
+def test_shotgun_parallel(executor):
+    """
+    Test that parallel restarts find the same optima as serial ones.
+    """
+    np.random.seed(0)
+    serial = BROJABivariateOptimizer(Unq(), [[0], [1]], [2])
+    serial.optimize(niter=3)
+    np.random.seed(0)
+    parallel = BROJABivariateOptimizer(Unq(), [[0], [1]], [2])
+    parallel.optimize(niter=3, n_jobs=2, executor=executor)
+    assert np.allclose(serial._optima, parallel._optima)
+
+
+def test_shotgun_no_fork(monkeypatch):
+    """
+    Test that process restarts fall back to threads without fork contexts.
+    """
+    monkeypatch.delattr(multiprocessing, 'get_context')
+    np.random.seed(0)
+    serial = BROJABivariateOptimizer(Unq(), [[0], [1]], [2])
+    serial.optimize(niter=3)
+    np.random.seed(0)
+    parallel = BROJABivariateOptimizer(Unq(), [[0], [1]], [2])
+    parallel.optimize(niter=3, n_jobs=2, executor='process')
+    assert np.allclose(serial._optima, parallel._optima)
+
+
+@pytest.mark.parametrize('optimizer', [
+    lambda d: MaxDualTotalCorrelationOptimizer(d, [[0], [1], [2]]),
+    lambda d: IntrinsicDualTotalCorrelation(d, [[0], [1]], [2]),
+])
+def test_jacobian(optimizer):
+    """
+    Test that the analytic gradient agrees with finite differences.
+    """
+    np.random.seed(1)
+    opt = optimizer(random_distribution(3, 2))
+    objective = opt._objective()
+    x = np.ravel(opt.construct_random_initial()) + 0.1
+    f = MethodType(objective, opt)
+    jac = MethodType(objective.jacobian, opt)
+    assert np.allclose(jac(x), approx_fprime(x, f, 1e-7), atol=1e-5)
@@ -0,0 +1,147 @@
+"""
+Conditional distributions, stored as a single array.
+
+"""
+
+import numpy as np
+from six.moves import range # pylint: disable=redefined-builtin
+
+from .exceptions import ditException
+from .helpers import _convert_base
+from .npscalardist import ScalarDistribution
+from .params import validate_base
+
+__all__ = [
+    'ConditionalDistribution',
+]
+
+
+class ConditionalDistribution(object):
+    """
+    A conditional distribution P(Y|X), stored as a single array.
+
+    Row ``i`` of the array holds P(Y|X=x) for the ``i``-th outcome ``x`` of
+    the distribution conditioned on, and column ``j`` the probability of the
+    ``j``-th outcome of Y. The rows may also be accessed as distributions,
+    which are constructed only when first requested, so that the object can
+    be used in place of a list of conditional distributions.
+
+    Attributes
+    ----------
+    pmf : NumPy array, shape (len(X), len(outcomes))
+        The conditional probabilities, in the base of the distribution of Y.
+    outcomes : tuple
+        The outcomes of Y labeling the columns of `pmf`.
+
+    """
+
+    def __init__(self, pmf, dist, sparse=True, extract=False):
+        """
+        Initialize the conditional distribution.
+
+        Parameters
+        ----------
+        pmf : NumPy array, shape (n, len(dist))
+            The conditional probabilities, in the base of `dist`.
+        dist : Distribution
+            A distribution of Y, whose outcomes label the columns of `pmf`.
+            The conditional distributions share its sample space, base, mask
+            and random variable names.
+        sparse : bool
+            Whether the conditional distributions are sparse.
+        extract : bool
+            If ``True`` and Y is a single random variable, then the conditional
+            distributions are scalar distributions.
+
+        """
+        self.pmf = pmf
+        self._dist = dist
+        self._sparse = sparse
+        self._extract = extract
+        self._rows = {}
+
+    @property
+    def outcomes(self):
+        """
+        The outcomes of Y labeling the columns of `pmf`.
+
+        """
+        return self._dist.outcomes
+
+    def __len__(self):
+        """
+        Returns the number of outcomes conditioned on.
+
+        """
+        return self.pmf.shape[0]
+
+    def __iter__(self):
+        """
+        Iterates over the conditional distributions.
+
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        """
+        Returns the conditional distribution P(Y|X=x) for the ``i``-th
+        outcome ``x``, or a list of them if `i` is a slice.
+
+        """
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        i = range(len(self))[i]
+        if i not in self._rows:
+            dist = self._dist
+            d = dist.__class__(dist.outcomes, self.pmf[i], sparse=self._sparse,
+                               base=dist.get_base(), sample_space=dist._sample_space,
+                               validate=False)
+            d._new_mask(from_mask=dist._mask)
+            d.set_rv_names(dist.get_rv_names())
+            if self._extract and dist.outcome_length() == 1:
+                d = ScalarDistribution.from_distribution(d)
+            self._rows[i] = d
+        return self._rows[i]
+
+    def to_array(self, base='linear', mode='asis'):
+        """
+        Returns P(Y|X) as a 2D array. Rows are X, columns are Y.
+
+        Parameters
+        ----------
+        base : float, 'linear', 'e', None
+            The desired base of the probabilities. If None, then the
+            probabilities maintain their current base.
+        mode : ['dense', 'asis']
+            'dense' means that the columns span the entire sample space of Y.
+            'asis' means that the columns are the outcomes of Y.
+
+        Returns
+        -------
+        pmf : NumPy array
+            The conditional probabilities.
+
+        Raises
+        ------
+        ditException
+            If `mode` is not 'dense' or 'asis'.
+
+        """
+        dist = self._dist
+        base_old = dist.get_base(numerical=True)
+        base_new = base_old if base is None else validate_base(base)
+
+        if mode == 'asis':
+            pmf = np.array(self.pmf, copy=True)
+        elif mode == 'dense':
+            index = {outcome: j for j, outcome in enumerate(dist.sample_space())}
+            pmf = np.empty((len(self), len(index)), dtype=float)
+            pmf.fill(dist.ops.zero)
+            pmf[:, [index[outcome] for outcome in dist.outcomes]] = self.pmf
+        else:
+            msg = "`mode` must be 'dense' or 'asis'."
+            raise ditException(msg)
+
+        return _convert_base(pmf, base_old, base_new)
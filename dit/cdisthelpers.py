@@ -5,6 +5,7 @@ Helper functions related to conditional distributions.
 
 import numpy as np
 
+from .cdist import ConditionalDistribution
 from .exceptions import ditException
 from .helpers import copypmf
 
@@ -19,7 +20,12 @@ def cdist_array(cdists, base='linear', mode='asis'):
     """
     Returns a 2D array for P(Y|X). Rows are X, columns are Y.
 
+    `cdists` is either a list of conditional distributions or a
+    ConditionalDistribution, whose array is used directly.
+
     """
+    if isinstance(cdists, ConditionalDistribution) and mode != 'sparse':
+        return cdists.to_array(base=base, mode=mode)
     dists = [copypmf(d, base=base, mode=mode) for d in cdists]
     return np.vstack(dists)
 
@@ -51,7 +57,7 @@ def joint_from_factors(mdist, cdists, strict=True):
     ----------
     mdist : Distribution
         The marginal distribution P(X).
-    cdists : list
+    cdists : list, ConditionalDistribution
         The list of conditional distributions P(Y|X=x).
     strict : bool
         If ``True``, then the ordering of the random variables is inferred
@@ -83,17 +89,21 @@ def joint_from_factors(mdist, cdists, strict=True):
 
     """
     # We assume that the mask is the same each dist in cdists.
-    cdist_mask = cdists[0]._mask
+    if isinstance(cdists, ConditionalDistribution):
+        template = cdists._dist
+    else:
+        template = cdists[0]
+    cdist_mask = template._mask
 
     # Raise exception if mdist and cdists are not compatible.
-    compatible = mask_is_complementary(mdist._mask, cdists[0]._mask)
+    compatible = mask_is_complementary(mdist._mask, cdist_mask)
     if strict and not compatible:
         msg = 'Incompatible masks for ``mdist`` and ``cdists``.'
         raise ditException(msg)
 
     if not compatible:
         cdist_mask = [True] * mdist.outcome_length()
-        cdist_mask.extend([False] * cdists[0].outcome_length())
+        cdist_mask.extend([False] * template.outcome_length())
 
     # Make sure mdist has the proper number of outcomes.
     YgX_pmf = cdist_array(cdists)
@@ -119,21 +129,31 @@ def joint_from_factors(mdist, cdists, strict=True):
     # The joint probabilities
     XY_pmf = YgX_pmf * X_pmf[:, np.newaxis]
 
-    ctor = cdists[0]._outcome_ctor
+    ctor = template._outcome_ctor
     # We can't use NumPy for the outcomes, since an array of tuples is
     # automatically turned into a 2D array. We could initialize as a 1D
     # object array, but we'd still have to populate through for loops.
     # So we might as well avoid NumPy here.
     outcomes = []
-    for i, X in enumerate(X_outcomes):
-        tmp = [ctor(outcome_iter(X, Y, cdist_mask)) for Y in cdists[i].outcomes]
-        outcomes.extend(tmp)
+    if isinstance(cdists, ConditionalDistribution):
+        # Every row shares the outcomes of Y, of which sparse conditional
+        # distributions keep only those with positive probability.
+        Y_outcomes = cdists.outcomes
+        support = YgX_pmf > 0 if cdists._sparse else np.ones(YgX_pmf.shape, dtype=bool)
+        for i, X in enumerate(X_outcomes):
+            tmp = [ctor(outcome_iter(X, Y_outcomes[j], cdist_mask)) for j in np.flatnonzero(support[i])]
+            outcomes.extend(tmp)
+        XY_pmf = XY_pmf[support]
+    else:
+        for i, X in enumerate(X_outcomes):
+            tmp = [ctor(outcome_iter(X, Y, cdist_mask)) for Y in cdists[i].outcomes]
+            outcomes.extend(tmp)
 
     d = dit.Distribution(outcomes, list(XY_pmf.flat),
                          sparse=True, trim=False)
 
     X_rv_names = mdist.get_rv_names()
-    Y_rv_names = cdists[0].get_rv_names()
+    Y_rv_names = template.get_rv_names()
     if X_rv_names and Y_rv_names:
         rv_names = outcome_iter(X_rv_names, Y_rv_names, cdist_mask)
         d.set_rv_names(list(rv_names))
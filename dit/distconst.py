@@ -158,7 +158,7 @@ def mixture_distribution2(dists, weights):
     validate_pmf(weights, ops)
 
     mix = dists[0].copy()
-    ops.mult_inplace(mix.pmf, weights[0])
+    mix.pmf = ops.mult(mix.pmf, weights[0])
     for dist, weight in zip(dists[1:], weights[1:]):
         ops.add_inplace(mix.pmf, ops.mult(dist.pmf, weight))
     return mix
@@ -398,13 +398,15 @@ def simplex_grid(length, subdivisions, using=None, inplace=False):
 
         if inplace:
             d = using
+            d._own_pmf()
             for pmf in gen:
                 d.pmf[:] = pmf
+                d._clear_cache()
                 yield d
         else:
             for pmf in gen:
                 d = using.copy()
-                d.pmf[:] = pmf
+                d.pmf = np.array(pmf, dtype=float)
                 yield d
 
 
@@ -362,6 +362,15 @@ class BaseDistribution(object):
         """
         return self.to_string()
 
+    def _clear_cache(self):
+        """
+        Empties any caches which depend on the values of the pmf.
+
+        This must be called whenever the pmf is modified in-place.
+
+        """
+        pass
+
     def _validate_outcomes(self):
         """
         Returns `True` if the outcomes are in the sample space.
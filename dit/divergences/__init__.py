@@ -22,6 +22,7 @@ from .generalized_divergences import (
 
 from .earth_movers_distance import (
     earth_movers_distance,
+    earth_movers_distances,
 )
 
 from .hypercontractivity_coefficient import (
@@ -41,6 +42,10 @@ from .maximum_correlation import (
     maximum_correlation,
 )
 
+from .pairwise import (
+    pairwise,
+)
+
 from .variational_distance import (
     bhattacharyya_coefficient,
     chernoff_information,
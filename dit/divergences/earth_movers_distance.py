@@ -1,11 +1,24 @@
 """
 Implementation of the Earth Mover's Distance.
+
+The Earth Mover's Distance is a transportation problem, but two common cases
+have closed forms: with categorical distances it is the variational distance,
+and between distributions on the real line it is the area between their
+cumulative distribution functions. Other problems are solved as a linear
+program over the supports of the distributions, with sparse constraints.
 """
 
 import numpy as np
+import scipy
 from scipy.optimize import linprog
+from scipy.sparse import eye, kron, vstack
+
+from ..exceptions import OptimizationException
+from ..helpers import numerical_test
+
 
-from ..helpers import normalize_pmfs, numerical_test
+# HiGHS, which accepts sparse constraints, is available from SciPy 1.6 on.
+_HAS_HIGHS = tuple(int(v) for v in scipy.__version__.split('.')[:2]) >= (1, 6)
 
 
 def categorical_distances(n):
@@ -45,18 +58,110 @@ def numerical_distances(x_values, y_values):
     return abs(xx - yy)
 
 
+def _categorical_emd(x, ys):
+    """
+    The Earth Mover's Distance under categorical distances, which is the
+    variational distance.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The first pmf.
+    ys : np.ndarray
+        The second pmf, or several stacked along the first axis.
+
+    Returns
+    -------
+    emd : float, np.ndarray
+        The Earth Mover's Distance between `x` and each of `ys`.
+    """
+    return abs(ys - x).sum(axis=-1) / 2
+
+
+def _numerical_emd(values, x, ys):
+    """
+    The Earth Mover's Distance between distributions on the real line, which
+    is the area between their cumulative distribution functions.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The values taken by the distributions, in increasing order.
+    x : np.ndarray
+        The first pmf, over `values`.
+    ys : np.ndarray
+        The second pmf, or several stacked along the first axis.
+
+    Returns
+    -------
+    emd : float, np.ndarray
+        The Earth Mover's Distance between `x` and each of `ys`.
+    """
+    cdfs = np.cumsum(ys - x, axis=-1)[..., :-1]
+    return abs(cdfs).dot(np.diff(values))
+
+
+def _transport_emd(x, y, distances):
+    """
+    The Earth Mover's Distance as a transportation problem, solved between
+    the supports of `x` and `y`.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The first pmf.
+    y : np.ndarray
+        The second pmf.
+    distances : np.ndarray
+        The cost of moving probability from x[i] to y[j].
+
+    Returns
+    -------
+    emd : float
+        The Earth Mover's Distance.
+    """
+    rows, cols = np.flatnonzero(x), np.flatnonzero(y)
+    x, y = x[rows], y[cols]
+    costs = distances[np.ix_(rows, cols)]
+    n, m = costs.shape
+
+    # With a single source or destination, there is only one plan.
+    if n == 1:
+        return costs[0].dot(y)
+    if m == 1:
+        return costs[:, 0].dot(x)
+
+    # The flow out of each source and into each destination. The last
+    # destination's constraint follows from the others, and is dropped.
+    A = vstack([kron(eye(n), np.ones((1, m)), format='csr'),
+                kron(np.ones((1, n)), eye(m), format='csr')[:-1]]).tocsr()
+    b = np.concatenate([x, y[:-1]])
+
+    if _HAS_HIGHS:
+        res = linprog(costs.ravel(), A_eq=A, b_eq=b, bounds=(0, None), method='highs')
+    else:
+        # Older solvers require dense constraints.
+        res = linprog(costs.ravel(), A_eq=A.toarray(), b_eq=b, bounds=(0, None))
+
+    if not res.success:  # pragma: no cover
+        msg = "The transportation problem could not be solved: {0}"
+        raise OptimizationException(msg.format(res.message))
+
+    return res.fun
+
+
 def earth_movers_distance_pmf(x, y, distances=None):
     """
-    Compute the Earth Mover's Distance between `p` and `q`.
+    Compute the Earth Mover's Distance between `x` and `y`.
 
     Parameters
     ----------
-    p : np.ndarray
+    x : np.ndarray
         The first pmf.
-    q : np.ndarray
+    y : np.ndarray
         The second pmf.
     distances : np.ndarray, None
-        The cost of moving probability from p[i] to q[j]. If None,
+        The cost of moving probability from x[i] to y[j]. If None,
         the cost is assumed to be i != j.
 
     Returns
@@ -64,22 +169,84 @@ def earth_movers_distance_pmf(x, y, distances=None):
     emd : float
         The Earth Mover's Distance.
     """
-    n = len(x)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    if distances is None or _is_categorical(distances):
+        return _categorical_emd(x, y)
+
+    return _transport_emd(x, y, np.asarray(distances, dtype=float))
+
+
+def earth_movers_distance_pmfs(x, ys, distances=None):
+    """
+    Compute the Earth Mover's Distance between `x` and each of `ys`.
 
-    if distances is None:
-        # assume categorical distribution
-        distances = categorical_distances(n)
+    Parameters
+    ----------
+    x : np.ndarray
+        The reference pmf.
+    ys : np.ndarray
+        The other pmfs, stacked along the first axis.
+    distances : np.ndarray, None
+        The cost of moving probability from x[i] to y[j]. If None,
+        the cost is assumed to be i != j.
 
-    eye = np.eye(n)
-    A = np.vstack([np.dstack([eye]*n).reshape(n, n**2), np.tile(eye, n)])
+    Returns
+    -------
+    emds : np.ndarray
+        The Earth Mover's Distance between `x` and each of `ys`.
+    """
+    x = np.asarray(x, dtype=float)
+    ys = np.asarray(ys, dtype=float)
 
-    b = np.concatenate([x, y], axis=0)
+    if distances is None or _is_categorical(distances):
+        return _categorical_emd(x, ys)
 
-    c = distances.flatten()
+    distances = np.asarray(distances, dtype=float)
+    return np.array([_transport_emd(x, y, distances) for y in ys])
 
-    res = linprog(c, A_eq=A, b_eq=b, bounds=[0, None])
 
-    return res.fun
+def _is_categorical(distances):
+    """
+    Tests if `distances` puts every pair of distinct symbols at unit distance.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        A matrix of distances.
+
+    Returns
+    -------
+    categorical : bool
+        True if `distances` is that from `categorical_distances`.
+    """
+    distances = np.asarray(distances)
+    n = len(distances)
+    return distances.shape == (n, n) and np.array_equal(distances, categorical_distances(n))
+
+
+def _scalar_values(dist):
+    """
+    The outcomes of `dist` as real numbers, if they are.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution.
+
+    Returns
+    -------
+    values : np.ndarray, None
+        The outcomes, or None if they are not all scalar numbers.
+    """
+    try:
+        numerical_test(dist)
+    except TypeError:
+        return None
+    values = np.asarray(dist.outcomes, dtype=float)
+    return values if values.ndim == 1 else None
+
 
 def earth_movers_distance(dist1, dist2, distances=None):
     """
@@ -104,16 +271,56 @@ def earth_movers_distance(dist1, dist2, distances=None):
     emd : float
         The Earth Mover's Distance.
     """
-    if distances is None:
-        try:
-            numerical_test(dist1)
-            numerical_test(dist2)
-            p, q = dist1.pmf, dist2.pmf
-            distances = numerical_distances(dist1.outcomes, dist2.outcomes)
-        except TypeError:
-            p, q = normalize_pmfs(dist1, dist2)
-            distances = categorical_distances(len(p))
+    return earth_movers_distances(dist1, [dist2], distances=distances)[0]
+
+
+def earth_movers_distances(dist, dists, distances=None):
+    """
+    Compute the Earth Mover's Distance (EMD) between `dist` and each of
+    `dists`.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The reference distribution.
+    dists : iterable of Distributions
+        The distributions to compare against `dist`.
+    distances : np.ndarray, None
+        A matrix of distances between the outcomes of `dist` and those of
+        each of `dists`. If None, a distance matrix is constructed; if the
+        distributions are categorical each non-equal event is considered at
+        unit distance, and if numerical abs(x, y) is used as the distance.
+
+    Returns
+    -------
+    emds : np.ndarray
+        The Earth Mover's Distance between `dist` and each of `dists`.
+    """
+    dists = list(dists)
+
+    if distances is not None:
+        return np.array([earth_movers_distance_pmf(dist.pmf, other.pmf, distances)
+                         for other in dists])
+
+    everything = [dist] + dists
+    values = [_scalar_values(d) for d in everything]
+    numerical = all(v is not None for v in values)
+    if numerical:
+        # Align all the pmfs on the sorted union of their outcomes.
+        support, index = np.unique(np.concatenate(values), return_inverse=True)
+        indices = np.split(index, np.cumsum([len(v) for v in values])[:-1])
     else:
-        p, q = dist1.pmf, dist2.pmf
+        # Align all the pmfs on the union of their outcomes.
+        lookup = {}
+        indices = [[lookup.setdefault(outcome, len(lookup)) for outcome in d.outcomes]
+                   for d in everything]
+        support = lookup
 
-    return earth_movers_distance_pmf(p, q, distances)
+    pmfs = np.zeros((len(everything), len(support)))
+    for pmf, d, idx in zip(pmfs, everything, indices):
+        np.add.at(pmf, idx, d.pmf)
+
+    if numerical:
+        return _numerical_emd(support, pmfs[0], pmfs[1:])
+    else:
+        return _categorical_emd(pmfs[0], pmfs[1:])
@@ -87,7 +87,27 @@ class HypercontractivityCoefficient(BaseAuxVarOptimizer):
             b = mi_b(pmf)
             return -(a/b) if not np.isclose(b, 0.0) else np.inf
 
-        return objective
+        def gradient(pmf):
+            """
+            Compute the gradient of the objective with respect to the joint.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            a = mi_a(pmf)
+            b = mi_b(pmf)
+            if np.isclose(b, 0.0):
+                return np.zeros_like(pmf)
+            return (a * mi_b.gradient(pmf) - b * mi_a.gradient(pmf)) / b**2
+
+        return self._attach_jacobian(objective, gradient)
 
 
 def hypercontractivity_coefficient(dist, rvs, bound=None, niter=None, rv_mode=None):
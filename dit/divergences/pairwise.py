@@ -0,0 +1,311 @@
+"""
+Divergences between every pair of a collection of distributions.
+
+The distributions are aligned once onto the union of their outcomes and
+stacked as the rows of a matrix. Each divergence is then computed a block of
+rows at a time, against every other row, so that memory stays bounded; the
+blocks may be divided between workers.
+"""
+
+from __future__ import division
+
+import numpy as np
+
+from ..exceptions import ditException
+from ..utils.parallel import map_in_pool
+from .jensen_shannon_divergence import jensen_shannon_divergence
+from .kullback_leibler_divergence import kullback_leibler_divergence
+from .variational_distance import hellinger_distance, variational_distance
+
+__all__ = ('pairwise',
+           'pairwise_pmf',
+          )
+
+
+# The number of elements in the intermediate arrays of a block.
+_BLOCK_SIZE = 2**22
+
+
+def _xlogx(p):
+    """
+    Compute p*log2(p), taking 0*log2(0) to be 0.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(p > 0, p * np.log2(p), 0)
+
+
+def _jensen_shannon_block(pmfs, rows, cols):
+    """
+    The Jensen-Shannon divergence of each of `rows` with each of `cols`.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The aligned pmfs.
+    rows : slice
+        The rows of the block.
+    cols : slice
+        The columns of the block.
+
+    Returns
+    -------
+    block : np.ndarray
+        The divergences.
+    """
+    p, q = pmfs[rows], pmfs[cols]
+    h_p = -_xlogx(p).sum(axis=1)
+    h_q = -_xlogx(q).sum(axis=1)
+    h_m = -_xlogx((p[:, np.newaxis] + q[np.newaxis]) / 2).sum(axis=2)
+    return h_m - (h_p[:, np.newaxis] + h_q[np.newaxis]) / 2
+
+
+def _kullback_leibler_block(pmfs, rows, cols):
+    """
+    The Kullback-Leibler divergence of each of `rows` from each of `cols`.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The aligned pmfs.
+    rows : slice
+        The rows of the block.
+    cols : slice
+        The columns of the block.
+
+    Returns
+    -------
+    block : np.ndarray
+        The divergences.
+    """
+    p, q = pmfs[rows], pmfs[cols]
+    with np.errstate(divide='ignore'):
+        log_q = np.where(q > 0, np.log2(q), 0)
+    cross = -p.dot(log_q.T)
+    # The divergence is infinite where `q` lacks some of the support of `p`.
+    cross[(p > 0).dot((q == 0).T) > 0] = np.inf
+    return cross + _xlogx(p).sum(axis=1)[:, np.newaxis]
+
+
+def _hellinger_block(pmfs, rows, cols):
+    """
+    The Hellinger distance between each of `rows` and each of `cols`.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The aligned pmfs.
+    rows : slice
+        The rows of the block.
+    cols : slice
+        The columns of the block.
+
+    Returns
+    -------
+    block : np.ndarray
+        The distances.
+    """
+    bc = np.sqrt(pmfs[rows]).dot(np.sqrt(pmfs[cols]).T)
+    return np.sqrt(np.maximum(1 - bc, 0))
+
+
+def _variational_block(pmfs, rows, cols):
+    """
+    The variational distance between each of `rows` and each of `cols`.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The aligned pmfs.
+    rows : slice
+        The rows of the block.
+    cols : slice
+        The columns of the block.
+
+    Returns
+    -------
+    block : np.ndarray
+        The distances.
+    """
+    return abs(pmfs[rows][:, np.newaxis] - pmfs[cols][np.newaxis]).sum(axis=2) / 2
+
+
+# The kernel for each metric, and whether the metric is symmetric.
+_METRICS = {
+    'jensen_shannon_divergence': (_jensen_shannon_block, True),
+    'kullback_leibler_divergence': (_kullback_leibler_block, False),
+    'hellinger_distance': (_hellinger_block, True),
+    'variational_distance': (_variational_block, True),
+}
+
+_METRIC_NAMES = {
+    jensen_shannon_divergence: 'jensen_shannon_divergence',
+    kullback_leibler_divergence: 'kullback_leibler_divergence',
+    hellinger_distance: 'hellinger_distance',
+    variational_distance: 'variational_distance',
+}
+
+
+def _compute_block(kernel, symmetric, pmfs, start, stop):
+    """
+    Compute the rows `start` to `stop` of a divergence matrix. For symmetric
+    metrics, only the columns from `start` on are computed.
+
+    Parameters
+    ----------
+    kernel : func
+        The kernel of the metric.
+    symmetric : bool
+        Whether the metric is symmetric.
+    pmfs : np.ndarray
+        The aligned pmfs.
+    start : int
+        The first row.
+    stop : int
+        The row after the last.
+
+    Returns
+    -------
+    block : np.ndarray
+        The divergences.
+    """
+    cols = slice(start if symmetric else 0, len(pmfs))
+    return kernel(pmfs, slice(start, stop), cols)
+
+
+def pairwise_pmf(pmfs, metric='jensen_shannon_divergence', chunksize=None, n_jobs=None, executor=None):
+    """
+    Compute a divergence between every pair of `pmfs`.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray, shape (n, k)
+        The `n` pmfs, each over the same `k` outcomes.
+    metric : str, func
+        The divergence to compute. One of 'jensen_shannon_divergence',
+        'kullback_leibler_divergence', 'hellinger_distance' or
+        'variational_distance', or the function of that name.
+    chunksize : int, None
+        The number of rows of the matrix to compute at once. If None, it is
+        chosen so that the intermediate arrays have a few million elements.
+    n_jobs : int, None
+        The number of workers to divide the rows between. If less than one,
+        use one per CPU. If None and `executor` is None, the rows are
+        computed serially.
+    executor : str, Executor, None
+        Either 'process' (the default when `n_jobs` is given) or 'thread' to
+        create a pool of `n_jobs` workers, or a `concurrent.futures.Executor`
+        to submit the rows to.
+
+    Returns
+    -------
+    divergences : np.ndarray, shape (n, n)
+        The divergence of the `i`th pmf from the `j`th pmf, at `[i, j]`.
+
+    Raises
+    ------
+    ditException
+        Raised if `metric` is not a known divergence.
+    """
+    try:
+        kernel, symmetric = _METRICS[_METRIC_NAMES.get(metric, metric)]
+    except (KeyError, TypeError):
+        msg = "Unknown metric: {0}. Valid options are: {1}."
+        raise ditException(msg.format(metric, ', '.join(sorted(_METRICS))))
+
+    pmfs = np.atleast_2d(np.asarray(pmfs, dtype=float))
+    n, k = pmfs.shape
+
+    if chunksize is None:
+        chunksize = max(1, _BLOCK_SIZE // max(1, n * k))
+    starts = range(0, n, chunksize)
+    bounds = [(start, min(start + chunksize, n)) for start in starts]
+
+    blocks = map_in_pool(_compute_block, bounds, n_jobs=n_jobs, executor=executor,
+                         shared=(kernel, symmetric, pmfs))
+
+    divergences = np.zeros((n, n))
+    for (start, stop), block in zip(bounds, blocks):
+        if symmetric:
+            divergences[start:stop, start:] = block
+            divergences[start:, start:stop] = block.T
+        else:
+            divergences[start:stop] = block
+
+    # Every pmf is at no distance from itself.
+    np.fill_diagonal(divergences, 0)
+
+    return divergences
+
+
+def _align_pmfs(dists):
+    """
+    Stack the pmfs of `dists` over the union of their outcomes.
+
+    Parameters
+    ----------
+    dists : list of Distributions
+        The distributions.
+
+    Returns
+    -------
+    pmfs : np.ndarray
+        The linear pmf of each distribution, with a column for each outcome
+        of any of `dists`, in order of their appearance.
+    """
+    lookup = {}
+    indices = [[lookup.setdefault(outcome, len(lookup)) for outcome in dist.outcomes]
+               for dist in dists]
+    pmfs = np.zeros((len(dists), len(lookup)))
+    for pmf, dist, index in zip(pmfs, dists, indices):
+        values = dist.pmf
+        if dist.is_log():
+            values = dist.get_base(numerical=True)**values
+        np.add.at(pmf, index, values)
+    return pmfs
+
+
+def pairwise(dists, metric='jensen_shannon_divergence', chunksize=None, n_jobs=None, executor=None):
+    """
+    Compute a divergence between every pair of `dists`.
+
+    Parameters
+    ----------
+    dists : iterable of Distributions
+        The distributions.
+    metric : str, func
+        The divergence to compute. One of 'jensen_shannon_divergence',
+        'kullback_leibler_divergence', 'hellinger_distance' or
+        'variational_distance', or the function of that name.
+    chunksize : int, None
+        The number of rows of the matrix to compute at once. If None, it is
+        chosen so that the intermediate arrays have a few million elements.
+    n_jobs : int, None
+        The number of workers to divide the rows between. If less than one,
+        use one per CPU. If None and `executor` is None, the rows are
+        computed serially.
+    executor : str, Executor, None
+        Either 'process' (the default when `n_jobs` is given) or 'thread' to
+        create a pool of `n_jobs` workers, or a `concurrent.futures.Executor`
+        to submit the rows to.
+
+    Returns
+    -------
+    divergences : np.ndarray
+        The divergence of the `i`th distribution from the `j`th
+        distribution, at `[i, j]`.
+
+    Raises
+    ------
+    ditException
+        Raised if `metric` is not a known divergence.
+
+    Examples
+    --------
+    >>> d1 = dit.Distribution(['0', '1'], [1/2, 1/2])
+    >>> d2 = dit.Distribution(['0', '1'], [1, 0])
+    >>> dit.divergences.pairwise([d1, d2], metric='variational_distance')
+    array([[0. , 0.5],
+           [0.5, 0. ]])
+    """
+    pmfs = _align_pmfs(list(dists))
+    return pairwise_pmf(pmfs, metric=metric, chunksize=chunksize, n_jobs=n_jobs, executor=executor)
@@ -5,6 +5,7 @@ Provide a common place to access pmf-based divergences.
 
 from .earth_movers_distance import (
     earth_movers_distance_pmf as earth_movers_distance,
+    earth_movers_distance_pmfs as earth_movers_distances,
 )
 
 from .jensen_shannon_divergence import (
@@ -21,6 +22,10 @@ from .maximum_correlation import (
     conditional_maximum_correlation_pmf as conditional_maximum_correlation,
 )
 
+from .pairwise import (
+    pairwise_pmf as pairwise,
+)
+
 from .variational_distance import (
     bhattacharyya_coefficient_pmf as bhattacharyya_coefficient,
     chernoff_information_pmf as chernoff_information,
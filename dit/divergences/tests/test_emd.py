@@ -9,7 +9,11 @@ import pytest
 import numpy as np
 
 from dit import Distribution, ScalarDistribution
-from dit.divergences.earth_movers_distance import earth_movers_distance, earth_movers_distance_pmf
+from dit.divergences.earth_movers_distance import (earth_movers_distance,
+                                                    earth_movers_distance_pmf,
+                                                    earth_movers_distance_pmfs,
+                                                    earth_movers_distances,
+                                                    )
 
 
 @pytest.mark.parametrize(('p', 'q', 'emd'), [
@@ -53,4 +57,57 @@ def test_emd3():
     assert emd1 == pytest.approx(1.0)
     distances = np.asarray([[0, 1], [1, 0]])
     emd2 = earth_movers_distance(d1, d2, distances=distances)
-    assert emd2 == pytest.approx(2/3)
\ No newline at end of file
+    assert emd2 == pytest.approx(2/3)
+
+def test_emd_pmf_transport():
+    """
+    Test a non-categorical distance matrix against a known transport plan.
+    """
+    p = [0.5, 0.5, 0]
+    q = [0, 0.5, 0.5]
+    distances = np.array([[0, 1, 2], [1, 0, 1], [2, 1, 0]])
+    emd = earth_movers_distance_pmf(p, q, distances)
+    assert emd == pytest.approx(1.0)
+
+
+def test_emd_pmf_categorical_matrix():
+    """
+    Test that categorical distances agree with the variational distance.
+    """
+    p = [0.5, 0.25, 0.25]
+    q = [0.25, 0.25, 0.5]
+    emd = earth_movers_distance_pmf(p, q, 1 - np.eye(3))
+    assert emd == pytest.approx(0.25)
+
+
+def test_emd_numerical_supports():
+    """
+    Test numerical distributions with different supports.
+    """
+    sd1 = ScalarDistribution([0, 3], [1/2, 1/2])
+    sd2 = ScalarDistribution([1, 2, 5], [1/4, 1/4, 1/2])
+    emd = earth_movers_distance(sd1, sd2)
+    assert emd == pytest.approx(1/4 + 1/4*2 + 1/2*2)
+
+
+def test_emds():
+    """
+    Test comparing one distribution against many.
+    """
+    d1 = Distribution(['a', 'b'], [1/2, 1/2])
+    d2 = Distribution(['a', 'c'], [1/4, 3/4])
+    d3 = Distribution(['b'], [1])
+    emds = earth_movers_distances(d1, [d1, d2, d3])
+    assert emds == pytest.approx([0, 3/4, 1/2])
+    assert emds[1] == pytest.approx(earth_movers_distance(d1, d2))
+
+
+def test_emd_pmfs():
+    """
+    Test comparing one pmf against many.
+    """
+    p = [0.5, 0.5, 0]
+    qs = [[0, 0.5, 0.5], [0.5, 0.5, 0]]
+    distances = np.array([[0, 1, 2], [1, 0, 1], [2, 1, 0]])
+    assert earth_movers_distance_pmfs(p, qs, distances) == pytest.approx([1, 0], abs=1e-9)
+    assert earth_movers_distance_pmfs(p, qs) == pytest.approx([0.5, 0])
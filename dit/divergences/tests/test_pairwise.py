@@ -0,0 +1,88 @@
+"""
+Tests for dit.divergences.pairwise.
+"""
+
+from __future__ import division
+
+import pytest
+
+import numpy as np
+
+from dit import Distribution
+from dit.divergences import (hellinger_distance,
+                             jensen_shannon_divergence,
+                             kullback_leibler_divergence,
+                             pairwise,
+                             variational_distance,
+                             )
+from dit.divergences.pairwise import pairwise_pmf
+from dit.exceptions import ditException
+
+
+d1 = Distribution(['0', '1'], [1/2, 1/2])
+d2 = Distribution(['0', '1'], [1/4, 3/4])
+d3 = Distribution(['1', '2'], [1/4, 3/4])
+d4 = Distribution(['0', '2'], [1/3, 2/3])
+dists = [d1, d2, d3, d4]
+
+
+@pytest.mark.parametrize(('metric', 'func'), [
+    ('jensen_shannon_divergence', lambda a, b: jensen_shannon_divergence([a, b])),
+    ('kullback_leibler_divergence', kullback_leibler_divergence),
+    ('hellinger_distance', hellinger_distance),
+    ('variational_distance', variational_distance),
+])
+def test_pairwise(metric, func):
+    """
+    Test against each pair in turn.
+    """
+    divergences = pairwise(dists, metric=metric)
+    for i, a in enumerate(dists):
+        for j, b in enumerate(dists):
+            assert divergences[i, j] == pytest.approx(func(a, b), abs=1e-7)
+
+
+@pytest.mark.parametrize('metric', [
+    jensen_shannon_divergence,
+    kullback_leibler_divergence,
+    hellinger_distance,
+    variational_distance,
+])
+def test_pairwise_func(metric):
+    """
+    Test naming the metric by its function.
+    """
+    divergences = pairwise(dists, metric=metric)
+    assert np.allclose(divergences, pairwise(dists, metric=metric.__name__))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'chunksize': 1},
+    {'n_jobs': 2, 'executor': 'thread'},
+    {'n_jobs': 2, 'chunksize': 3},
+])
+def test_pairwise_chunks(kwargs):
+    """
+    Test that dividing the rows gives the same matrix.
+    """
+    pmfs = np.random.dirichlet(np.ones(5), 7)
+    for metric in ['jensen_shannon_divergence', 'kullback_leibler_divergence']:
+        assert np.allclose(pairwise_pmf(pmfs, metric, **kwargs), pairwise_pmf(pmfs, metric))
+
+
+def test_pairwise_infinite():
+    """
+    Test that missing support gives an infinite divergence.
+    """
+    divergences = pairwise([d1, d3], metric='kullback_leibler_divergence')
+    assert not np.isinf(np.diag(divergences)).any()
+    assert np.isinf(divergences[0, 1])
+    assert np.isinf(divergences[1, 0])
+
+
+def test_pairwise_unknown():
+    """
+    Test that an unknown metric raises an exception.
+    """
+    with pytest.raises(ditException):
+        pairwise(dists, metric='earth_movers_distance')
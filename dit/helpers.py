@@ -398,7 +398,6 @@ def copypmf(d, base=None, mode='asis'):
         The pmf of the distribution.
 
     """
-    from dit.math import get_ops
     from dit.params import validate_base
 
     # Sanitize inputs, need numerical base for old base.
@@ -408,9 +407,7 @@ def copypmf(d, base=None, mode='asis'):
     else:
         base_new = validate_base(base)
 
-    # Create ops instances.
     ops_old = d.ops
-    ops_new = get_ops(base_new)
 
     # Build the pmf
     if mode == 'asis':
@@ -420,12 +417,36 @@ def copypmf(d, base=None, mode='asis'):
     elif mode == 'sparse':
         pmf = np.array([p for p in d.pmf if not ops_old.is_null(p)], dtype=float)
 
+    return _convert_base(pmf, base_old, base_new)
+
+
+def _convert_base(pmf, base_old, base_new):
+    """
+    Returns `pmf`, given in `base_old`, in `base_new`. The conversion may be
+    done in place.
+
+    Parameters
+    ----------
+    pmf : NumPy array
+        The probabilities.
+    base_old : float, 'linear'
+        The current (numerical) base of the probabilities.
+    base_new : float, 'linear'
+        The desired (numerical) base of the probabilities.
+
+    Returns
+    -------
+    pmf : NumPy array
+        The probabilities in `base_new`.
+
+    """
+    from dit.math import get_ops
+
+    ops_new = get_ops(base_new)
+
     # Determine the conversion targets.
-    islog_old = d.is_log()
-    if base_new == 'linear':
-        islog_new = False
-    else:
-        islog_new = True
+    islog_old = base_old != 'linear'
+    islog_new = base_new != 'linear'
 
     # Do the conversion!
     if islog_old and islog_new:
@@ -491,4 +512,53 @@ def numerical_test(dist):
     """
     if not all(is_number(o) for o in flatten(dist.outcomes)):
         msg = "The outcomes of this distribution are not numerical"
-        raise TypeError(msg)
\ No newline at end of file
+        raise TypeError(msg)
+
+
+def variable_labels(dist):
+    """
+    Returns the outcomes of `dist` as an integer array.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution whose outcomes are labeled.
+
+    Returns
+    -------
+    labels : NumPy array, shape (len(outcomes), outcome_length)
+        Each column assigns distinct integers to the distinct symbols of a
+        random variable.
+
+    """
+    try:
+        labels, _ = dist._outcome_codes() # pylint: disable=no-member
+    except (AttributeError, ditException):
+        outcomes = dist.outcomes
+        labels = np.empty((len(outcomes), dist.outcome_length()), dtype=int)
+        for i in range(labels.shape[1]):
+            lookup = {}
+            column = [outcome[i] for outcome in outcomes]
+            labels[:, i] = [lookup.setdefault(s, len(lookup)) for s in column]
+    return labels
+
+
+def group_labels(labels):
+    """
+    Returns compact labels for the joint values of several columns.
+
+    Parameters
+    ----------
+    labels : NumPy array, shape (n, k)
+        The labels of the random variables in the group.
+
+    Returns
+    -------
+    group : NumPy array, shape (n,)
+        Labels in ``range(m)``, where `m` is the number of distinct rows.
+
+    """
+    if labels.shape[1] == 0:
+        return np.zeros(len(labels), dtype=int)
+    _, group = np.unique(labels, axis=0, return_inverse=True)
+    return group.ravel()
@@ -2,22 +2,24 @@
 Non-cython methods for getting counts and distributions from data.
 """
 
+from itertools import islice
+
 import numpy as np
 
+from .segmentaxis import segment_axis
+from .. import modify_outcomes
+from ..exceptions import ditException
+
+# The largest number of distinct words or symbols which are counted by giving
+# each possible one a bin, rather than by sorting.
+_DENSE_LIMIT = 2**20
+
 try: # cython
 
     from .pycounts import counts_from_data, distribution_from_data
 
 except ImportError: # no cython
 
-    from boltons.iterutils import windowed_iter
-    from collections import Counter, defaultdict
-    from itertools import product
-
-    from .. import modify_outcomes
-    from ..exceptions import ditException
-
-
     def counts_from_data(data, hLength, fLength, marginals=True, alphabet=None, standardize=True):
         """
         Returns conditional counts from `data`.
@@ -70,36 +72,15 @@ except ImportError: # no cython
 
         Notes
         -----
-        This requires three complete passes through the data. One to obtain
-        the full alphabet. Another to standardize the data.  A final pass to
-        obtain the counts.
-
-        This is implemented densely.  So during the course of the algorithm,
-        we work with a large array containing a row for each possible history.
-        Only the rows corresponding to observed histories are returned.
+        This makes a single pass through the data with an `IncrementalCounts`,
+        which standardizes the data to integers, encodes every word as a
+        base-k integer and counts those with NumPy. Only the observed words
+        are ever stored.
 
         """
-        try:
-            data = list(map(tuple, data))
-        except TypeError:
-            pass
-        counts = Counter(windowed_iter(data, hLength+fLength))
-        cond_counts = defaultdict(lambda: defaultdict(int))
-        for word, count in counts.items():
-            cond_counts[word[:hLength]][word[hLength:]] += count
-
-        histories = sorted(counts.keys())
-        alphabet = set(alphabet) if alphabet is not None else set()
-        alphabet = tuple(sorted(alphabet.union(*[set(hist) for hist in histories])))
-
-        cCounts = np.empty((len(histories), len(alphabet)**fLength))
-        for i, hist in enumerate(histories):
-            for j, future in enumerate(product(alphabet, repeat=fLength)):
-                cCounts[i, j] = cond_counts[hist][future]
-
-        hCounts = cCounts.sum(axis=1)
-
-        return histories, cCounts, hCounts, alphabet
+        counter = IncrementalCounts(hLength, fLength, marginals=marginals, alphabet=alphabet)
+        counter.update(data)
+        return counter.counts()
 
 
     def distribution_from_data(d, L, trim=True, base=None):
@@ -129,26 +110,317 @@ except ImportError: # no cython
             value of `dit.ditParams['base']` is used.
 
         """
-        from dit import ditParams, Distribution
+        counter = IncrementalCounts(L, 0, marginals=False)
+        counter.update(d)
+        return counter.distribution(trim=trim, base=base)
+
+
+class IncrementalCounts(object):
+    """
+    Accumulate the counts of `counts_from_data` over a stream of chunks.
+
+    Words which straddle the boundary between two chunks are counted by
+    carrying the last `hLength + fLength - 1` symbols of each chunk over to the
+    next. Counters built over consecutive pieces of a stream, for example by
+    separate workers, can be combined with `merge`.
+
+    Examples
+    --------
+    >>> counter = IncrementalCounts(hLength=2, fLength=1)
+    >>> for chunk in chunks:
+    ...     counter.update(chunk)
+    >>> histories, cCounts, hCounts, alphabet = counter.counts()
+    """
 
-        try:
-            d = list(map(tuple, d))
-        except TypeError:
-            pass
+    def __init__(self, hLength, fLength, marginals=True, alphabet=None):
+        """
+        Initialize the counter.
+
+        Parameters
+        ----------
+        hLength : int
+            The maxmimum history word length used to calculate morphs.
+        fLength : int
+            The length of future words that defines the morph.
+        marginals : bool
+            If True, then the morphs for all histories words from L=0 to
+            L=hLength are calculated.  If False, only histories of length
+            L=hLength are calculated.
+        alphabet : list
+            Symbols to include in the alphabet in addition to those which
+            appear in the data.
+        """
+        self.hLength = hLength
+        self.fLength = fLength
+        self.marginals = marginals
+
+        length = hLength + fLength
+        self._overlap = max(length - 1, 0)
+
+        # Symbols are identified by the order in which they were first seen.
+        self._symbols = []
+        self._index = {}
+        self._ids(alphabet if alphabet is not None else [])
+
+        self._words = np.empty((0, length), dtype=np.int64)
+        self._counts = np.empty(0, dtype=np.int64)
+        self._head = np.empty(0, dtype=np.int64)
+        self._tail = np.empty(0, dtype=np.int64)
+        self._length = 0
+
+    def __len__(self):
+        """
+        The number of symbols seen so far.
+        """
+        return self._length
+
+    def _ids(self, symbols):
+        """
+        Identify `symbols`, adding any which are new.
+
+        Parameters
+        ----------
+        symbols : iterable
+            Distinct symbols.
+
+        Returns
+        -------
+        ids : np.ndarray
+            The identifier of each symbol.
+        """
+        ids = []
+        for symbol in symbols:
+            if symbol not in self._index:
+                self._index[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+            ids.append(self._index[symbol])
+        return np.array(ids, dtype=np.int64)
+
+    def _add(self, words, counts):
+        """
+        Add the counts of `words` to those seen so far.
+
+        Parameters
+        ----------
+        words : np.ndarray
+            An array of words, one per row, of symbol identifiers.
+        counts : np.ndarray
+            The count of each word.
+        """
+        if not len(words):
+            return
+
+        words = np.concatenate([self._words, words])
+        counts = np.concatenate([self._counts, counts])
+        words, index = _unique_words(words, len(self._symbols))
+        self._words = words
+        self._counts = np.bincount(index, weights=counts, minlength=len(words)).astype(np.int64)
+
+    def _count(self, ids):
+        """
+        Count the words in a sequence.
+
+        Parameters
+        ----------
+        ids : np.ndarray
+            A sequence of symbol identifiers.
+        """
+        length = self.hLength + self.fLength
+        if len(ids) < length or not length:
+            return
+
+        windows = segment_axis(ids, length=length, overlap=length - 1)
+        words, index = _unique_words(windows, len(self._symbols))
+        self._add(words, np.bincount(index))
+
+    def _join(self, head, tail, length):
+        """
+        Append a piece of the stream, whose own words have already been
+        counted, to the end of the stream seen so far.
+
+        Parameters
+        ----------
+        head : np.ndarray
+            The first symbols of the piece.
+        tail : np.ndarray
+            The last symbols of the piece.
+        length : int
+            The number of symbols in the piece.
+        """
+        self._count(np.concatenate([self._tail, head]))
+        overlap = self._overlap
+        self._head = np.concatenate([self._head, head])[:overlap]
+        self._tail = np.concatenate([self._tail, tail])[-overlap:] if overlap else tail[:0]
+        self._length += length
+
+    def update(self, data, chunksize=2**20):
+        """
+        Count the words in `data`, as the continuation of the stream seen so
+        far.
+
+        Parameters
+        ----------
+        data : iterable
+            The next piece of the stream. This can be any sequence, including a
+            NumPy array or memmap, which is read `chunksize` symbols at a
+            time, or an iterator.
+        chunksize : int
+            The number of symbols to hold in memory at once.
+
+        Returns
+        -------
+        self : IncrementalCounts
+            The updated counter.
+        """
+        overlap = self._overlap
+        for block in _chunks(data, chunksize):
+            symbols, codes = _standardize(block)
+            if not len(codes):
+                continue
+
+            ids = self._ids(symbols)[codes]
+            self._count(ids)
+            self._join(ids[:overlap], ids[-overlap:] if overlap else ids[:0], len(ids))
+
+        return self
+
+    def merge(self, other):
+        """
+        Merge the counts of `other`, which are taken to immediately follow the
+        stream seen by `self`.
+
+        Parameters
+        ----------
+        other : IncrementalCounts
+            The counts of the next piece of the stream.
+
+        Returns
+        -------
+        self : IncrementalCounts
+            The merged counter.
+
+        Raises
+        ------
+        ditException
+            Raised if the two counters count different words.
+        """
+        if (self.hLength, self.fLength) != (other.hLength, other.fLength):
+            msg = "Cannot merge counts of words with different lengths."
+            raise ditException(msg)
+
+        ids = self._ids(other._symbols)
+        self._add(ids[other._words], other._counts)
+        self._join(ids[other._head], ids[other._tail], other._length)
+
+        return self
+
+    def _sorted_words(self):
+        """
+        The words seen so far, in terms of the sorted alphabet.
+
+        Returns
+        -------
+        alphabet : tuple
+            The ordered tuple representing the alphabet of the data.
+        words : np.ndarray
+            The words, one per row, as indices into `alphabet`.
+        """
+        order = sorted(range(len(self._symbols)), key=self._symbols.__getitem__)
+        alphabet = tuple(self._symbols[i] for i in order)
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        return alphabet, rank[self._words]
+
+    def counts(self):
+        """
+        Return the conditional counts of the stream seen so far.
+
+        Returns
+        -------
+        histories : list
+            A list of observed histories, corresponding to the rows in
+            `cCounts`.
+        cCounts : NumPy array
+            A NumPy array representing conditional counts. The rows correspond
+            to the observed histories. The number of columns is equal to the
+            alphabet size raised to the `fLength` power.
+        hCounts : NumPy array
+            A 1D array representing the count of each history word.
+        alphabet : tuple
+            The ordered tuple representing the alphabet of the data.
+
+        Notes
+        -----
+        Histories are ordered as by the compiled `counts_from_data`: by length,
+        and then by their symbols read from the most recent one. Futures are
+        ordered as `itertools.product(alphabet, repeat=fLength)`.
+        """
+        hLength, fLength = self.hLength, self.fLength
+        alphabet, codes = self._sorted_words()
+        k = len(alphabet)
+        nFutures = k**fLength
+
+        # Futures are read with their first symbol most significant.
+        futures = codes[:, hLength:].dot(k**np.arange(fLength - 1, -1, -1, dtype=np.int64))
+
+        # Histories are ordered by length and then, as on the k-ary tree of
+        # counts.c, with their most recent symbol most significant.
+        lengths = range(hLength + 1) if self.marginals else [hLength]
+        histories = []
+        rows = []
+        if len(codes):
+            for L in lengths:
+                if L:
+                    hists, index = _unique_words(codes[:, hLength - L:hLength][:, ::-1], k)
+                else:
+                    hists, index = np.empty((1, 0), dtype=np.int64), np.zeros(len(codes), dtype=np.int64)
+                rows.append(index + len(histories))
+                histories.extend(tuple(alphabet[i] for i in reversed(hist)) for hist in hists.tolist())
+
+        cells = np.concatenate(rows + [np.empty(0, dtype=np.int64)]) * nFutures
+        cells += np.tile(futures, len(rows))
+        weights = np.tile(self._counts, len(rows))
+        cCounts = np.bincount(cells, weights=weights, minlength=len(histories) * nFutures)
+        cCounts = cCounts.astype(np.int64).reshape(len(histories), nFutures)
+        hCounts = cCounts.sum(axis=1)
+
+        return histories, cCounts, hCounts, alphabet
+
+    def distribution(self, trim=True, base=None):
+        """
+        Return the distribution over words of length `hLength + fLength` of
+        the stream seen so far, as `distribution_from_data` does.
+
+        Parameters
+        ----------
+        trim : bool
+            If true, then words with zero probability are trimmed from the
+            distribution.
+        base : int or string
+            The desired base of the returned distribution. If `None`, then the
+            value of `dit.ditParams['base']` is used.
+
+        Returns
+        -------
+        dist : Distribution
+            The naive estimate of the distribution over words.
+        """
+        from dit import ditParams, Distribution
 
         if base is None:
             base = ditParams['base']
 
-        words, _, counts, _ = counts_from_data(d, L, 0)
+        alphabet, codes = self._sorted_words()
+        words = [tuple(alphabet[i] for i in word) for word in codes.tolist()]
 
         # We turn the counts to probabilities
-        pmf = counts/counts.sum()
+        pmf = self._counts/self._counts.sum()
 
         dist = Distribution(words, pmf, trim=trim)
 
         dist.set_base(base)
 
-        if L == 1:
+        if self.hLength + self.fLength == 1:
             try:
                 dist = modify_outcomes(dist, lambda o: o[0])
             except ditException:
@@ -157,6 +429,139 @@ except ImportError: # no cython
         return dist
 
 
+def _standardize(block):
+    """
+    Standardize a sequence of symbols to integers.
+
+    Parameters
+    ----------
+    block : sequence
+        The symbols. Elements which are themselves sequences are treated as
+        tuples.
+
+    Returns
+    -------
+    symbols : list
+        The sorted distinct symbols of `block`.
+    codes : np.ndarray
+        `block`, with each symbol replaced by its index in `symbols`.
+    """
+    if isinstance(block, np.ndarray) and block.dtype.kind in 'biuf':
+        if block.ndim == 1 and block.dtype.kind in 'iu' and len(block):
+            low = int(block.min())
+            size = int(block.max()) - low + 1
+            if size <= _DENSE_LIMIT:
+                symbols, codes = _dense_unique(block.astype(np.int64) - low, size)
+                return (symbols + low).tolist(), codes
+        if block.ndim == 1:
+            symbols, codes = np.unique(block, return_inverse=True)
+            return symbols.tolist(), codes.astype(np.int64)
+        elif block.ndim == 2 and len(block):
+            symbols, codes = np.unique(block, axis=0, return_inverse=True)
+            return [tuple(symbol) for symbol in symbols.tolist()], codes.astype(np.int64)
+        block = block.tolist()
+
+    try:
+        block = list(map(tuple, block))
+    except TypeError:
+        block = list(block)
+    symbols = sorted(set(block))
+    index = {symbol: i for i, symbol in enumerate(symbols)}
+    codes = np.fromiter((index[symbol] for symbol in block), dtype=np.int64, count=len(block))
+    return symbols, codes
+
+
+def _unique_words(words, k):
+    """
+    Find the distinct words in `words`.
+
+    Words are encoded as base-`k` integers when these fit in 63 bits, which is
+    much faster than comparing them row by row.
+
+    Parameters
+    ----------
+    words : np.ndarray
+        An array of words, one per row, of symbol codes less than `k`.
+    k : int
+        The number of symbols.
+
+    Returns
+    -------
+    unique : np.ndarray
+        The distinct words.
+    index : np.ndarray
+        The index into `unique` of each word.
+    """
+    length = words.shape[1]
+    k = max(k, 2)
+    if length * np.log2(k) < 63:
+        powers = k**np.arange(length - 1, -1, -1, dtype=np.int64)
+        codes = words.dot(powers)
+        if k**length <= _DENSE_LIMIT:
+            # Counting sort: every possible word gets a bin.
+            codes, index = _dense_unique(codes, k**length)
+        else:
+            codes, index = np.unique(codes, return_inverse=True)
+        unique = (codes[:, np.newaxis] // powers) % k
+    else:
+        unique, index = np.unique(words, axis=0, return_inverse=True)
+    return unique, index
+
+
+def _dense_unique(values, size):
+    """
+    Find the distinct values of an array of small non-negative integers.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Integers in [0, `size`).
+    size : int
+        An upper bound on `values`.
+
+    Returns
+    -------
+    unique : np.ndarray
+        The sorted distinct values.
+    index : np.ndarray
+        The index into `unique` of each value.
+    """
+    unique = np.flatnonzero(np.bincount(values, minlength=size))
+    lookup = np.zeros(size, dtype=np.int64)
+    lookup[unique] = np.arange(len(unique))
+    return unique, lookup[values]
+
+
+def _chunks(data, chunksize):
+    """
+    Split `data` into pieces of at most `chunksize` symbols.
+
+    Parameters
+    ----------
+    data : iterable
+        A sequence or iterator of symbols.
+    chunksize : int
+        The maximum length of each piece.
+
+    Yields
+    ------
+    chunk : sequence
+        The next piece of `data`.
+    """
+    try:
+        length = len(data)
+        data[0:0]
+    except TypeError:
+        iterator = iter(data)
+        chunk = list(islice(iterator, chunksize))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, chunksize))
+    else:
+        for start in range(0, length, chunksize):
+            yield data[start:start + chunksize]
+
+
 def get_counts(data, length):
     """
     Count the occurrences of all words of `length` in `data`.
@@ -4,8 +4,13 @@ Tests for dit.inference.pycounts
 
 from __future__ import division
 
+import pytest
+
+import numpy as np
+
 from dit import Distribution
-from dit.inference import distribution_from_data
+from dit.inference import IncrementalCounts, distribution_from_data
+from dit.inference.counts import counts_from_data
 
 
 def test_dfd():
@@ -19,3 +24,73 @@ def test_dfd():
     d2_ = distribution_from_data(data, 2, base='linear')
     assert d1.is_approx_equal(d1_)
     assert d2.is_approx_equal(d2_)
+
+
+def test_counts():
+    """
+    Test counts_from_data against known counts.
+    """
+    data = [0, 0, 0, 1, 1, 1]
+    histories, cCounts, hCounts, alphabet = counts_from_data(data, 1, 1)
+    assert histories == [(), (0,), (1,)]
+    assert np.array_equal(cCounts, [[2, 3], [2, 1], [0, 2]])
+    assert np.array_equal(hCounts, [5, 3, 2])
+    assert tuple(alphabet) == (0, 1)
+
+
+@pytest.mark.parametrize(('hLength', 'fLength', 'marginals'), [
+    (2, 1, True),
+    (2, 1, False),
+    (0, 2, True),
+    (3, 0, False),
+])
+@pytest.mark.parametrize('chunksize', [1, 3, 50])
+def test_incremental(hLength, fLength, marginals, chunksize):
+    """
+    Test that counting in chunks agrees with counting all at once.
+    """
+    data = np.random.randint(0, 3, 200)
+    expected = counts_from_data(data, hLength, fLength, marginals=marginals)
+    counter = IncrementalCounts(hLength, fLength, marginals=marginals)
+    counter.update(iter(data), chunksize=chunksize)
+    histories, cCounts, hCounts, alphabet = counter.counts()
+    assert histories == expected[0]
+    assert np.array_equal(cCounts, expected[1])
+    assert np.array_equal(hCounts, expected[2])
+    assert tuple(alphabet) == tuple(expected[3])
+
+
+def test_incremental_merge():
+    """
+    Test that merging the counts of consecutive pieces agrees with counting
+    the whole.
+    """
+    data = np.random.randint(0, 2, 100)
+    counters = [IncrementalCounts(2, 1).update(part) for part in np.split(data, [1, 2, 40])]
+    counter = counters[0]
+    for other in counters[1:]:
+        counter.merge(other)
+    assert len(counter) == 100
+    assert np.array_equal(counter.counts()[1], counts_from_data(data, 2, 1)[1])
+    assert counter.distribution().is_approx_equal(distribution_from_data(data, 3))
+
+
+@pytest.mark.parametrize(('data', 'length'), [
+    ([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9, 3, 2, 3, 8, 4], 3),
+    ([(0, 1), (1, 1), (0, 1), (0, 0)] * 5, 2),
+    (np.random.randint(0, 2, (20, 2)), 2),
+    (np.random.randint(-10**6, 10**6, 50), 2),
+    (np.random.randint(0, 5, 100), 30),
+])
+def test_counts_words(data, length):
+    """
+    Test the word counts against a direct count, for each way words are
+    encoded.
+    """
+    symbols = [tuple(x) if np.ndim(x) else x for x in (data.tolist() if isinstance(data, np.ndarray) else data)]
+    expected = {}
+    for i in range(len(symbols) - length + 1):
+        word = tuple(symbols[i:i + length])
+        expected[word] = expected.get(word, 0) + 1
+    histories, _, hCounts, _ = counts_from_data(data, length, 0, marginals=False)
+    assert dict(zip(histories, hCounts.tolist())) == expected
@@ -2,9 +2,11 @@
 The co-information aka the multivariate mututal information.
 """
 
+import numpy as np
+
 from ..helpers import normalize_rvs
-from ..shannon import conditional_entropy as H
-from ..utils import powerset, unitful
+from ..shannon import all_entropies
+from ..utils import unitful
 
 
 @unitful
@@ -152,12 +154,10 @@ def coinformation(dist, rvs=None, crvs=None, rv_mode=None):
     """
     rvs, crvs, rv_mode = normalize_rvs(dist, rvs, crvs, rv_mode)
 
-    def entropy(rvs, dist=dist, crvs=crvs, rv_mode=rv_mode):
-        """
-        Helper function to aid in computing the entropy of subsets.
-        """
-        return H(dist, set().union(*rvs), crvs, rv_mode=rv_mode)
+    # The entropies of all subsets of `rvs`, indexed by bitmask.
+    Hs = all_entropies(dist, rvs, crvs, rv_mode=rv_mode)
+    sizes = np.array([bin(mask).count('1') for mask in range(len(Hs))])
 
-    I = sum((-1)**(len(Xs)+1) * entropy(Xs) for Xs in powerset(rvs))
+    I = np.sum((-1)**(sizes+1) * Hs)
 
     return I
@@ -130,6 +130,28 @@ class MarkovVarOptimizer(BaseAuxVarOptimizer):
 
         return joint
 
+    def _backprop_joint(self, x, grad):
+        """
+        Pull a gradient with respect to the joint distribution back through
+        `construct_joint` to the optimization vector.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            An optimization vector.
+        grad : np.ndarray
+            The gradient of some function with respect to the joint
+            distribution, ``construct_joint(x)``.
+
+        Returns
+        -------
+        jac : np.ndarray
+            The gradient of that function with respect to `x`.
+        """
+        grad = np.moveaxis(grad, -1, 1)  # restore W
+        grad = np.moveaxis(grad, -1, 1)  # restore crvs
+        return super(MarkovVarOptimizer, self)._backprop_joint(x, grad)
+
     def construct_full_joint(self, x):
         """
         Construct the joint distribution.
@@ -173,7 +195,8 @@ class MarkovVarOptimizer(BaseAuxVarOptimizer):
         Construct a functional form of the optimizer.
         """
         @unitful
-        def common_info(dist, rvs=None, crvs=None, niter=None, maxiter=1000, polish=1e-6, bound=None, rv_mode=None):
+        def common_info(dist, rvs=None, crvs=None, niter=None, maxiter=1000, polish=1e-6, bound=None, rv_mode=None,
+                        n_jobs=None, executor=None):
             dtc = dual_total_correlation(dist, rvs, crvs, rv_mode)
             ent = entropy(dist, rvs, crvs, rv_mode)
             if np.isclose(dtc, ent):
@@ -183,7 +206,7 @@ class MarkovVarOptimizer(BaseAuxVarOptimizer):
                 return dtc
 
             ci = cls(dist, rvs, crvs, bound, rv_mode)
-            ci.optimize(niter=niter, maxiter=maxiter, polish=polish)
+            ci.optimize(niter=niter, maxiter=maxiter, polish=polish, n_jobs=n_jobs, executor=executor)
             return ci.objective(ci._optima)
 
         common_info.__doc__ = \
@@ -221,6 +244,13 @@ class MarkovVarOptimizer(BaseAuxVarOptimizer):
             to 'names', the the elements are interpreted as random variable names.
             If `None`, then the value of `dist._rv_mode` is consulted, which
             defaults to 'indices'.
+        n_jobs : int, None
+            The number of workers among which any random restarts of the
+            optimization are divided. If None and `executor` is None, they are
+            performed serially.
+        executor : str, Executor, None
+            How to run the random restarts in parallel: 'process', 'thread', or
+            a `concurrent.futures.Executor`.
 
         Returns
         -------
@@ -237,7 +267,8 @@ class MinimizingMarkovVarOptimizer(MarkovVarOptimizer):  # pragma: no cover
     of the auxiliary variable.
     """
 
-    def optimize(self, x0=None, niter=None, maxiter=None, polish=1e-6, callback=False, minimize=True, min_niter=15):
+    def optimize(self, x0=None, niter=None, maxiter=None, polish=1e-6, callback=False, minimize=True, min_niter=15,
+                 n_jobs=None, executor=None):
         """
         Parameters
         ----------
@@ -259,13 +290,21 @@ class MinimizingMarkovVarOptimizer(MarkovVarOptimizer):  # pragma: no cover
             Whether to minimize the auxiliary variable or not.
         min_niter : int
             The number of basin hops to make during the minimization of the common variable.
+        n_jobs : int, None
+            The number of workers for the random restarts. See
+            :meth:`BaseOptimizer.optimize`.
+        executor : str, Executor, None
+            How to run the random restarts in parallel. See
+            :meth:`BaseOptimizer.optimize`.
         """
         # call the normal optimizer
         super(MinimizingMarkovVarOptimizer, self).optimize(x0=x0,
                                                            niter=niter,
                                                            maxiter=maxiter,
                                                            polish=False,
-                                                           callback=callback)
+                                                           callback=callback,
+                                                           n_jobs=n_jobs,
+                                                           executor=executor)
         if minimize:
             # minimize the entropy of W
             self._post_process(style='entropy', minmax='min', niter=min_niter, maxiter=maxiter)
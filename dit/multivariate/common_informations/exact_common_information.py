@@ -67,7 +67,7 @@ class ExactCommonInformation(MarkovVarOptimizer):
             pmf = self.construct_joint(x)
             return entropy(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, entropy.gradient)
 
 
 exact_common_information = ExactCommonInformation.functional()
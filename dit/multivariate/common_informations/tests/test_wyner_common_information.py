@@ -93,3 +93,13 @@ def test_wci4(i, x0):
     x0['x0'] = wci._optima.copy()
     c = wci.objective(wci._optima)
     assert c == pytest.approx(C_sbec(p), abs=1e-3)
+
+
+@pytest.mark.flaky(reruns=5)
+def test_wci_executor():
+    """
+    Test that the functional accepts the parallel optimization arguments.
+    """
+    gm = D([(0,0), (0,1), (1,0)], [1/3]*3)
+    c = C(gm, bound=2, n_jobs=2, executor='thread')
+    assert c == pytest.approx(2/3, abs=1e-3)
@@ -59,7 +59,7 @@ class WynerCommonInformation(MarkovVarOptimizer):
             pmf = self.construct_joint(x)
             return conditional_mutual_information(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, conditional_mutual_information.gradient)
 
 
 wyner_common_information = WynerCommonInformation.functional()
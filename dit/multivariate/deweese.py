@@ -1,12 +1,31 @@
 """
 Information measures based on Mike DeWeese's multivariate mutual information.
+
+The exact DeWeese measures maximize a measure over every deterministic
+function of each variable, that is, over every partition of each variable's
+alphabet. Candidates are evaluated on a dense pmf tensor: applying a
+partition sums the slices of its blocks together, and the partitions of the
+last variable are applied to all at once. Symbols whose slices of the tensor
+are identical are interchangeable, so partitions differing only by
+exchanging them are evaluated once.
 """
+
 from itertools import product
 
+import multiprocessing
+
+import numpy as np
+
 from ..algorithms import BaseAuxVarOptimizer
 from ..distconst import RVFunctions, insert_rvf
-from ..helpers import normalize_rvs
-from ..utils import extended_partition, partitions, unitful
+from ..helpers import normalize_rvs, variable_labels
+from ..npdist import Distribution
+from ..utils import extended_partition, partitions, powerset, unitful
+from ..utils.parallel import map_in_pool
+from .caekl_mutual_information import caekl_mutual_information
+from .coinformation import coinformation
+from .dual_total_correlation import dual_total_correlation
+from .total_correlation import total_correlation
 
 
 __all__ = [
@@ -17,6 +36,271 @@ __all__ = [
 ]
 
 
+def _dense_coinformation(h, n):
+    """
+    The co-information of `n` variables, from their conditional entropies.
+    """
+    return -sum((-1)**len(sub) * h(sub) for sub in powerset(range(n)) if sub)
+
+
+def _dense_total_correlation(h, n):
+    """
+    The total correlation of `n` variables, from their conditional entropies.
+    """
+    return sum(h((i,)) for i in range(n)) - h(tuple(range(n)))
+
+
+def _dense_dual_total_correlation(h, n):
+    """
+    The dual total correlation of `n` variables, from their conditional
+    entropies.
+    """
+    rvs = tuple(range(n))
+    return sum(h(rvs[:i] + rvs[i + 1:]) for i in rvs) - (n - 1) * h(rvs)
+
+
+def _dense_caekl_mutual_information(h, n):
+    """
+    The CAEKL mutual information of `n` variables, from their conditional
+    entropies.
+    """
+    rvs = tuple(range(n))
+    candidates = [(sum(h(tuple(sorted(p))) for p in part) - h(rvs)) / (len(part) - 1)
+                  for part in partitions(rvs) if len(part) > 1]
+    return np.min(candidates, axis=0)
+
+
+_DENSE_MEASURES = {
+    coinformation: _dense_coinformation,
+    total_correlation: _dense_total_correlation,
+    dual_total_correlation: _dense_dual_total_correlation,
+    caekl_mutual_information: _dense_caekl_mutual_information,
+}
+
+
+def _batch_measure(mmi, n):
+    """
+    Construct a function evaluating `mmi` on a batch of dense pmfs.
+
+    Parameters
+    ----------
+    mmi : func
+        A multivariate mutual information.
+    n : int
+        The number of variables of interest. Each pmf has an axis for each,
+        followed by an axis for the variable conditioned on.
+
+    Returns
+    -------
+    measure : func
+        A function taking an array of pmfs, stacked along its first axis, to
+        the array of their values.
+    """
+    if mmi in _DENSE_MEASURES:
+        dense = _DENSE_MEASURES[mmi]
+
+        def measure(pmfs):
+            cache = {}
+
+            def joint_entropy(rvs):
+                if rvs not in cache:
+                    axes = tuple(i + 1 for i in range(n) if i not in rvs)
+                    pmf = pmfs.sum(axis=axes).reshape(len(pmfs), -1)
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        cache[rvs] = -np.nansum(pmf * np.log2(pmf), axis=1)
+                return cache[rvs]
+
+            return dense(lambda rvs: joint_entropy(rvs) - joint_entropy(()), n)
+
+    else:
+        rvs = [[i] for i in range(n)]
+        crvs = [n]
+
+        def measure(pmfs):
+            values = []
+            for pmf in pmfs:
+                support = np.nonzero(pmf)
+                d = Distribution(list(zip(*support)), pmf[support])
+                values.append(mmi(d, rvs=rvs, crvs=crvs))
+            return np.array(values, dtype=float)
+
+    return measure
+
+
+def _symbol_classes(pmf, axis):
+    """
+    Label the symbols of a variable by their slice of the pmf, so that
+    symbols with the same label can be exchanged without changing the
+    distribution.
+
+    Parameters
+    ----------
+    pmf : np.ndarray
+        The dense pmf.
+    axis : int
+        The axis of the variable.
+
+    Returns
+    -------
+    classes : np.ndarray
+        The class of each symbol.
+    """
+    slices = np.moveaxis(pmf, axis, 0).reshape(pmf.shape[axis], -1)
+    _, classes = np.unique(slices, axis=0, return_inverse=True)
+    return classes
+
+
+def _partition_maps(classes):
+    """
+    The partitions of a variable's alphabet, as maps from its symbols to
+    their blocks, keeping one partition from each set which are equivalent
+    under exchanging interchangeable symbols.
+
+    Parameters
+    ----------
+    classes : np.ndarray
+        The class of each symbol, as from `_symbol_classes`.
+
+    Returns
+    -------
+    maps : list of np.ndarray
+        The block of each symbol, for each partition.
+    """
+    n_classes = classes.max() + 1
+    seen = set()
+    maps = []
+    for part in partitions(range(len(classes))):
+        # Up to exchanging symbols within classes, a partition is determined
+        # by how many symbols of each class each of its blocks holds.
+        blocks = [tuple(block) for block in part]
+        key = tuple(sorted(tuple(np.bincount(classes[list(block)], minlength=n_classes))
+                           for block in blocks))
+        if key in seen:
+            continue
+        seen.add(key)
+        labels = np.empty(len(classes), dtype=int)
+        for i, block in enumerate(sorted(blocks)):
+            labels[list(block)] = i
+        maps.append(labels)
+    return maps
+
+
+def _coarse_grain(pmf, axis, labels):
+    """
+    Apply a function to one variable of a dense pmf.
+
+    Parameters
+    ----------
+    pmf : np.ndarray
+        The dense pmf.
+    axis : int
+        The axis of the variable.
+    labels : np.ndarray
+        The value of the function on each symbol of the variable.
+
+    Returns
+    -------
+    coarse : np.ndarray
+        The pmf, with the variable replaced by the function of it.
+    """
+    pmf = np.moveaxis(pmf, axis, 0)
+    coarse = np.zeros((labels.max() + 1,) + pmf.shape[1:])
+    np.add.at(coarse, labels, pmf)
+    return np.moveaxis(coarse, 0, axis)
+
+
+def _search(measure, pmf, maps, combos):
+    """
+    Find the best of the candidates formed by following each of `combos` with
+    every partition of the last variable.
+
+    Parameters
+    ----------
+    measure : func
+        The batched measure, as from `_batch_measure`.
+    pmf : np.ndarray
+        The dense pmf.
+    maps : list of lists of np.ndarray
+        The partitions of each variable, as from `_partition_maps`.
+    combos : list of tuples
+        The indices of the partitions of all but the last variable.
+
+    Returns
+    -------
+    best : tuple
+        The best value, and the indices of the partitions achieving it.
+    """
+    last = len(maps) - 1
+    size = pmf.shape[last]
+    # Each partition of the last variable as a matrix summing its blocks.
+    blocks = np.zeros((len(maps[last]), size, size))
+    for i, labels in enumerate(maps[last]):
+        blocks[i, np.arange(size), labels] = 1
+
+    best = None
+    prefix, coarse = (), [pmf]
+    for combo in combos:
+        # Consecutive combos share a prefix, whose coarse-graining is kept.
+        shared = 0
+        while shared < len(prefix) and prefix[shared] == combo[shared]:
+            shared += 1
+        del coarse[shared + 1:]
+        for axis in range(shared, last):
+            coarse.append(_coarse_grain(coarse[-1], axis, maps[axis][combo[axis]]))
+        prefix = combo
+
+        pmfs = np.moveaxis(np.tensordot(coarse[-1], blocks, axes=([last], [1])), -2, 0)
+        pmfs = np.moveaxis(pmfs, -1, last + 1)
+        values = measure(pmfs)
+        i = int(np.argmax(values))
+        if best is None or values[i] > best[0]:
+            best = (values[i], combo + (i,))
+
+    return best
+
+
+def _search_parallel(measure, pmf, maps, combos, n_jobs=None, executor=None):
+    """
+    Find the best candidate, dividing `combos` between workers if requested.
+
+    Parameters
+    ----------
+    measure : func
+        The batched measure, as from `_batch_measure`.
+    pmf : np.ndarray
+        The dense pmf.
+    maps : list of lists of np.ndarray
+        The partitions of each variable, as from `_partition_maps`.
+    combos : list of tuples
+        The indices of the partitions of all but the last variable.
+    n_jobs : int, None
+        The number of workers. If None and `executor` is None, the search is
+        serial.
+    executor : str, Executor, None
+        'process' or 'thread' to create a pool of `n_jobs` workers, or a
+        `concurrent.futures.Executor` to submit the chunks to.
+
+    Returns
+    -------
+    best : tuple
+        The best value, and the indices of the partitions achieving it.
+    """
+    if (n_jobs is None and executor is None) or len(combos) < 2:
+        return _search(measure, pmf, maps, combos)
+
+    if n_jobs is None or n_jobs < 1:
+        n_jobs = multiprocessing.cpu_count()
+    n_jobs = min(n_jobs, len(combos))
+    # Contiguous chunks keep the prefixes the workers share.
+    bounds = np.linspace(0, len(combos), 4 * n_jobs + 1).astype(int)
+    chunks = [combos[a:b] for a, b in zip(bounds[:-1], bounds[1:]) if a < b]
+
+    results = map_in_pool(_search, [(chunk,) for chunk in chunks], n_jobs=n_jobs,
+                          executor=executor, shared=(measure, pmf, maps))
+    # Break ties in favor of the earliest candidate, as the serial search does.
+    return max(results, key=lambda result: (result[0], [-i for i in result[1]]))
+
+
 def deweese_constructor(mmi):
     """
     Construct a DeWeese-like multivariate mutual information.
@@ -24,7 +308,10 @@ def deweese_constructor(mmi):
     Parameters
     ----------
     mmi : func
-        A multivariate mutual information.
+        A multivariate mutual information. The co-information, total
+        correlation, dual total correlation and CAEKL mutual information are
+        evaluated directly on dense pmfs; other measures are evaluated on a
+        distribution constructed for each candidate.
 
     Returns
     -------
@@ -32,7 +319,7 @@ def deweese_constructor(mmi):
         A DeWeese'd form of `mmi`.
     """
     @unitful
-    def deweese(dist, rvs=None, crvs=None, return_opt=False, rv_mode=None):
+    def deweese(dist, rvs=None, crvs=None, return_opt=False, rv_mode=None, n_jobs=None, executor=None):
         """
         Compute the DeWeese form of {name}.
 
@@ -54,6 +341,15 @@ def deweese_constructor(mmi):
             equal to 'names', the the elements are interpreted as random
             variable names. If `None`, then the value of `dist._rv_mode` is
             consulted, which defaults to 'indices'.
+        n_jobs : int, None
+            The number of workers to divide the search between. If less than
+            one, use one per CPU. If None and `executor` is None, the search
+            is serial.
+        executor : str, Executor, None
+            Either 'process' (the default when `n_jobs` is given) or 'thread'
+            to create a pool of `n_jobs` workers, or a
+            `concurrent.futures.Executor` to submit the search to. A
+            process-based executor must be able to pickle the measure.
 
         Returns
         -------
@@ -67,38 +363,38 @@ def deweese_constructor(mmi):
 
         dist = dist.coalesce(rvs + [crvs])
 
-        new_rvs = [[i + len(rvs) + 1] for i, _ in enumerate(rvs)]
-
-        new_crvs = [dist.outcome_length() - 1]
+        # The dense pmf, with an axis per variable indexing the symbols it
+        # takes with nonzero probability.
+        labels = variable_labels(dist)
+        firsts, index = zip(*[np.unique(column, return_index=True, return_inverse=True)[1:]
+                              for column in labels.T])
+        pmf = np.zeros([len(first) for first in firsts])
+        np.add.at(pmf, index, dist.copy(base='linear').pmf)
 
-        rvf = RVFunctions(dist)
+        n = len(rvs)
+        maps = [_partition_maps(_symbol_classes(pmf, i)) for i in range(n)]
+        combos = list(product(*[range(len(m)) for m in maps[:-1]]))
+        measure = _batch_measure(mmi, n)
 
-        def all_funcs():
-            """
-            A generator to construct all possible functions of the variables.
+        opt_val, opt = _search_parallel(measure, pmf, maps, combos, n_jobs=n_jobs, executor=executor)
+        opt_val = float(opt_val)
 
-            Yields
-            ------
-            d : Distribution
-                A distribution with additional indices corresponding
-                to functions of those variables.
-            """
-            partss = [partitions(set([(o[i],) for o in dist.outcomes])) for i, _ in enumerate(rvs)]
-            for parts in product(*partss):
-                d = dist.copy()
-                for i, part in enumerate(parts):
-                    new_part = extended_partition(d.outcomes, [i], part, d._outcome_ctor)
-                    d = insert_rvf(d, rvf.from_partition(new_part))
-                yield d
+        if not return_opt:
+            return opt_val
 
-        possibilities = ((mmi(d, rvs=new_rvs, crvs=new_crvs), d) for d in all_funcs())
+        rvf = RVFunctions(dist)
 
-        opt_val, opt_d = max(possibilities, key=lambda t: t[0])
+        outcomes = dist.outcomes
+        opt_d = dist.copy()
+        for i, j in enumerate(opt):
+            symbols = [(outcomes[k][i],) for k in firsts[i]]
+            blocks = maps[i][j]
+            part = frozenset(frozenset(symbol for symbol, block in zip(symbols, blocks) if block == b)
+                             for b in range(blocks.max() + 1))
+            new_part = extended_partition(opt_d.outcomes, [i], part, opt_d._outcome_ctor)
+            opt_d = insert_rvf(opt_d, rvf.from_partition(new_part))
 
-        if return_opt:
-            return opt_val, opt_d
-        else:
-            return opt_val
+        return opt_val, opt_d
 
     deweese.__doc__ = deweese.__doc__.format(name=mmi.__name__)
 
@@ -235,7 +531,7 @@ class DeWeeseCoInformation(BaseDeWeeseOptimizer):
             pmf = self.construct_joint(x)
             return -coi(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, coi.gradient, sign=-1)
 
 
 deweese_coinformation = DeWeeseCoInformation.functional()
@@ -277,7 +573,7 @@ class DeWeeseTotalCorrelation(BaseDeWeeseOptimizer):
             pmf = self.construct_joint(x)
             return -tc(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, tc.gradient, sign=-1)
 
 
 deweese_total_correlation = DeWeeseTotalCorrelation.functional()
@@ -319,7 +615,7 @@ class DeWeeseDualTotalCorrelation(BaseDeWeeseOptimizer):
             pmf = self.construct_joint(x)
             return -dtc(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, dtc.gradient, sign=-1)
 
 
 deweese_dual_total_correlation = DeWeeseDualTotalCorrelation.functional()
@@ -361,7 +657,7 @@ class DeWeeseCAEKLMutualInformation(BaseDeWeeseOptimizer):
             pmf = self.construct_joint(x)
             return -caekl(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, caekl.gradient, sign=-1)
 
 
 deweese_caekl_mutual_information = DeWeeseCAEKLMutualInformation.functional()
@@ -94,9 +94,10 @@ class BaseIntrinsicMutualInformation(BaseAuxVarOptimizer):
         Construct a functional form of the optimizer.
         """
         @unitful
-        def intrinsic(dist, rvs=None, crvs=None, niter=None, bound=None, rv_mode=None):
+        def intrinsic(dist, rvs=None, crvs=None, niter=None, bound=None, rv_mode=None,
+                      n_jobs=None, executor=None):
             opt = cls(dist, rvs=rvs, crvs=crvs, rv_mode=rv_mode, bound=bound)
-            opt.optimize(niter=niter)
+            opt.optimize(niter=niter, n_jobs=n_jobs, executor=executor)
             return opt.objective(opt._optima)
 
         intrinsic.__doc__ = \
@@ -127,6 +128,13 @@ class BaseIntrinsicMutualInformation(BaseAuxVarOptimizer):
             equal to 'names', the the elements are interpreted as random
             variable names. If `None`, then the value of `dist._rv_mode` is
             consulted, which defaults to 'indices'.
+        n_jobs : int, None
+            The number of workers among which any random restarts of the
+            optimization are divided. If None and `executor` is None, they are
+            performed serially.
+        executor : str, Executor, None
+            How to run the random restarts in parallel: 'process', 'thread', or
+            a `concurrent.futures.Executor`.
         """.format(name=cls.name)
 
         return intrinsic
@@ -206,14 +214,15 @@ class BaseMoreIntrinsicMutualInformation(BaseAuxVarOptimizer):
         Construct a functional form of the optimizer.
         """
         @unitful
-        def intrinsic(dist, rvs=None, crvs=None, niter=None, bounds=None, rv_mode=None):
+        def intrinsic(dist, rvs=None, crvs=None, niter=None, bounds=None, rv_mode=None,
+                      n_jobs=None, executor=None):
             if bounds is None:
                 bounds = (2, 3, 4, None)
 
             candidates = []
             for bound in bounds:
                 opt = cls(dist, rvs=rvs, crvs=crvs, bound=bound, rv_mode=rv_mode)
-                opt.optimize(niter=niter)
+                opt.optimize(niter=niter, n_jobs=n_jobs, executor=executor)
                 candidates.append(opt.objective(opt._optima))
             return min(candidates)
 
@@ -245,6 +254,13 @@ class BaseMoreIntrinsicMutualInformation(BaseAuxVarOptimizer):
                 equal to 'names', the the elements are interpreted as random
                 variable names. If `None`, then the value of `dist._rv_mode` is
                 consulted, which defaults to 'indices'.
+            n_jobs : int, None
+                The number of workers among which any random restarts of the
+                optimization are divided. If None and `executor` is None, they
+                are performed serially.
+            executor : str, Executor, None
+                How to run the random restarts in parallel: 'process', 'thread',
+                or a `concurrent.futures.Executor`.
             """.format(name=cls.name, type=cls.type)
 
         return intrinsic
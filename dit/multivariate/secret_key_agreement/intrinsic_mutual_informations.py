@@ -47,7 +47,7 @@ class IntrinsicTotalCorrelation(BaseIntrinsicMutualInformation):
             pmf = self.construct_joint(x)
             return total_correlation(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, total_correlation.gradient)
 
 
 intrinsic_total_correlation = IntrinsicTotalCorrelation.functional()
@@ -87,7 +87,7 @@ class IntrinsicDualTotalCorrelation(BaseIntrinsicMutualInformation):
             pmf = self.construct_joint(x)
             return dual_total_correlation(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, dual_total_correlation.gradient)
 
 
 intrinsic_dual_total_correlation = IntrinsicDualTotalCorrelation.functional()
@@ -127,7 +127,7 @@ class IntrinsicCAEKLMutualInformation(BaseIntrinsicMutualInformation):
             pmf = self.construct_joint(x)
             return caekl_mutual_information(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, caekl_mutual_information.gradient)
 
 
 intrinsic_caekl_mutual_information = IntrinsicCAEKLMutualInformation.functional()
@@ -59,7 +59,23 @@ class BaseMinimalIntrinsicMutualInformation(BaseMoreIntrinsicMutualInformation):
 
             return a + b
 
-        return objective
+        def gradient(pmf):
+            """
+            Compute the gradient of I[X:Y|U] + I[XY:U|Z] with respect to the joint.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            return mmi.gradient(pmf) + cmi.gradient(pmf)
+
+        return self._attach_jacobian(objective, gradient)
 
 
 class MinimalIntrinsicTotalCorrelation(BaseMinimalIntrinsicMutualInformation):
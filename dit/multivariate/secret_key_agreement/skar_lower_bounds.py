@@ -144,7 +144,23 @@ class NecessaryIntrinsicMutualInformation(BaseSKARLowerBounds):
 
             return -(a - b)
 
-        return objective
+        def gradient(pmf):
+            """
+            Compute the gradient of I[U:Y|V] - I[U:Z|V] with respect to the joint.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            return cmi_a.gradient(pmf) - cmi_b.gradient(pmf)
+
+        return self._attach_jacobian(objective, gradient, sign=-1)
 
 
 class SecrecyCapacity(NecessaryIntrinsicMutualInformation):
@@ -229,3 +229,12 @@ def test_1(dist, val):
     """
     imi = IMI.intrinsic_total_correlation(dist, [[0], [1]], [2])
     assert imi == pytest.approx(val, abs=1e-5)
+
+
+@pytest.mark.flaky(reruns=5)
+def test_itc_executor():
+    """
+    Test that the functional accepts the parallel optimization arguments.
+    """
+    itc = IMI.intrinsic_total_correlation(dist1, [[0], [1]], [2], n_jobs=2, executor='thread')
+    assert itc == pytest.approx(0)
@@ -3,6 +3,9 @@ Tests for dit.multivariate.deweese.
 """
 import pytest
 
+import numpy as np
+
+from dit import random_distribution, uniform
 from dit.example_dists import dyadic, triadic, Xor
 from dit.multivariate import (coinformation,
                               total_correlation,
@@ -14,6 +17,7 @@ from dit.multivariate.deweese import (deweese_constructor,
                                       deweese_total_correlation,
                                       deweese_dual_total_correlation,
                                       deweese_caekl_mutual_information,
+                                      _partition_maps,
                                       )
 
 
@@ -47,3 +51,31 @@ def test_return_dist():
     _, d = f(triadic, return_opt=True)
     d = d.marginal([4, 5, 6])
     assert len(d.outcomes) == 2
+
+
+@pytest.mark.parametrize('executor', [None, 'thread'])
+def test_parallel(executor):
+    """ Test that dividing the search gives the same answer """
+    d = random_distribution(2, 4)
+    f = deweese_constructor(total_correlation)
+    assert f(d, n_jobs=2, executor=executor) == pytest.approx(f(d))
+
+
+def test_generic_measure():
+    """ Test a measure without a dense form """
+    f = deweese_constructor(lambda d, rvs, crvs: coinformation(d, rvs, crvs))
+    assert f(triadic) == pytest.approx(1.0)
+
+
+def test_symmetric_partitions():
+    """ Test that interchangeable symbols are not partitioned twice """
+    assert len(_partition_maps(np.array([0, 1, 2, 3]))) == 15
+    assert len(_partition_maps(np.array([0, 0, 0, 0]))) == 5
+    assert len(_partition_maps(np.array([0, 0, 1, 1]))) == 9
+
+
+def test_symmetric_dist():
+    """ Test a distribution with many interchangeable symbols """
+    d = uniform(['{}{}'.format(i, j) for i in range(6) for j in range(6) if (i + j) % 2 == 0])
+    f = deweese_constructor(coinformation)
+    assert f(d) == pytest.approx(1.0)
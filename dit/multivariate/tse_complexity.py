@@ -3,11 +3,10 @@ The TSE Complexity.
 """
 from __future__ import division
 
-from itertools import combinations
+import numpy as np
 
-from ..shannon import conditional_entropy as H
+from ..shannon import all_entropies
 from ..helpers import normalize_rvs
-from ..math.misc import combinations as nCk
 from ..utils import unitful
 
 
@@ -48,17 +47,18 @@ def tse_complexity(dist, rvs=None, crvs=None, rv_mode=None):
     """
     rvs, crvs, rv_mode = normalize_rvs(dist, rvs, crvs, rv_mode)
 
-    joint = H(dist, set().union(*rvs), crvs, rv_mode=rv_mode)
+    # The entropies of all subsets of `rvs`, indexed by bitmask.
+    Hs = all_entropies(dist, rvs, crvs, rv_mode=rv_mode)
+    sizes = np.array([bin(mask).count('1') for mask in range(len(Hs))])
+
+    joint = Hs[-1]
     N = len(rvs)
 
     def sub_entropies(k):
         """
         Compute the average entropy of all subsets of `rvs` of size `k`.
         """
-        sub_rvs = (set().union(*rv) for rv in combinations(rvs, k))
-        subH = sum(H(dist, rv, crvs, rv_mode=rv_mode) for rv in sub_rvs)
-        subH /= nCk(N, k)
-        return subH
+        return Hs[sizes == k].mean()
 
     TSE = sum(sub_entropies(k) - k/N * joint for k in range(1, N))
 
@@ -66,11 +66,13 @@ This has to do with sorting the alphabets. Probably this can be relaxed.
 from collections import defaultdict
 from operator import itemgetter
 import itertools
+import zlib
 
 import numpy as np
 from six.moves import map, range, zip # pylint: disable=redefined-builtin
 
 from .npscalardist import ScalarDistribution
+from .cdist import ConditionalDistribution
 
 from .helpers import (
     construct_alphabets,
@@ -165,6 +167,177 @@ def _make_distribution(outcomes, pmf, base,
     return d
 
 
+def _make_coded_distribution(codes, pmf, base, sample_space,
+                             prng=None, sparse=True):
+    """
+    An unsafe, but faster, initialization for distributions from codes.
+
+    The distribution is backed by an integer-coded outcome table: each row
+    of `codes` holds the index of every symbol of an outcome within the
+    corresponding alphabet of `sample_space`. Outcome objects are only
+    constructed when `outcomes` is accessed.
+
+    The same guarantees as for `_make_distribution` must hold. In particular,
+    the rows of `codes` and `pmf` must be ordered as in the sample space.
+
+    Parameters
+    ----------
+    codes : NumPy array, shape (n, k)
+        The integer-coded outcomes.
+    pmf : NumPy array, shape (n,)
+        The probabilities (or log probabilities) of the outcomes.
+    base : float, str, None
+        The base of the pmf.
+    sample_space : CartesianProduct
+        The sample space of the distribution.
+
+    Returns
+    -------
+    d : Distribution
+        The new distribution.
+
+    """
+    d = Distribution.__new__(Distribution)
+
+    # Call init function of BaseDistribution, not of Distribution.
+    # This sets the prng.
+    super(ScalarDistribution, d).__init__(prng)
+
+    d._meta['is_joint'] = True
+    d._meta['is_numerical'] = True
+
+    if base is None:
+        # Assume default base.
+        base = ditParams['base']
+    d.ops = get_ops(base)
+
+    d._outcome_class = sample_space._outcome_class
+    d._outcome_ctor = sample_space._outcome_ctor
+    d._product = sample_space._product
+
+    # Force the distribution to be numerical and a NumPy array.
+    d.pmf = np.asarray(pmf, dtype=float)
+
+    # The outcome table, compacted to the smallest integer type.
+    symbols = [_alphabet_symbols(alpha) for alpha in sample_space.alphabets]
+    d._codes = (None, sample_space, _compact_codes(codes, sample_space), symbols)
+
+    d.alphabet = tuple(sample_space.alphabets)
+    d._sample_space = sample_space
+
+    # Set the mask
+    d._mask = d._new_mask()
+
+    d._meta['is_sparse'] = sparse
+    d.rvs = [[i] for i in range(d.outcome_length())]
+
+    return d
+
+
+def _compact_codes(codes, sample_space):
+    """
+    Returns `codes` as the smallest integer type holding every symbol index.
+
+    """
+    largest = max(sample_space.alphabet_sizes + (1,)) - 1
+    return np.asarray(codes).astype(np.min_scalar_type(largest), copy=False)
+
+
+class _CoalescedSymbols(object):
+    """
+    Maps codes of a coalesced alphabet to its symbols.
+
+    The alphabet of a coalesced random variable is itself a Cartesian product
+    sample space, which can be too large to enumerate. Symbols are instead
+    constructed on demand from the codes of their constituent alphabets.
+
+    """
+    def __init__(self, alphabet):
+        self._symbols = [_alphabet_symbols(alpha) for alpha in alphabet.alphabets]
+        self._sizes = alphabet.alphabet_sizes
+        self._ctor = alphabet._outcome_ctor
+        self._cache = {}
+
+    def __getitem__(self, code):
+        try:
+            return self._cache[code]
+        except KeyError:
+            codes = np.unravel_index(code, self._sizes) if self._sizes else ()
+            symbol = self._ctor([symbols[c] for symbols, c in
+                                 zip(self._symbols, map(int, codes))])
+            self._cache[code] = symbol
+            return symbol
+
+
+def _alphabet_symbols(alphabet):
+    """
+    Returns a sequence mapping symbol codes to the symbols of `alphabet`.
+
+    """
+    if isinstance(alphabet, CartesianProduct):
+        return _CoalescedSymbols(alphabet)
+    elif isinstance(alphabet, SampleSpace):
+        return list(alphabet)
+    else:
+        return alphabet
+
+
+def _is_sorted(alphabet):
+    """
+    Returns `True` if `alphabet` is already in sorted order.
+
+    Nested sample spaces, as created by coalescing, are sorted if each of
+    their alphabets is sorted.
+
+    """
+    if isinstance(alphabet, CartesianProduct):
+        return all(_is_sorted(alpha) for alpha in alphabet.alphabets)
+    elif isinstance(alphabet, SampleSpace):
+        return False
+
+    try:
+        return all(a <= b for a, b in zip(alphabet[:-1], alphabet[1:]))
+    except TypeError:
+        # Unorderable symbols.
+        return False
+
+
+def _grouped_add_reduce(ops, labels, x, size):
+    """
+    Performs an `addition' reduction on `x` within each group of `labels`.
+
+    This is the vectorized equivalent of calling ``ops.add_reduce`` once for
+    each distinct label.
+
+    Parameters
+    ----------
+    ops : Operations
+        The operations defining addition of (log) probabilities.
+    labels : NumPy array, shape (n,)
+        The group, in ``range(size)``, of each element of `x`.
+    x : NumPy array, shape (n,)
+        The (log) probabilities to be reduced.
+    size : int
+        The number of groups.
+
+    Returns
+    -------
+    z : NumPy array, shape (size,)
+        The reduction of each group. Empty groups are null.
+
+    """
+    if ops.base == 'linear':
+        z = np.bincount(labels, weights=x, minlength=size)
+    else:
+        # Change to base-2, add, and then convert back.
+        scale = np.log2(ops.get_base(numerical=True))
+        z = np.empty(size, dtype=float)
+        z.fill(-np.inf)
+        np.logaddexp2.at(z, labels, x * scale)
+        z /= scale
+    return z
+
+
 class Distribution(ScalarDistribution):
     """
     A numerical distribution for joint random variables.
@@ -183,6 +356,17 @@ class Distribution(ScalarDistribution):
 
     Private Attributes
     ------------------
+    _codes : tuple
+        The outcomes encoded as indexes into the alphabets of a Cartesian
+        product sample space. This is either a cache of the encoded outcomes
+        or, when `outcomes` has not been constructed yet, the backing store of
+        the distribution. See :meth:`_outcome_codes`.
+
+    _entropies : tuple
+        A cache of entropies of subsets of the random variables, keyed by
+        the frozensets of random variable indexes and conditioned indexes.
+        See :meth:`_entropy_cache`.
+
     _mask : tuple
         A tuple of booleans specifying if the corresponding random variable
         has been masked or not.
@@ -288,6 +472,9 @@ class Distribution(ScalarDistribution):
     marginalize
         Returns a marginal distribution after marginalizing random variables.
 
+    load
+        Loads a distribution saved to disk.
+
     make_dense
         Add all null outcomes to the pmf.
 
@@ -300,6 +487,9 @@ class Distribution(ScalarDistribution):
     sample
         Returns a sample from the distribution.
 
+    save
+        Saves the distribution to disk.
+
     set_base
         Changes the base of the distribution, in-place.
 
@@ -328,23 +518,58 @@ class Distribution(ScalarDistribution):
 
     """
     ## Unadvertised attributes
+    _codes = None
+    _entropies = None
+    _keys = None
     _sample_space = None
     _mask = None
     _meta = None
     _outcome_class = None
     _outcome_ctor = None
-    _outcomes_index = None
     _product = None
     _rvs = None
     _rv_mode = 'indices'
+    _stored_index = None
+    _stored_outcomes = None
 
     ## Advertised attributes.
     alphabet = None
-    outcomes = None
     ops = None
-    pmf = None
     prng = None
 
+    @property
+    def outcomes(self):
+        """
+        The outcomes of the probability distribution.
+
+        Distributions backed by an integer-coded outcome table construct their
+        outcomes only when they are first accessed.
+
+        """
+        if self._stored_outcomes is None and self._codes is not None:
+            self._stored_outcomes = self._materialize_outcomes()
+        return self._stored_outcomes
+
+    @outcomes.setter
+    def outcomes(self, outcomes):
+        self._stored_outcomes = outcomes
+        self._stored_index = None
+
+    @property
+    def _outcomes_index(self):
+        """
+        A dictionary mapping outcomes to their index in self.outcomes.
+
+        """
+        if self._stored_index is None:
+            outcomes = self.outcomes
+            self._stored_index = dict(zip(outcomes, range(len(outcomes))))
+        return self._stored_index
+
+    @_outcomes_index.setter
+    def _outcomes_index(self, index):
+        self._stored_index = index
+
     def __init__(self, outcomes, pmf=None, sample_space=None, base=None,
                             prng=None, sort=True, sparse=True, trim=True,
                             validate=True):
@@ -598,6 +823,226 @@ class Distribution(ScalarDistribution):
         self._mask = mask
         return mask
 
+    def _outcome_codes(self):
+        """
+        Returns the outcomes encoded as indexes into the alphabets.
+
+        Each outcome is represented by the index of each of its symbols within
+        the corresponding alphabet of the Cartesian product sample space. The
+        encoding is cached and recomputed only when the outcomes or the sample
+        space are replaced.
+
+        Returns
+        -------
+        codes : NumPy array, shape (len(outcomes), outcome_length)
+            The integer-coded outcomes.
+        symbols : list
+            For each random variable, a sequence mapping codes to symbols.
+
+        Raises
+        ------
+        ditException
+            If the sample space is not a Cartesian product.
+
+        """
+        sample_space = self._sample_space
+        cache = self._codes
+        if cache is not None and cache[0] is self._stored_outcomes:
+            if cache[1] is sample_space:
+                return cache[2], cache[3]
+
+        if not isinstance(sample_space, CartesianProduct):
+            msg = 'Outcome codes require a Cartesian product sample space.'
+            raise ditException(msg)
+
+        outcomes = self.outcomes
+        alphabets = sample_space.alphabets
+        n = len(outcomes)
+
+        if self.is_dense() and n == len(sample_space):
+            # The outcomes are the sample space, in order.
+            codes = np.unravel_index(np.arange(n), sample_space.alphabet_sizes)
+            codes = np.column_stack(codes) if codes else np.empty((n, 0))
+        else:
+            codes = np.empty((n, len(alphabets)), dtype=np.intp)
+            for i, alphabet in enumerate(alphabets):
+                column = [outcome[i] for outcome in outcomes]
+                if isinstance(alphabet, tuple):
+                    lookup = dict(zip(alphabet, range(len(alphabet))))
+                else:
+                    # Nested sample spaces can be large, so encode only the
+                    # symbols which actually appear.
+                    lookup = {s: alphabet.index(s) for s in set(column)}
+                codes[:, i] = [lookup[symbol] for symbol in column]
+
+        codes = _compact_codes(codes, sample_space)
+        symbols = [_alphabet_symbols(alphabet) for alphabet in alphabets]
+        self._codes = (outcomes, sample_space, codes, symbols)
+        return codes, symbols
+
+    def _outcome_keys(self):
+        """
+        Returns the index of each outcome within the sample space.
+
+        Returns
+        -------
+        keys : NumPy array, shape (len(outcomes),)
+            The position of each outcome in the ordered sample space.
+        sorter : NumPy array, None
+            The indices which sort `keys`, or `None` if already sorted.
+
+        """
+        codes, _ = self._outcome_codes()
+        cache = self._keys
+        if cache is not None and cache[0] is codes:
+            return cache[1], cache[2]
+
+        sizes = self._sample_space.alphabet_sizes
+        if codes.shape[1]:
+            keys = np.ravel_multi_index(codes.T.astype(np.intp), sizes)
+        else:
+            keys = np.zeros(len(codes), dtype=np.intp)
+        sorter = None
+        if np.any(keys[1:] <= keys[:-1]):
+            sorter = np.argsort(keys, kind='mergesort')
+        self._keys = (codes, keys, sorter)
+        return keys, sorter
+
+    def _is_coded(self):
+        """
+        Returns `True` if the distribution is backed by its outcome table.
+
+        """
+        cache = self._codes
+        return (self._stored_outcomes is None and cache is not None and
+                cache[1] is self._sample_space)
+
+    def _outcome_index(self, outcome):
+        """
+        Returns the index of `outcome` in the pmf, or `None` if it is absent.
+
+        Distributions backed by an integer-coded outcome table answer this by
+        binary search, without constructing their outcomes.
+
+        """
+        if not self._is_coded():
+            return self._outcomes_index.get(outcome, None)
+
+        try:
+            if outcome not in self._sample_space:
+                return None
+        except InvalidOutcome:
+            return None
+        keys, sorter = self._outcome_keys()
+        key = self._sample_space.index(outcome)
+        i = np.searchsorted(keys, key, sorter=sorter)
+        if i == len(keys):
+            return None
+        idx = i if sorter is None else sorter[i]
+        return int(idx) if keys[idx] == key else None
+
+    def _materialize_outcomes(self):
+        """
+        Constructs the outcomes from the integer-coded outcome table.
+
+        """
+        _, sample_space, codes, symbols = self._codes
+        ctor = self._outcome_ctor
+        columns = [[alphabet[c] for c in column]
+                   for alphabet, column in zip(symbols, codes.T.tolist())]
+        if columns:
+            outcomes = tuple(ctor(row) for row in zip(*columns))
+        else:
+            outcomes = tuple(ctor(()) for _ in range(len(codes)))
+
+        # Keep the codes valid for the newly constructed outcomes.
+        self._codes = (outcomes, sample_space, codes, symbols)
+        return outcomes
+
+    def _coalesce_codes(self, indexes, extract):
+        """
+        Coalesces the distribution using its integer-coded outcomes.
+
+        This is the vectorized engine behind :meth:`coalesce`. Each new
+        outcome is identified by a mixed-radix integer key built from the
+        codes of the old outcome, and probabilities are added within keys.
+        The coalesced distribution is backed by its own integer-coded outcome
+        table, so no outcome objects are constructed.
+
+        Parameters
+        ----------
+        indexes : list of tuples
+            The random variable indexes which make up each new variable.
+        extract : bool
+            See :meth:`coalesce`.
+
+        Returns
+        -------
+        d : Distribution, None
+            The coalesced distribution, or `None` if the fast path does not
+            apply: the sample space is not a Cartesian product with sorted
+            alphabets or the keys could overflow.
+
+        """
+        sample_space = self._sample_space
+        if not isinstance(sample_space, CartesianProduct) or not len(self):
+            return None
+
+        flat = [i for idx in indexes for i in idx]
+        alphabets = sample_space.alphabets
+        if not all(_is_sorted(alphabets[i]) for i in set(flat)):
+            return None
+
+        sizes = [sample_space.alphabet_sizes[i] for i in flat]
+        size = 1
+        for s in sizes:
+            size *= s
+        if size >= 2**62 or (not self.is_sparse() and size > 2**31):
+            return None
+
+        codes, _ = self._outcome_codes()
+
+        # Row-major strides, so keys are ordered like the new sample space.
+        strides = np.ones(len(flat), dtype=np.int64)
+        for j in range(len(flat) - 2, -1, -1):
+            strides[j] = strides[j + 1] * sizes[j + 1]
+        keys = codes[:, flat].dot(strides) if flat else np.zeros(len(codes),
+                                                                  dtype=np.int64)
+
+        # Build the new sample space, exactly as the constructor would see it.
+        sample_spaces = [sample_space.coalesce([idxes], extract=True)
+                         for idxes in indexes]
+        if extract:
+            new_sample_space = sample_spaces[0]
+        else:
+            new_sample_space = CartesianProduct(sample_spaces,
+                                                product=itertools.product)
+        new_sizes = new_sample_space.alphabet_sizes
+
+        ops = self.ops
+        if self.is_sparse():
+            keys, labels = np.unique(keys, return_inverse=True)
+            pmf = _grouped_add_reduce(ops, labels, self.pmf, len(keys))
+            keep = ~np.isclose(pmf, ops.zero)
+            keys, pmf = keys[keep], pmf[keep]
+        else:
+            pmf = _grouped_add_reduce(ops, keys, self.pmf, size)
+            keys = np.arange(size)
+
+        if len(keys) == 0:
+            return None
+
+        if new_sizes:
+            new_codes = np.column_stack(np.unravel_index(keys, new_sizes))
+        else:
+            new_codes = np.empty((len(keys), 0), dtype=np.intp)
+
+        d = _make_coded_distribution(new_codes, pmf,
+                                     base=self.get_base(),
+                                     sample_space=new_sample_space,
+                                     sparse=self.is_sparse())
+        return d
+
     @classmethod
     def from_distribution(cls, dist, base=None, prng=None):
         """
@@ -678,7 +1123,30 @@ class Distribution(ScalarDistribution):
             The distribution resulting from interpreting `ndarray` as a pmf.
 
         """
-        return cls(*zip(*np.ndenumerate(ndarray)), base=base, prng=prng)
+        pmf = np.asarray(ndarray, dtype=float)
+        if pmf.ndim == 0 or pmf.size == 0:
+            return cls(*zip(*np.ndenumerate(ndarray)), base=base, prng=prng)
+
+        if base is None:
+            # Provide help for obvious case of linear probabilities.
+            from .validate import is_pmf
+            if is_pmf(pmf.ravel(), LinearOperations()):
+                base = 'linear'
+            else:
+                base = ditParams['base']
+
+        # The outcomes are the indexes of the array, so the array itself is
+        # the dense integer-coded representation of the distribution.
+        alphabets = [tuple(range(n)) for n in pmf.shape]
+        sample_space = CartesianProduct(alphabets, product=itertools.product)
+        codes = np.column_stack(np.unravel_index(np.arange(pmf.size),
+                                                 pmf.shape))
+        d = _make_coded_distribution(codes, pmf.ravel(), base=base,
+                                     sample_space=sample_space, prng=prng,
+                                     sparse=False)
+        d.make_sparse()
+        d.validate()
+        return d
 
     @classmethod
     def from_rv_discrete(cls, ssrv, prng=None):
@@ -703,6 +1171,57 @@ class Distribution(ScalarDistribution):
         sd = ScalarDistribution.from_rv_discrete(ssrv=ssrv, prng=prng)
         return cls.from_distribution(sd)
 
+    def __contains__(self, outcome):
+        """
+        Returns `True` if `outcome` is in self.outcomes.
+
+        Note, the outcome could correspond to a null-outcome if the pmf
+        explicitly contains null-probabilities. Also, if `outcome` is not in
+        the sample space, then an exception is not raised. Instead, `False`
+        is returned.
+
+        """
+        return self._outcome_index(outcome) is not None
+
+    def __getitem__(self, outcome):
+        """
+        Returns the probability associated with `outcome`.
+
+        Parameters
+        ----------
+        outcome : outcome
+            Any hashable and equality comparable object in the sample space.
+            If `outcome` does not exist in the sample space, then an
+            InvalidOutcome exception is raised.
+
+        Returns
+        -------
+        p : float
+            The probability (or log probability) of the outcome.
+
+        Raises
+        ------
+        InvalidOutcome
+            If `outcome` does not exist in the sample space.
+
+        """
+        if not self.has_outcome(outcome, null=True):
+            raise InvalidOutcome(outcome)
+
+        idx = self._outcome_index(outcome)
+        if idx is None:
+            p = self.ops.zero
+        else:
+            p = self.pmf[idx]
+        return p
+
+    def __len__(self):
+        """
+        Returns the number of outcomes in the distribution.
+
+        """
+        return len(self.pmf)
+
     def __setitem__(self, outcome, value):
         """
         Sets the probability associated with `outcome`.
@@ -741,7 +1260,9 @@ class Distribution(ScalarDistribution):
             # Then, the outcome is not in the sample space.
             raise InvalidOutcome(outcome)
 
-        idx = self._outcomes_index.get(outcome, None)
+        self._clear_cache()
+
+        idx = self._outcome_index(outcome)
         new_outcome = idx is None
 
         if not new_outcome:
@@ -750,6 +1271,7 @@ class Distribution(ScalarDistribution):
             # outcome.  In the sparse case, we *could* delete the outcome
             # if the value was zero, but we have choosen to let setting always
             # "set" and deleting always "delete".
+            self._own_pmf()
             self.pmf[idx] = value
         else:
             # Thus, the outcome is new in a sparse distribution. Even if the
@@ -757,7 +1279,6 @@ class Distribution(ScalarDistribution):
 
             # 1. Add the new outcome and probability
             self.outcomes = self.outcomes + (outcome,)
-            self._outcomes_index[outcome] = len(self.outcomes) - 1
             pmf = [p for p in self.pmf] + [value]
 
             # 2. Reorder  ### This call is different from Distribution
@@ -769,6 +1290,60 @@ class Distribution(ScalarDistribution):
             self._outcomes_index = index
             self.pmf = np.array(pmf, dtype=float)
 
+    def __delitem__(self, outcome):
+        """
+        Deletes `outcome` from the distribution.
+
+        Parameters
+        ----------
+        outcome : outcome
+            Any hashable and equality comparable object. If `outcome` exists
+            in the sample space, then it is removed from the pmf---if the
+            outcome did not already exist in the pmf, then no exception is
+            raised. If `outcome` does not exist in the sample space, then an
+            InvalidOutcome exception is raised.
+
+        Raises
+        ------
+        InvalidOutcome
+            If `outcome` does not exist in the sample space.
+
+        """
+        self._clear_cache()
+        super(Distribution, self).__delitem__(outcome)
+
+    def _entropy_cache(self):
+        """
+        Returns the cache of subset entropies for the current pmf.
+
+        Entropies are keyed by ``(frozenset(rvs), frozenset(crvs))``, where
+        `rvs` and `crvs` are random variable indexes. The cache is emptied
+        whenever the distribution is modified through one of its methods, or
+        when `pmf` is replaced by a new array. A checksum of the pmf is kept
+        with the cache, so that writes made to `pmf` in-place are detected
+        too.
+
+        Returns
+        -------
+        cache : dict
+            The cached entropies.
+
+        """
+        pmf = self.pmf
+        checksum = zlib.crc32(np.ascontiguousarray(pmf))
+        cache = self._entropies
+        if cache is None or cache[0] is not pmf or cache[1] != checksum:
+            cache = (pmf, checksum, {})
+            self._entropies = cache
+        return cache[2]
+
+    def _clear_cache(self):
+        """
+        Empties the caches which depend on the values of the pmf.
+
+        """
+        self._entropies = None
+
     def _validate_outcomes(self):
         """
         Returns `True` if the outcomes are valid.
@@ -790,6 +1365,15 @@ class Distribution(ScalarDistribution):
         """
         from .validate import validate_sequence
 
+        if self._is_coded():
+            # Codes index into the alphabets, so each outcome is in the sample
+            # space. We only need to check that the outcome class is a sequence.
+            _, _, codes, symbols = self._codes
+            row = codes[0].tolist() if len(codes) else []
+            outcome = self._outcome_ctor([alphabet[c] for alphabet, c in
+                                          zip(symbols, row)])
+            return validate_sequence(outcome)
+
         v = super(Distribution, self)._validate_outcomes()
         # If we survived, then all outcomes have the same class.
         # Now, we just need to make sure that class is a sequence.
@@ -875,6 +1459,12 @@ class Distribution(ScalarDistribution):
             if extract:
                 raise Exception('Cannot extract with more than one rv.')
 
+        # Cartesian product sample spaces are handled with integer codes.
+        d = self._coalesce_codes(indexes, extract)
+        if d is not None:
+            d._mask = tuple(False for _ in range(len(indexes)))
+            return d
+
         # Determine how elements of new outcomes are constructed.
         ctor_i = self._outcome_ctor
 
@@ -923,14 +1513,13 @@ class Distribution(ScalarDistribution):
 
         return d
 
-    def condition_on(self, crvs, rvs=None, rv_mode=None, extract=False):
+    def condition_on(self, crvs, rvs=None, rv_mode=None, extract=False,
+                     conditional=False):
         """
         Returns distributions conditioned on random variables ``crvs``.
 
         Optionally, ``rvs`` specifies which random variables should remain.
 
-        NOTE: Eventually this will return a conditional distribution.
-
         Parameters
         ----------
         crvs : list
@@ -951,12 +1540,17 @@ class Distribution(ScalarDistribution):
             If the length of either ``crvs`` or ``rvs`` is 1 and ``extract`` is
             ``True``, then instead of the new outcomes being 1-tuples, we
             extract the sole element to create scalar distributions.
+        conditional : bool
+            If ``True``, then the conditional distributions are returned as a
+            single ConditionalDistribution, which stores them as one array and
+            constructs each distribution only if it is accessed. Otherwise,
+            they are returned as a list.
 
         Returns
         -------
         cdist : dist
             The distribution of the conditioned random variables.
-        dists : list of distributions
+        dists : list of distributions, ConditionalDistribution
             The conditional distributions for each outcome in ``cdist``.
 
         Examples
@@ -1016,11 +1610,8 @@ class Distribution(ScalarDistribution):
 
         cdist = d.marginal(cindexes, rv_mode=RV_MODES.INDICES)
         dist = d.marginal(indexes, rv_mode=RV_MODES.INDICES)
-        sample_space = dist._sample_space
-        rv_names = dist.get_rv_names()
 
         ops = d.ops
-        base = ops.get_base()
         ctor = d._outcome_ctor
 
         # A list of indexes of conditioned outcomes for each joint outcome.
@@ -1033,34 +1624,29 @@ class Distribution(ScalarDistribution):
         idx = dist._outcomes_index
         outcomes = [idx[ctor([o[i] for i in indexes])] for o in d.outcomes]
 
-        cprobs = np.array([ops.invert(cdist.pmf[i]) for i in coutcomes])
+        cprobs = ops.invert(cdist.pmf[coutcomes])
         probs = ops.mult(d.pmf, cprobs)
 
         # Now build the distributions
         pmfs = np.empty((len(cdist), len(dist)), dtype=float)
         pmfs.fill(ops.zero)
-        for i, (coutcome, outcome) in enumerate(zip(coutcomes, outcomes)):
-            pmfs[coutcome, outcome] = probs[i]
-        dists = [Distribution(dist.outcomes, pmfs[i], sparse=sparse,
-                 base=base, sample_space=sample_space, validate=False)
-                 for i in range(pmfs.shape[0])]
-
-        # Set the masks and r.v. names for each conditional distribution.
-        for dd in dists:
-            dd._new_mask(from_mask=dist._mask)
-            dd.set_rv_names(rv_names)
+        pmfs[coutcomes, outcomes] = probs
+        dists = ConditionalDistribution(pmfs, dist, sparse=sparse, extract=extract)
+        if not conditional:
+            dists = list(dists)
 
-        if extract:
-            if len(cindexes) == 1:
-                cdist = ScalarDistribution.from_distribution(cdist)
-            if len(indexes) == 1:
-                dists = [ScalarDistribution.from_distribution(d) for d in dists]
+        if extract and len(cindexes) == 1:
+            cdist = ScalarDistribution.from_distribution(cdist)
 
         return cdist, dists
 
     def copy(self, base=None):
         """
-        Returns a (deep) copy of the distribution.
+        Returns a copy of the distribution.
+
+        The outcomes, sample space and pmf are shared with the copy, rather
+        than duplicated. While shared, the pmf is read-only, and it is copied
+        only once one of the distributions is modified.
 
         Parameters
         ----------
@@ -1069,28 +1655,54 @@ class Distribution(ScalarDistribution):
             If `None`, then the copy will keep the same base.
 
         """
-        from copy import deepcopy
-
         # Make an exact copy of the PRNG.
         prng = np.random.RandomState()
         prng.set_state(self.prng.get_state())
 
-        d = _make_distribution(outcomes=deepcopy(self.outcomes),
-                               pmf=np.array(self.pmf, copy=True),
-                               base=self.ops.base,
-                               sample_space=deepcopy(self._sample_space),
-                               prng=prng,
-                               sparse=self._meta['is_sparse'])
+        d = Distribution.__new__(Distribution)
+        super(ScalarDistribution, d).__init__(prng)
+        d._meta.update(self._meta)
+
+        # None of these are modified in-place, so they can be shared.
+        d.ops = self.ops
+        d._outcome_class = self._outcome_class
+        d._outcome_ctor = self._outcome_ctor
+        d._product = self._product
+        d._sample_space = self._sample_space
+        d._stored_outcomes = self._stored_outcomes
+        d._stored_index = self._stored_index
+        d._codes = self._codes
+        d._keys = self._keys
+        d.alphabet = self.alphabet
+        self._share_pmf(d)
+
+        # Entropies are cached against the pmf, and so can be shared too.
+        d._entropies = self._entropies
 
         if base is not None:
             d.set_base(base)
 
         # The following are not initialize-able from the constructor.
+        d.rvs = [[i] for i in range(d.outcome_length())]
         d.set_rv_names(self.get_rv_names())
         d._mask = tuple(self._mask)
 
         return d
 
+    def normalize(self):
+        """
+        Normalize the distribution, in-place.
+
+        Returns
+        -------
+        z : float
+            The previous normalization constant.  This will be negative if
+            the distribution represents log probabilities.
+
+        """
+        self._clear_cache()
+        return super(Distribution, self).normalize()
+
     def outcome_length(self, masked=False):
         """
         Returns the length of outcomes in the joint distribution.
@@ -1173,7 +1785,7 @@ class Distribution(ScalarDistribution):
             # whether it represents a null probability.
             return True
         else:
-            idx = self._outcomes_index.get(outcome, None)
+            idx = self._outcome_index(outcome)
             if idx is None:
                 # Outcome is not represented in pmf and thus, represents
                 # a null probability.
@@ -1197,6 +1809,91 @@ class Distribution(ScalarDistribution):
 
         return h
 
+    def make_dense(self):
+        """
+        Make pmf contain all outcomes in the sample space.
+
+        This does not change the sample space.
+
+        Returns
+        -------
+        n : int
+            The number of null outcomes added.
+
+        """
+        sample_space = self._sample_space
+        if not isinstance(sample_space, CartesianProduct) or \
+           not sample_space.alphabet_sizes:
+            return super(Distribution, self).make_dense()
+
+        self._clear_cache()
+
+        L = len(self)
+        keys, _ = self._outcome_keys()
+        _, symbols = self._outcome_codes()
+
+        size = len(sample_space)
+        pmf = np.empty(size, dtype=float)
+        pmf.fill(self.ops.zero)
+        pmf[keys] = self.pmf
+        codes = np.unravel_index(np.arange(size), sample_space.alphabet_sizes)
+        codes = _compact_codes(np.column_stack(codes), sample_space)
+
+        # The outcomes are now given by the sample space, constructed lazily.
+        self.pmf = pmf
+        self.outcomes = None
+        self._codes = (None, sample_space, codes, symbols)
+
+        self._meta['is_sparse'] = False
+        n = len(self) - L
+
+        return n
+
+    def make_sparse(self, trim=True):
+        """
+        Allow the pmf to omit null outcomes.
+
+        This does not change the sample space.
+
+        Parameters
+        ----------
+        trim : bool
+            If `True`, then remove all null outcomes from the pmf.
+
+        Notes
+        -----
+        Sparse distributions need not be trim.  One can add a null outcome to
+        the pmf and the distribution could still be sparse.  A sparse
+        distribution can even appear dense.  Essentially, sparse means that
+        the shape of the pmf can grow and shrink.
+
+        Returns
+        -------
+        n : int
+            The number of null outcomes removed.
+
+        """
+        self._clear_cache()
+
+        L = len(self)
+
+        if trim:
+            keep = ~np.isclose(self.pmf, self.ops.zero)
+            if self._is_coded():
+                _, sample_space, codes, symbols = self._codes
+                self._codes = (None, sample_space, codes[keep], symbols)
+                self._stored_index = None
+            else:
+                outcomes = tuple(itertools.compress(self.outcomes, keep))
+                self.outcomes = outcomes
+
+            # Update the probabilities.
+            self.pmf = self.pmf[keep]
+
+        self._meta['is_sparse'] = True
+        n = L - len(self)
+        return n
+
     def marginal(self, rvs, rv_mode=None):
         """
         Returns a marginal distribution.
@@ -1282,6 +1979,24 @@ class Distribution(ScalarDistribution):
         d = self.marginal(marginal_indexes, rv_mode=RV_MODES.INDICES)
         return d
 
+    def set_base(self, base):
+        """
+        Changes the base of the distribution, in-place.
+
+        See :meth:`ScalarDistribution.set_base` for details.
+
+        Parameters
+        ----------
+        base : float or string
+            The desired base for the distribution.  If 'linear', then the
+            distribution's pmf will represent linear probabilities. If any
+            positive float (other than 1) or 'e', then the pmf will represent
+            log probabilities with the specified base.
+
+        """
+        self._clear_cache()
+        super(Distribution, self).set_base(base)
+
     def set_rv_names(self, rv_names):
         """
         Sets the names of the random variables.
@@ -27,6 +27,7 @@ variable. The alphabet for each random variable is a set.
 
 """
 import numbers
+import weakref
 from collections import defaultdict
 from itertools import product
 
@@ -110,6 +111,47 @@ def _make_distribution(outcomes, pmf=None, sample_space=None,
     return d
 
 
+class _SharedPmf(object):
+    """
+    The distributions sharing a single pmf array.
+
+    While more than one distribution shares the array, it is made read-only,
+    so that it cannot be modified through one distribution behind the back of
+    the others. Once a single distribution remains, its original writability
+    is restored.
+
+    """
+    def __init__(self, pmf):
+        self.pmf = pmf
+        self.writeable = pmf.flags.writeable
+        self.refs = {}
+
+    def __len__(self):
+        return len(self.refs)
+
+    def add(self, dist):
+        """
+        Adds `dist` to the distributions sharing the pmf.
+
+        """
+        key = id(dist)
+        self.refs[key] = weakref.ref(dist, lambda ref: self._discard(key))
+        if len(self.refs) > 1:
+            self.pmf.flags.writeable = False
+
+    def release(self, dist):
+        """
+        Removes `dist` from the distributions sharing the pmf.
+
+        """
+        self._discard(id(dist))
+
+    def _discard(self, key):
+        if self.refs.pop(key, None) is not None:
+            if len(self.refs) == 1 and self.writeable:
+                self.pmf.flags.writeable = True
+
+
 class ScalarDistribution(BaseDistribution):
     """
     A numerical distribution.
@@ -170,7 +212,7 @@ class ScalarDistribution(BaseDistribution):
         Returns the atoms of the probability space.
 
     copy
-        Returns a deep copy of the distribution.
+        Returns a copy of the distribution.
 
     sample_space
         Returns an iterator over the outcomes in the sample space.
@@ -196,6 +238,9 @@ class ScalarDistribution(BaseDistribution):
     is_sparse
         Returns `True` if the distribution is sparse.
 
+    load
+        Loads a distribution saved to disk.
+
     make_dense
         Add all null outcomes to the pmf.
 
@@ -208,6 +253,9 @@ class ScalarDistribution(BaseDistribution):
     rand
         Returns a random draw from the distribution.
 
+    save
+        Saves the distribution to disk.
+
     set_base
         Changes the base of the distribution, in-place.
 
@@ -236,13 +284,35 @@ class ScalarDistribution(BaseDistribution):
     _sample_space = None
     _outcomes_index = None
     _meta = None
+    _pmf = None
+    _shared = None
 
     alphabet = None
     outcomes = None
     ops = None
-    pmf = None
     prng = None
 
+    @property
+    def pmf(self):
+        """
+        The probability mass function of the distribution.
+
+        A copy shares its pmf with the distribution it was copied from, and
+        the array is read-only until either of them is modified through one
+        of its methods or is given a new pmf.
+
+        """
+        return self._pmf
+
+    @pmf.setter
+    def pmf(self, pmf):
+        if pmf is self._pmf:
+            return
+        if self._shared is not None:
+            self._shared.release(self)
+            self._shared = None
+        self._pmf = pmf
+
     def __init__(self, outcomes, pmf=None, sample_space=None, base=None,
                                  prng=None, sort=True, sparse=True, trim=True,
                                  validate=True):
@@ -1388,6 +1458,7 @@ class ScalarDistribution(BaseDistribution):
         if self.is_dense():
             # Dense distribution, just set it to zero.
             idx = outcomes_index[outcome]
+            self._own_pmf()
             self.pmf[idx] = self.ops.zero
         elif outcome in outcomes_index:
             # Remove the outcome from the sparse distribution.
@@ -1478,13 +1549,17 @@ class ScalarDistribution(BaseDistribution):
             # If the distribution is dense, we will be here.
             # We *could* delete if the value was zero, but we will make
             # setting always set, and deleting always deleting (when sparse).
+            self._own_pmf()
             self.pmf[idx] = value
         else:
             # A new outcome in a sparse distribution.
             # We add the outcome and its value, regardless if the value is zero.
 
             # 1. Add the new outcome and probability
+            # The index may be shared with copies, so it is not updated
+            # in-place.
             self.outcomes = self.outcomes + (outcome,)
+            self._outcomes_index = dict(self._outcomes_index)
             self._outcomes_index[outcome] = len(self.outcomes) - 1
             pmf = [p for p in self.pmf] + [value]
 
@@ -1500,7 +1575,11 @@ class ScalarDistribution(BaseDistribution):
 
     def copy(self, base=None):
         """
-        Returns a (deep) copy of the distribution.
+        Returns a copy of the distribution.
+
+        The outcomes, sample space and pmf are shared with the copy, rather
+        than duplicated. While shared, the pmf is read-only, and it is copied
+        only once one of the distributions is modified.
 
         Parameters
         ----------
@@ -1509,26 +1588,127 @@ class ScalarDistribution(BaseDistribution):
             If `None`, then the copy will keep the same base.
 
         """
-        # For some reason, we can't just return a deepcopy of self.
-        # It works for linear distributions but not for log distributions.
-
-        from copy import deepcopy
-
         # Make an exact copy of the PRNG.
         prng = np.random.RandomState()
         prng.set_state(self.prng.get_state())
 
-        d = _make_distribution(outcomes=deepcopy(self.outcomes),
-                               pmf=np.array(self.pmf, copy=True),
-                               sample_space=deepcopy(self._sample_space),
-                               base=self.ops.base,
-                               prng=prng,
-                               sparse=self._meta['is_sparse'])
+        d = ScalarDistribution.__new__(ScalarDistribution)
+        super(ScalarDistribution, d).__init__(prng)
+        d._meta.update(self._meta)
+
+        d.ops = self.ops
+        d.outcomes = self.outcomes
+        d._outcomes_index = self._outcomes_index
+        d._sample_space = self._sample_space
+        d.alphabet = self.alphabet
+        self._share_pmf(d)
+
         if base is not None:
             d.set_base(base)
 
         return d
 
+    def _share_pmf(self, other):
+        """
+        Shares the pmf of the distribution with `other`.
+
+        Parameters
+        ----------
+        other : ScalarDistribution
+            The distribution, typically a copy, which is to share the pmf.
+
+        """
+        shared = self._shared
+        if shared is None:
+            shared = self._shared = _SharedPmf(self._pmf)
+            shared.add(self)
+        other._pmf = self._pmf
+        other._shared = shared
+        shared.add(other)
+
+    def _own_pmf(self):
+        """
+        Gives the distribution a private copy of its pmf, if it is shared.
+
+        This must be called before the pmf is modified in-place.
+
+        """
+        shared = self._shared
+        if shared is not None:
+            pmf = self._pmf
+            if len(shared) > 1:
+                pmf = np.array(pmf, copy=True)
+            self._shared = None
+            shared.release(self)
+            self._pmf = pmf
+
+    def __getstate__(self):
+        """
+        Returns the state of the distribution for pickling and deep copies.
+
+        Neither pickled nor deep copied distributions share their pmf.
+
+        """
+        state = self.__dict__.copy()
+        state.pop('_shared', None)
+        return state
+
+    def save(self, path):
+        """
+        Saves the distribution to the directory `path`.
+
+        The pmf and outcomes are stored as raw arrays, so that the
+        distribution can be memory-mapped when loaded. See
+        :func:`dit.storage.save_distribution` for details.
+
+        Parameters
+        ----------
+        path : str
+            The directory to save the distribution in.
+
+        See Also
+        --------
+        load
+
+        """
+        from .storage import save_distribution
+        save_distribution(self, path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Loads a distribution saved by `save`.
+
+        Parameters
+        ----------
+        path : str
+            The directory the distribution was saved in.
+        mmap : bool
+            If `True`, the pmf and outcomes are memory-mapped from disk
+            rather than read into memory.
+
+        Returns
+        -------
+        d : ScalarDistribution or Distribution
+            The distribution, of the type it was saved as.
+
+        Raises
+        ------
+        ditException
+            Raised if the saved distribution is not an instance of `cls`.
+
+        See Also
+        --------
+        save
+
+        """
+        from .storage import load_distribution
+        d = load_distribution(path, mmap=mmap)
+        if not isinstance(d, cls):
+            msg = "{0!r} holds a {1}, not a {2}."
+            raise ditException(msg.format(path, type(d).__name__, cls.__name__))
+        return d
+
     def sample_space(self):
         """
         Returns an iterator over the ordered outcome space.
@@ -1637,6 +1817,7 @@ class ScalarDistribution(BaseDistribution):
             the distribution represents log probabilities.
 
         """
+        self._own_pmf()
         ops = self.ops
         pmf = self.pmf
         z = ops.add_reduce(pmf)
@@ -1707,6 +1888,7 @@ class ScalarDistribution(BaseDistribution):
             if from_log and to_log:
                 # Convert from one log base to another.
                 ## log_b(x) = log_b(a) * log_a(x)
+                self._own_pmf()
                 self.pmf *= new_ops.log(old_base)
             elif not from_log and not to_log:
                 # No conversion: from linear to linear.
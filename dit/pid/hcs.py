@@ -71,7 +71,7 @@ class PED_CS(BasePID):
     _red_string = "H_r"
     _pi_string = "H_d"
 
-    def __init__(self, dist, inputs=None, **kwargs):
+    def __init__(self, dist, inputs=None, n_jobs=None, executor=None, **kwargs):
         """
         Parameters
         ----------
@@ -79,8 +79,16 @@ class PED_CS(BasePID):
             The distribution to compute the decomposition on.
         inputs : iter of iters, None
             The set of variables to include. If None, `dist.rvs` is used.
+        n_jobs : int, None
+            The number of workers with which to compute the redundancies of
+            the lattice nodes. If None and `executor` is None, the nodes are
+            computed serially.
+        executor : str, Executor, None
+            How to compute the redundancies in parallel; see `BasePID`.
         """
         self._dist = dist
+        self._n_jobs = n_jobs
+        self._executor = executor
 
         if inputs is None:
             inputs = dist.rvs
@@ -11,7 +11,7 @@ from .lattice import sort_key
 from . import __all_pids
 
 
-def compare_measures(dist, pids=__all_pids, inputs=None, output=None, name='', digits=5):
+def compare_measures(dist, pids=__all_pids, inputs=None, output=None, name='', digits=5, n_jobs=None, executor=None):
     """
     Print the results of several partial information decompositions.
 
@@ -34,8 +34,18 @@ def compare_measures(dist, pids=__all_pids, inputs=None, output=None, name='', d
 
     digits : int
         The number of digits of precision to print.
+
+    n_jobs : int, None
+        The number of workers with which each PID computes the redundancies
+        of its lattice nodes. If None and `executor` is None, the nodes are
+        computed serially.
+
+    executor : str, Executor, None
+        How to compute the redundancies in parallel: 'process', 'thread', or
+        a `concurrent.futures.Executor`. A single Executor may be shared by
+        all the PIDs.
     """
-    pids = [pid(dist.copy(), inputs, output) for pid in pids]
+    pids = [pid(dist.copy(), inputs, output, n_jobs=n_jobs, executor=executor) for pid in pids]
     names = [pid.name for pid in pids]
     table = prettytable.PrettyTable(field_names=([name] + names))
     if ditParams['text.font'] == 'linechar':
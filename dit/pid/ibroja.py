@@ -75,10 +75,40 @@ class BROJAOptimizer(BaseDistOptimizer, BaseConvexOptimizer):
             pmf = self.construct_joint(x)
             return cmi(pmf)
 
-        return objective
+        return self._attach_jacobian(objective, cmi.gradient)
 
 
-def i_broja(d, inputs, output, maxiter=1000):
+def _optimize_warm(optimizer, maxiter, warm, key, n_jobs=None, executor=None):
+    """
+    Optimize, starting from a previous optimum when one of the right size is
+    available.
+
+    Parameters
+    ----------
+    optimizer : BaseOptimizer
+        The optimizer to run.
+    maxiter : int
+        The number of optimization iterations to perform.
+    warm : dict, None
+        Previous optima, updated with the new one. If None, start afresh.
+    key : hashable
+        The key of the optimum in `warm`.
+    n_jobs : int, None
+        The number of workers, passed to `optimizer.optimize`.
+    executor : str, Executor, None
+        How to run the workers, passed to `optimizer.optimize`.
+    """
+    x0 = None
+    if warm is not None:
+        x0 = warm.get(key)
+        if x0 is not None and x0.shape != (optimizer._optvec_size,):
+            x0 = None
+    optimizer.optimize(x0=x0, niter=1, maxiter=maxiter, n_jobs=n_jobs, executor=executor)
+    if warm is not None:
+        warm[key] = optimizer._optima.copy()
+
+
+def i_broja(d, inputs, output, maxiter=1000, warm=None, n_jobs=None, executor=None):
     """
     This computes unique information as min{I(input : output | other_inputs)} over the space of distributions
     which matches input-output marginals.
@@ -91,6 +121,19 @@ def i_broja(d, inputs, output, maxiter=1000):
         The input variables.
     output : iterable
         The output variable.
+    maxiter : int
+        The number of optimization iterations to perform.
+    warm : dict, None
+        The optima found for a previous, similar, distribution, from which to
+        start the optimizations. It is updated with the new optima. If None,
+        the optimizations start afresh.
+    n_jobs : int, None
+        The number of workers among which any random restarts of the
+        optimizations are divided. If None and `executor` is None, they are
+        performed serially.
+    executor : str, Executor, None
+        How to run the random restarts in parallel: 'process', 'thread', or a
+        `concurrent.futures.Executor`.
 
     Returns
     -------
@@ -100,7 +143,7 @@ def i_broja(d, inputs, output, maxiter=1000):
     uniques = {}
     if len(inputs) == 2:
         broja = BROJABivariateOptimizer(d, list(inputs), output)
-        broja.optimize(niter=1, maxiter=maxiter)
+        _optimize_warm(broja, maxiter, warm, tuple(inputs), n_jobs=n_jobs, executor=executor)
         opt_dist = broja.construct_dist()
         uniques[inputs[0]] = coinformation(opt_dist, [[0], [2]], [1])
         uniques[inputs[1]] = coinformation(opt_dist, [[1], [2]], [0])
@@ -109,7 +152,7 @@ def i_broja(d, inputs, output, maxiter=1000):
             others = sum([i for i in inputs if i != input_], ())
             dm = d.coalesce([input_, others, output])
             broja = BROJAOptimizer(dm, (0,), ((1,),), (2,))
-            broja.optimize(niter=1, maxiter=maxiter)
+            _optimize_warm(broja, maxiter, warm, input_, n_jobs=n_jobs, executor=executor)
             d_opt = broja.construct_dist()
             uniques[input_] = coinformation(d_opt, [[0], [2]], [1])
 
@@ -127,3 +170,4 @@ class PID_BROJA(BaseUniquePID):
     """
     _name = "I_broja"
     _measure = staticmethod(i_broja)
+    _warm_start = True
@@ -6,11 +6,11 @@ from __future__ import division
 
 import numpy as np
 
-from .pid import BasePID
+from .pid import BasePID, _coalesce_pmfs, _dense_pmf, _marginal
 
-from .. import modify_outcomes
+from .. import Distribution
 from ..algorithms import maxent_dist
-from ..utils import flatten, powerset
+from ..utils import powerset
 
 
 def i_ccs(d, inputs, output):
@@ -33,60 +33,83 @@ def i_ccs(d, inputs, output):
     iccs : float
         The value of I_ccs.
     """
-    var_map = {var: i for i, var in enumerate(inputs + (output,))}
-    vars = list(sorted(var_map.values()))
-    d = d.coalesce(inputs + (output,))
-    marginals = [vars[:-1]] + [[i, vars[-1]] for i in vars[:-1]]
-    d = maxent_dist(d, marginals)
-    d = modify_outcomes(d, lambda o: tuple(o))
-    sub_vars = [var for var in powerset(vars) if var]
-    sub_dists = {var: d.marginal(var) for var in sub_vars}
-
-    def pmi(input_, output):
-        """
-        Compute the pointwise mutual information.
-
-        Parameters
-        ----------
-        input_ : iterable
-            The input variable.
-        output : iterable
-            The output variable.
-
-        Returns
-        -------
-        pmi : dict
-            A dictionary mapping events to pointwise mutual information values.
-        """
-        jdist = sub_dists[(input_, output)]
-        idist = sub_dists[(input_,)]
-        odist = sub_dists[(output,)]
-        return {e: np.log2(jdist[e] / (idist[(e[0],)] * odist[(e[1],)])) for e in jdist.outcomes}
-
-    pmis = {tuple(marg): pmi(marg[0], marg[1]) for marg in marginals[1:]}
-
-    inputs_dist = sub_dists[tuple(vars[:-1])]
-    output_dist = sub_dists[(vars[-1],)]
-    joint_pmis = {e: np.log2(d[e]/(inputs_dist[e[:-1]]*output_dist[(e[-1],)])) for e in d.outcomes}
-
-    coinfos = {e: np.log2(np.prod(
-        [sub_dists[sub_var][tuple(e[i] for i in flatten(sub_var))] ** ((-1) ** len(sub_var)) for sub_var in sub_vars]))
-               for e in d.outcomes}
-
-    # fix the sign of things close to zero
-    for pmi in pmis.values():
-        for e, val in pmi.items():
-            if np.isclose(val, 0.0):  # pragma: no cover
-                pmi[e] = 0.0
-    for e, val in coinfos.items():
-        if np.isclose(val, 0.0):
-            coinfos[e] = 0.0
-
-    i = sum(d[e] * coinfos[e] for e in d.outcomes if
-            all(np.sign(coinfos[e]) == np.sign(pmi[tuple(e[i] for i in marg)]) for marg, pmi in pmis.items()) \
-            and np.sign(coinfos[e]) == np.sign(joint_pmis[e]))
-
-    return i
+    pmfs, inputs, output = _dense_pmf(d, inputs, output)
+    return _i_ccs_batch(pmfs, inputs, output)[0]
+
+
+def _ccs_pointwise(pmfs):
+    """
+    Compute the average pointwise coinformation over the events agreeing in
+    sign with the pointwise input-output mutual informations, for each of
+    several stacked pmfs whose last variable is the output.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, with the first axis indexing the distributions and one axis
+        per variable.
+
+    Returns
+    -------
+    iccs : np.ndarray
+        The value of I_ccs for each pmf.
+    """
+    n = pmfs.ndim - 1
+    out = (n - 1,)
+    p_t = _marginal(pmfs, out)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        coinfos = sum((-1)**len(sub) * np.log2(_marginal(pmfs, sub)) for sub in powerset(range(n)) if sub)
+        pmis = [np.log2(_marginal(pmfs, (i,) + out) / (_marginal(pmfs, (i,)) * p_t)) for i in range(n - 1)]
+        joint_pmis = np.log2(pmfs / (_marginal(pmfs, range(n - 1)) * p_t))
+
+        # fix the sign of things close to zero
+        for pmi in pmis:
+            pmi[np.isclose(pmi, 0.0)] = 0.0
+        coinfos[np.isclose(coinfos, 0.0)] = 0.0
+
+        signs = np.sign(coinfos)
+        agree = (pmfs > 0) & (signs == np.sign(joint_pmis))
+        for pmi in pmis:
+            agree &= signs == np.sign(pmi)
+        terms = np.where(agree, pmfs * coinfos, 0.0)
+
+    return terms.reshape(len(pmfs), -1).sum(axis=1)
+
+
+def _i_ccs_batch(pmfs, inputs, output):
+    """
+    Compute I_ccs for each of several stacked pmfs. The maximum entropy
+    distributions are found one at a time, and the pointwise coinformations
+    of all of them at once.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, as from `_stack_pmfs`.
+    inputs : iterable of iterables
+        The input variables.
+    output : iterable
+        The output variable.
+
+    Returns
+    -------
+    iccs : np.ndarray
+        The value of I_ccs for each pmf.
+    """
+    n = len(inputs)
+    marginals = [list(range(n))] + [[i, n] for i in range(n)]
+    joints = _coalesce_pmfs(pmfs, tuple(inputs) + (output,))
+
+    maxents = np.zeros_like(joints)
+    for joint, maxent in zip(joints, maxents):
+        # restrict each variable to the values it takes
+        support = np.ix_(*[np.flatnonzero(_marginal(joint[np.newaxis], (i,))) for i in range(n + 1)])
+        d = maxent_dist(Distribution.from_ndarray(joint[support]), marginals)
+        q = np.zeros(joint[support].shape)
+        q[tuple(np.array(d.outcomes).T)] = d.pmf
+        maxent[support] = q
+
+    return _ccs_pointwise(maxents)
 
 
 class PID_CCS(BasePID):
@@ -95,3 +118,4 @@ class PID_CCS(BasePID):
     """
     _name = "I_ccs"
     _measure = staticmethod(i_ccs)
+    _measure_batch = staticmethod(_i_ccs_batch)
@@ -6,7 +6,7 @@ from __future__ import division
 
 import numpy as np
 
-from .pid import BasePID
+from .pid import BasePID, _dense_pmf, _marginal
 
 
 def s_i(d, input_, output, output_value):
@@ -57,8 +57,60 @@ def i_min(d, inputs, output):
     imin : float
         The value of I_min.
     """
-    p_s = d.marginal(output)
-    return sum(p_s[s] * min(s_i(d, input_, output, s) for input_ in inputs) for s in p_s.outcomes)
+    pmfs, inputs, output = _dense_pmf(d, inputs, output)
+    return _i_min_batch(pmfs, inputs, output)[0]
+
+
+def _specific_informations(pmfs, input_, output):
+    """
+    Compute I(input_ : output=s) for each value `s` of the output, for each of
+    several stacked pmfs.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, as from `_stack_pmfs`.
+    input_ : iterable
+        The input aggregate variable.
+    output : iterable
+        The output aggregate variable.
+
+    Returns
+    -------
+    s : np.ndarray
+        The specific informations, shaped as the marginal of `output`.
+    """
+    p_as = _marginal(pmfs, tuple(input_) + tuple(output))
+    p_a = _marginal(p_as, input_)
+    p_s = _marginal(p_as, output)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = p_as / p_s * np.log2(p_as / (p_a * p_s))
+    terms[p_as == 0] = 0
+    axes = tuple(i + 1 for i in range(pmfs.ndim - 1) if i not in output)
+    return terms.sum(axis=axes, keepdims=True)
+
+
+def _i_min_batch(pmfs, inputs, output):
+    """
+    Compute I_min for each of several stacked pmfs.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, as from `_stack_pmfs`.
+    inputs : iterable of iterables
+        The input variables.
+    output : iterable
+        The output variable.
+
+    Returns
+    -------
+    imin : np.ndarray
+        The value of I_min for each pmf.
+    """
+    p_s = _marginal(pmfs, output)
+    s_is = np.min([_specific_informations(pmfs, input_, output) for input_ in inputs], axis=0)
+    return (p_s * s_is).reshape(len(pmfs), -1).sum(axis=1)
 
 
 class PID_WB(BasePID):
@@ -67,3 +119,4 @@ class PID_WB(BasePID):
     """
     _name = "I_min"
     _measure = staticmethod(i_min)
+    _measure_batch = staticmethod(_i_min_batch)
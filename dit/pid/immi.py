@@ -4,7 +4,9 @@ The I_mmi measure, briefly looked at by the BROJA team.
 
 from __future__ import division
 
-from .pid import BasePID
+import numpy as np
+
+from .pid import BasePID, _marginal
 
 from ..multivariate import coinformation
 
@@ -30,6 +32,54 @@ def i_mmi(d, inputs, output):
     return min(coinformation(d, [input_, output]) for input_ in inputs)
 
 
+def _mutual_informations(pmfs, input_, output):
+    """
+    Compute I[input_ : output] for each of several stacked pmfs.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, as from `_stack_pmfs`.
+    input_ : iterable
+        The input variable.
+    output : iterable
+        The output variable.
+
+    Returns
+    -------
+    mis : np.ndarray
+        The mutual information for each pmf.
+    """
+    p_as = _marginal(pmfs, tuple(input_) + tuple(output))
+    p_a = _marginal(p_as, input_)
+    p_s = _marginal(p_as, output)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = p_as * np.log2(p_as / (p_a * p_s))
+    terms[p_as == 0] = 0
+    return terms.reshape(len(pmfs), -1).sum(axis=1)
+
+
+def _i_mmi_batch(pmfs, inputs, output):
+    """
+    Compute I_mmi for each of several stacked pmfs.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, as from `_stack_pmfs`.
+    inputs : iterable of iterables
+        The input variables.
+    output : iterable
+        The output variable.
+
+    Returns
+    -------
+    immi : np.ndarray
+        The value of I_mmi for each pmf.
+    """
+    return np.min([_mutual_informations(pmfs, input_, output) for input_ in inputs], axis=0)
+
+
 class PID_MMI(BasePID):
     """
     The minimum mutual information partial information decomposition.
@@ -39,3 +89,4 @@ class PID_MMI(BasePID):
     """
     _name = "I_mmi"
     _measure = staticmethod(i_mmi)
+    _measure_batch = staticmethod(_i_mmi_batch)
@@ -4,32 +4,63 @@ I_plus/minus, by Finn & Lizier
 
 from __future__ import division
 
+from functools import reduce
+
 import numpy as np
 
-from .pid import BasePID
+from .pid import BasePID, _dense_pmf, _marginal
 
 
 def i_pm(dist, inputs, output):
     """
-    """
-    dist = dist.coalesce(inputs + (output,))
-    input_dists = [dist.marginal([i]) for i, _ in enumerate(inputs)]
-    inout_dists = [dist.marginal([i, len(inputs)]) for i, _ in enumerate(inputs)]
-    p_s_g_ts = [d.condition_on([1]) for d in inout_dists]
+    Compute I_pm(inputs : output), the difference between the average minimum
+    surprisal of the inputs and the average minimum surprisal of the inputs
+    given the output.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution to compute i_pm for.
+    inputs : iterable of iterables
+        The input variables.
+    output : iterable
+        The output variable.
 
-    def min_h_s(outcome):
-        return min(-np.log2(input_dists[i][(e,)]) for i, e in enumerate(outcome[:-1]))
+    Returns
+    -------
+    ipm : float
+        The value of I_pm.
+    """
+    pmfs, inputs, output = _dense_pmf(dist, inputs, output)
+    return _i_pm_batch(pmfs, inputs, output)[0]
 
-    def min_h_s_g_t(outcome):
-        t = outcome[-1]
-        indexes = [p_s_g_t[0].outcomes.index((t,)) for p_s_g_t in p_s_g_ts]
-        return min(-np.log2(p_s_g_ts[i][1][j][(e,)]) for i, (e, j) in enumerate(zip(outcome[:-1], indexes)))
 
-    r_plus = sum(dist[outcome]*min_h_s(outcome) for outcome in dist.outcomes)
+def _i_pm_batch(pmfs, inputs, output):
+    """
+    Compute I_pm for each of several stacked pmfs.
 
-    r_minus = sum(dist[outcome]*min_h_s_g_t(outcome) for outcome in dist.outcomes)
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, as from `_stack_pmfs`.
+    inputs : iterable of iterables
+        The input variables.
+    output : iterable
+        The output variable.
 
-    return r_plus - r_minus
+    Returns
+    -------
+    ipm : np.ndarray
+        The value of I_pm for each pmf.
+    """
+    p_t = _marginal(pmfs, output)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h_s = reduce(np.minimum, [-np.log2(_marginal(pmfs, input_)) for input_ in inputs])
+        h_s_g_t = reduce(np.minimum, [-np.log2(_marginal(pmfs, tuple(input_) + tuple(output)) / p_t)
+                                      for input_ in inputs])
+        terms = pmfs * (h_s - h_s_g_t)
+    terms[pmfs == 0] = 0
+    return terms.reshape(len(pmfs), -1).sum(axis=1)
 
 
 class PID_PM(BasePID):
@@ -38,3 +69,4 @@ class PID_PM(BasePID):
     """
     _name = "I_pm"
     _measure = staticmethod(i_pm)
+    _measure_batch = staticmethod(_i_pm_batch)
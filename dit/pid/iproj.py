@@ -166,10 +166,8 @@ def projected_information(dist, X, Y, Z):
     pi : float
         The projected information.
     """
-    p_z_ys = dist.condition_on(rvs=Z, crvs=Y)[1]
-    for d in p_z_ys:
-        d.make_dense()
-    domain = [d.pmf for d in p_z_ys]
+    p_z_ys = dist.condition_on(rvs=Z, crvs=Y, conditional=True)[1]
+    domain = list(p_z_ys.to_array(base=None, mode='dense'))
     p_xz = dist.coalesce((X, Z))  # can't use marginal, order is important
     p_z = dist.marginal(Z)
     p_x, p_z_xs = dist.condition_on(rvs=Z, crvs=X)
@@ -1,12 +1,22 @@
 """
 Lattice utilities for the partial information decomposition.
+
+The Williams & Beer lattice of antichains is isomorphic to the lattice of
+nonempty up-sets of the nonempty subsets of the inputs, ordered by reverse
+inclusion: each antichain corresponds to the up-set it generates. A node is
+then covered exactly by the nodes whose up-sets lack one of its generators,
+so the edges of the lattice are found directly rather than by reducing the
+full order. The structure depends only on the number of inputs, and so is
+computed once for each size and shared between lattices.
 """
 
 from itertools import combinations
 
 import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
 
-from ..utils import powerset
+from ..utils import flatten, powerset
 
 __all__ = ['pid_lattice',
            'sort_key',
@@ -72,14 +82,221 @@ def parent(a, b):
     return all(any(frozenset(aa) <= frozenset(bb) for aa in a) for bb in b)
 
 
+class _AntichainLattice(object):
+    """
+    The Williams & Beer lattice on `n` inputs, in terms of integer indices.
+
+    Subsets of the inputs are bitmasks, ordered as by `powerset`. Nodes are
+    antichains, stored as increasing indices into that ordering, together
+    with the up-sets they generate, stored as bitmasks over those indices.
+    """
+
+    def __init__(self, n):
+        """
+        Parameters
+        ----------
+        n : int
+            The number of inputs.
+        """
+        subsets = [sum(1 << i for i in s) for s in powerset(range(n))][1:]
+        supersets = [sum(1 << j for j, other in enumerate(subsets) if other & mask == mask)
+                     for mask in subsets]
+
+        # Grow the antichains one subset at a time, which enumerates them in
+        # the same order as filtering the powerset of the subsets.
+        antichains = []
+        ups = []
+        layer = [((), 0)]
+        while layer:
+            next_layer = []
+            for ac, up in layer:
+                for i in range(ac[-1] + 1 if ac else 0, len(subsets)):
+                    if not any(subsets[i] & subsets[j] in (subsets[i], subsets[j]) for j in ac):
+                        next_layer.append((ac + (i,), up | supersets[i]))
+            antichains.extend(ac for ac, _ in next_layer)
+            ups.extend(up for _, up in next_layer)
+            layer = next_layer
+
+        index = {up: i for i, up in enumerate(ups)}
+
+        # The nodes covering a node are found by removing one of its
+        # generators from its up-set, unless that leaves it empty.
+        edges = [(index[up & ~(1 << i)], node)
+                 for node, (ac, up) in enumerate(zip(antichains, ups))
+                 for i in ac if up & ~(1 << i)]
+
+        self.antichains = antichains
+        self.edges = edges
+        self.root = index[supersets[-1]]
+        self._supersets = supersets
+        self._index = index
+        self._ups = np.array(ups, dtype=np.uint64)
+        self._ascendants = {}
+        self._descendants = {}
+        self._depths = None
+        self._mobius = None
+
+    def ascendants(self, i):
+        """
+        The nodes greater than or equal to node `i`.
+
+        Parameters
+        ----------
+        i : int
+            The index of the node.
+
+        Returns
+        -------
+        nodes : np.ndarray
+            The indices of the nodes.
+        """
+        if i not in self._ascendants:
+            up = self._ups[i]
+            self._ascendants[i] = np.flatnonzero(self._ups & up == self._ups)
+        return self._ascendants[i]
+
+    def descendants(self, i):
+        """
+        The nodes less than or equal to node `i`.
+
+        Parameters
+        ----------
+        i : int
+            The index of the node.
+
+        Returns
+        -------
+        nodes : np.ndarray
+            The indices of the nodes.
+        """
+        if i not in self._descendants:
+            up = self._ups[i]
+            self._descendants[i] = np.flatnonzero(self._ups & up == up)
+        return self._descendants[i]
+
+    def depths(self):
+        """
+        The length of the shortest path from the root to each node.
+
+        Returns
+        -------
+        depths : np.ndarray
+            The depth of each node.
+        """
+        if self._depths is None:
+            children = [[] for _ in self.antichains]
+            for a, b in self.edges:
+                children[a].append(b)
+            depths = np.full(len(self.antichains), -1, dtype=int)
+            depths[self.root] = 0
+            layer = [self.root]
+            while layer:
+                next_layer = []
+                for a in layer:
+                    for b in children[a]:
+                        if depths[b] < 0:
+                            depths[b] = depths[a] + 1
+                            next_layer.append(b)
+                layer = next_layer
+            self._depths = depths
+        return self._depths
+
+    def mobius(self):
+        """
+        The Mobius inversion of the lattice, as a sparse matrix taking the
+        redundancy of each node to its partial information.
+
+        In a distributive lattice the Mobius function is nonzero only on
+        Boolean intervals. The nodes just below a node are those whose
+        up-sets include one more subset, all of whose proper supersets are
+        already included, and the Boolean interval below the node consists
+        of adding any collection of these subsets.
+
+        Returns
+        -------
+        mobius : scipy.sparse.csr_matrix
+            The matrix `M` such that `pis = M @ reds`.
+        """
+        if self._mobius is None:
+            rows, cols, vals = [], [], []
+            for node, up in enumerate(int(up) for up in self._ups):
+                addable = [1 << j for j, sups in enumerate(self._supersets)
+                           if not up & (1 << j) and not (sups & ~(1 << j)) & ~up]
+                for subset in powerset(addable):
+                    rows.append(node)
+                    cols.append(self._index[up | sum(subset)])
+                    vals.append((-1)**len(subset))
+            n = len(self.antichains)
+            self._mobius = csr_matrix((vals, (rows, cols)), shape=(n, n))
+        return self._mobius
+
+
+_LATTICES = {}
+
+
+def _antichain_lattice(n):
+    """
+    Return the (shared) structure of the lattice on `n` inputs.
+
+    Parameters
+    ----------
+    n : int
+        The number of inputs.
+
+    Returns
+    -------
+    structure : _AntichainLattice
+        The lattice structure.
+    """
+    if n not in _LATTICES:
+        _LATTICES[n] = _AntichainLattice(n)
+    return _LATTICES[n]
+
+
 def pid_lattice(variables):
     """
     Construct the Williams & Beer lattice of antichains.
 
     Parameters
     ----------
-    n : int
-        The number of input variables.
+    variables : iterable of tuples
+        The input variables.
+
+    Returns
+    -------
+    lattice : nx.DiGraph
+        The lattice of antichains.
+    """
+    variables = list(variables)
+    indices = list(flatten(variables))
+    if not variables or len(set(indices)) != len(indices):
+        # Overlapping inputs are not ordered as their indices are.
+        return _pid_lattice_naive(variables)
+
+    structure = _antichain_lattice(len(variables))
+    combos = [sum(s, tuple()) for s in powerset(variables)][1:]
+    nodes = [tuple(combos[i] for i in ac) for ac in structure.antichains]
+
+    lattice = nx.DiGraph()
+    lattice.add_nodes_from(nodes)
+    lattice.add_edges_from((nodes[a], nodes[b]) for a, b in structure.edges)
+
+    lattice.root = nodes[structure.root]
+    lattice._structure = structure
+    lattice._nodes = nodes
+    lattice._index = {node: i for i, node in enumerate(nodes)}
+
+    return lattice
+
+
+def _pid_lattice_naive(variables):
+    """
+    Construct the Williams & Beer lattice of antichains by brute force.
+
+    Parameters
+    ----------
+    variables : iterable of tuples
+        The input variables.
 
     Returns
     -------
@@ -122,7 +339,11 @@ def sort_key(lattice):
     key : function
         A function on nodes which returns the properties from which the lattice should be ordered.
     """
-    pls = nx.shortest_path_length(lattice, source=lattice.root)
+    try:
+        depths = lattice._structure.depths()
+        pls = {node: depths[i] for node, i in lattice._index.items()}
+    except AttributeError:
+        pls = nx.shortest_path_length(lattice, source=lattice.root)
 
     def key(node):
         depth = pls[node]
@@ -148,7 +369,11 @@ def ascendants(lattice, node, self=False):
     nodes : list
         A list of nodes greater than `node` in the lattice.
     """
-    nodes = list(nx.bfs_tree(lattice.reverse(), node))
+    try:
+        i = lattice._index[node]
+        nodes = [lattice._nodes[j] for j in lattice._structure.ascendants(i)]
+    except AttributeError:
+        nodes = list(nx.bfs_tree(lattice.reverse(), node))
     if not self:
         nodes.remove(node)
     return nodes
@@ -170,7 +395,11 @@ def descendants(lattice, node, self=False):
     nodes : list
         A list of nodes less than `node` in the lattice.
     """
-    nodes = list(nx.bfs_tree(lattice, node))
+    try:
+        i = lattice._index[node]
+        nodes = [lattice._nodes[j] for j in lattice._structure.descendants(i)]
+    except AttributeError:
+        nodes = list(nx.bfs_tree(lattice, node))
     if not self:
         nodes.remove(node)
     return nodes
@@ -19,8 +19,203 @@ import prettytable
 
 from .lattice import ascendants, descendants, least_upper_bound, pid_lattice, sort_key
 from .. import ditParams
+from ..helpers import parse_rvs, variable_labels
 from ..multivariate import coinformation
 from ..utils import flatten, powerset
+from ..utils.parallel import map_in_pool
+
+
+def _measure_node(measure, dist, output, kwargs, node):
+    """
+    Compute the redundancy of a single lattice node.
+
+    Parameters
+    ----------
+    measure : func
+        The redundancy measure.
+    dist : Distribution
+        The distribution to compute the redundancy of.
+    output : iterable
+        The indices to consider the target/output of the PID.
+    kwargs : dict
+        Additional keyword arguments for `measure`.
+    node : tuple(tuples)
+        The lattice node to compute the redundancy of.
+
+    Returns
+    -------
+    red : float
+        The redundancy value.
+    """
+    return measure(dist, node, output, **kwargs)
+
+
+def _stack_pmfs(dists):
+    """
+    Arrange the pmfs of distributions over the same random variables as a
+    single dense array.
+
+    Parameters
+    ----------
+    dists : list of Distributions
+        The distributions, each with the same number of random variables.
+
+    Returns
+    -------
+    pmfs : np.ndarray
+        The pmfs, with the first axis indexing `dists` and one axis per random
+        variable, indexing the symbols it takes in any of `dists` in order of
+        their appearance.
+    """
+    tables = [{} for _ in range(dists[0].outcome_length())]
+    codes = {}
+    entries = []
+    for dist in dists:
+        outcomes = tuple(dist.outcomes)
+        if outcomes not in codes:
+            codes[outcomes] = tuple(np.array([[table.setdefault(symbol, len(table))
+                                               for table, symbol in zip(tables, outcome)]
+                                              for outcome in outcomes], dtype=int).reshape(-1, len(tables)).T)
+        pmf = dist.pmf
+        if dist.is_log():
+            pmf = dist.get_base(numerical=True)**pmf
+        entries.append((codes[outcomes], pmf))
+
+    pmfs = np.zeros((len(dists),) + tuple(len(table) for table in tables))
+    for i, (code, pmf) in enumerate(entries):
+        pmfs[(i,) + code] = pmf
+    return pmfs
+
+
+def _dense_pmf(dist, inputs, output):
+    """
+    Arrange the pmf of a single distribution as from `_stack_pmfs`, with the
+    random variables other than `inputs` and `output` marginalized out.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution.
+    inputs : iterable of iterables
+        The input variables.
+    output : iterable
+        The output variable.
+
+    Returns
+    -------
+    pmfs : np.ndarray
+        The pmf, with a leading axis of length one, and an axis of length one
+        for each marginalized random variable.
+    inputs : tuple of tuples
+        The input variables, as indices.
+    output : tuple
+        The output variable, as indices.
+    """
+    inputs = tuple(tuple(parse_rvs(dist, input_, unique=False, sort=False)[1]) for input_ in inputs)
+    output = tuple(parse_rvs(dist, output, unique=False, sort=False)[1])
+    rvs = set(flatten(inputs)) | set(output)
+
+    labels = variable_labels(dist)
+    pmf = dist.pmf
+    if dist.is_log():
+        pmf = dist.get_base(numerical=True)**pmf
+
+    n = dist.outcome_length()
+    shape = [labels[:, i].max() + 1 if i in rvs else 1 for i in range(n)]
+    index = tuple(labels[:, i] if i in rvs else np.zeros(len(labels), dtype=int) for i in range(n))
+    pmfs = np.zeros(shape)
+    np.add.at(pmfs, index, pmf)
+    return pmfs[np.newaxis], inputs, output
+
+
+def _marginal(pmfs, rvs):
+    """
+    Marginalize stacked pmfs onto `rvs`, keeping the other axes so that the
+    result broadcasts against `pmfs`.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, as from `_stack_pmfs`.
+    rvs : iterable
+        The indices of the random variables to keep.
+
+    Returns
+    -------
+    marginal : np.ndarray
+        The marginal pmfs.
+    """
+    rvs = set(rvs)
+    axes = tuple(i + 1 for i in range(pmfs.ndim - 1) if i not in rvs)
+    return pmfs.sum(axis=axes, keepdims=True)
+
+
+def _coalesce_pmfs(pmfs, groups):
+    """
+    Coalesce stacked pmfs into one axis per group of random variables.
+
+    Parameters
+    ----------
+    pmfs : np.ndarray
+        The pmfs, as from `_stack_pmfs`.
+    groups : iterable of iterables
+        The random variables of each new axis. Groups may overlap.
+
+    Returns
+    -------
+    joint : np.ndarray
+        The pmfs, with the first axis indexing the distributions and one axis
+        per group, indexing the joint values of its random variables.
+    """
+    groups = [tuple(group) for group in groups]
+    union = sorted(set(flatten(groups)))
+    joint = _marginal(pmfs, union).reshape((len(pmfs),) + tuple(pmfs.shape[i + 1] for i in union))
+    coords = dict(zip(union, np.indices(joint.shape[1:]).reshape(len(union), -1)))
+
+    shape = tuple(int(np.prod([pmfs.shape[i + 1] for i in group])) for group in groups)
+    values = [np.ravel_multi_index([coords[i] for i in group], [pmfs.shape[i + 1] for i in group])
+              for group in groups]
+    coalesced = np.zeros((len(pmfs), int(np.prod(shape))))
+    coalesced[:, np.ravel_multi_index(values, shape)] = joint.reshape(len(pmfs), -1)
+    return coalesced.reshape((len(pmfs),) + shape)
+
+
+def _batch_inversion(lattice, nodes, reds):
+    """
+    Perform the Mobius inversion of many sets of redundancies at once.
+
+    Parameters
+    ----------
+    lattice : nx.DiGraph
+        The lattice.
+    nodes : list
+        The nodes of `lattice`, in the order of the columns of `reds`.
+    reds : np.ndarray, shape (n, len(nodes))
+        The redundancy of each node, for each of `n` distributions.
+
+    Returns
+    -------
+    pis : np.ndarray, shape (n, len(nodes))
+        The partial information of each node.
+    """
+    index = {node: i for i, node in enumerate(nodes)}
+    pis = np.empty_like(reds)
+    finite = np.all(np.isfinite(reds), axis=1)
+
+    structure = getattr(lattice, '_structure', None)
+    if structure is not None:
+        order = [index[node] for node in lattice._nodes]
+        pis[np.ix_(finite, order)] = structure.mobius().dot(reds[np.ix_(finite, order)].T).T
+    else:
+        finite[:] = False
+
+    rest = ~finite
+    for node in reversed(list(nx.topological_sort(lattice))):
+        kids = [index[n] for n in descendants(lattice, node)]
+        i = index[node]
+        pis[rest, i] = reds[rest, i] - pis[np.ix_(rest, kids)].sum(axis=1)
+
+    return pis
 
 
 class BasePID(with_metaclass(ABCMeta, object)):
@@ -31,7 +226,18 @@ class BasePID(with_metaclass(ABCMeta, object)):
     _red_string = "I_r"
     _pi_string = "pi"
 
-    def __init__(self, dist, inputs=None, output=None, reds=None, pis=None, **kwargs):
+    # A vectorized measure, func(pmfs, node, output) -> reds, where `pmfs` is
+    # as from `_stack_pmfs`. Used by `batch` when given.
+    _measure_batch = None
+
+    # Whether the measure accepts a `warm` dict of optima from which to start
+    # its optimizations.
+    _warm_start = False
+
+    # The number of pmf entries to stack at a time in `batch`.
+    _batch_entries = 2**22
+
+    def __init__(self, dist, inputs=None, output=None, reds=None, pis=None, n_jobs=None, executor=None, **kwargs):
         """
         Parameters
         ----------
@@ -46,8 +252,20 @@ class BasePID(with_metaclass(ABCMeta, object)):
             Redundancy values pre-assessed.
         pis : dict, None
             Partial information values pre-assessed.
+        n_jobs : int, None
+            The number of workers with which to compute the redundancies of
+            the lattice nodes. If less than 1, use one per CPU. If None and
+            `executor` is None, the nodes are computed serially.
+        executor : str, Executor, None
+            How to compute the redundancies in parallel: 'process' (the
+            default when `n_jobs` is given) or 'thread' to create a pool of
+            `n_jobs` workers, or a `concurrent.futures.Executor` to submit the
+            nodes to. A process-based executor must be able to pickle the
+            distribution.
         """
         self._dist = dist
+        self._n_jobs = n_jobs
+        self._executor = executor
 
         if output is None:
             output = dist.rvs[-1]
@@ -173,15 +391,34 @@ class BasePID(with_metaclass(ABCMeta, object)):
         if pis is None:  # pragma: no cover
             pis = {}
 
-        for node in self._lattice:
-            if node not in reds:  # pragma: no branch
-                reds[node] = self._measure(self._dist, node, self._output, **self._kwargs)
+        nodes = [node for node in self._lattice if node not in reds]
+        reds.update(self._measure_nodes(nodes))
 
         reds, pis = self._compute_mobius_inversion(reds=reds, pis=pis)
 
         nx.set_node_attributes(self._lattice, name='red', values=reds)
         nx.set_node_attributes(self._lattice, name='pi', values=pis)
 
+    def _measure_nodes(self, nodes):
+        """
+        Compute the redundancy of each of `nodes`, in parallel if requested.
+
+        Parameters
+        ----------
+        nodes : list
+            The lattice nodes to compute the redundancies of.
+
+        Returns
+        -------
+        reds : dict
+            The redundancy of each node.
+        """
+        shared = (self._measure, self._dist, self._output, self._kwargs)
+        values = map_in_pool(_measure_node, [(node,) for node in nodes],
+                             n_jobs=self._n_jobs, executor=self._executor,
+                             shared=shared)
+        return dict(zip(nodes, values))
+
     def _compute_mobius_inversion(self, reds=None, pis=None):
         """
         Perform as much of a Mobius inversion as possible.
@@ -205,6 +442,15 @@ class BasePID(with_metaclass(ABCMeta, object)):
         if pis is None:  # pragma: no cover
             pis = {}
 
+        # With every redundancy known, the inversion is a single product
+        # with the lattice's (shared) Mobius matrix.
+        structure = getattr(self._lattice, '_structure', None)
+        if structure is not None and not pis and len(reds) == len(self._lattice):
+            values = np.array([reds[node] for node in self._lattice._nodes], dtype=float)
+            if np.all(np.isfinite(values)):
+                pis.update(zip(self._lattice._nodes, structure.mobius().dot(values)))
+                return reds, pis
+
         for node in reversed(list(nx.topological_sort(self._lattice))):
             if node not in pis:
                 try:
@@ -214,6 +460,71 @@ class BasePID(with_metaclass(ABCMeta, object)):
 
         return reds, pis
 
+    @classmethod
+    def batch(cls, dists, inputs=None, output=None, **kwargs):
+        """
+        Compute the decomposition of each of several distributions which share
+        their inputs and output.
+
+        The lattice is constructed once. Measures with a vectorized form are
+        computed over the stacked pmfs, and the partial informations are all
+        found by a single Mobius inversion. Other measures are computed for
+        one distribution at a time, optimizations starting from the optima
+        found for the previous distribution where the measure allows.
+
+        Parameters
+        ----------
+        dists : iterable of Distributions
+            The distributions to decompose, each over the same random
+            variables.
+        inputs : iter of iters, None
+            The set of input variables, as indices. If None, `dist.rvs` less
+            indices in `output` is used.
+        output : iter, None
+            The output variable, as indices. If None, `dist.rvs[-1]` is used.
+        kwargs : dict
+            Additional keyword arguments for the measure.
+
+        Returns
+        -------
+        nodes : list
+            The nodes of the lattice, sorted as for display.
+        pis : np.ndarray, shape (len(dists), len(nodes))
+            The partial information of each node, for each distribution.
+        """
+        dists = list(dists)
+
+        if output is None:
+            output = dists[0].rvs[-1]
+        if inputs is None:
+            inputs = [var for var in dists[0].rvs if var[0] not in output]
+        inputs = tuple(map(tuple, inputs))
+        output = tuple(output)
+
+        lattice = pid_lattice(inputs)
+        nodes = sorted(lattice, key=sort_key(lattice))
+
+        if cls._measure_batch is not None:
+            reds = np.empty((len(dists), len(nodes)))
+            variables = list(flatten(inputs)) + list(output)
+            size = max(1, cls._batch_entries // int(np.prod([len(a) for a in dists[0].alphabet])))
+            for start in range(0, len(dists), size):
+                chunk = slice(start, start + size)
+                pmfs = _stack_pmfs(dists[chunk])
+                pmfs = _marginal(pmfs, variables)
+                for i, node in enumerate(nodes):
+                    reds[chunk, i] = cls._measure_batch(pmfs, node, output, **kwargs)
+            return nodes, _batch_inversion(lattice, nodes, reds)
+
+        if cls._warm_start:
+            kwargs.setdefault('warm', {})
+
+        pis = np.empty((len(dists), len(nodes)))
+        for i, dist in enumerate(dists):
+            pid = cls(dist, inputs, output, **kwargs)
+            pis[i] = [pid.get_partial(node) for node in nodes]
+        return nodes, pis
+
     def get_redundancy(self, node):
         """
         Return the redundancy associated with `node`.
@@ -564,7 +875,8 @@ class BaseIncompletePID(BasePID):
         if self.REDUCED_PID:  # pragma: no branch
             for node in self._lattice:
                 if node not in reds and len(node) < len(self._inputs):
-                    sub_pid = self.__class__(self._dist.copy(), node, self._output)
+                    sub_pid = self.__class__(self._dist.copy(), node, self._output,
+                                             n_jobs=self._n_jobs, executor=self._executor)
                     reds[node] = sub_pid.get_redundancy(node)
 
         while True:
@@ -684,8 +996,7 @@ class BaseBivariatePID(BaseIncompletePID):
         """
         if reds is None:  # pragma: no branch
             reds = {}
-        for node in self._lattice:
-            if len(node) == 2 and node not in reds:
-                reds[node] = self._measure(self._dist, node, self._output, **self._kwargs)
+        nodes = [node for node in self._lattice if len(node) == 2 and node not in reds]
+        reds.update(self._measure_nodes(nodes))
 
         super(BaseBivariatePID, self)._compute(reds=reds, pis=pis)
@@ -103,3 +103,39 @@ def test_pid_broja4():
     assert not pid.complete
     assert pid.nonnegative
     assert pid.consistent
+
+
+@pytest.mark.flaky(reruns=5)
+def test_pid_broja_batch():
+    """
+    Test that PID_BROJA.batch, warm-starting each optimization, agrees with
+    decomposing each distribution.
+    """
+    dists = [bivariates[name] for name in ['and', 'diff', 'prob 1']]
+    nodes, pis = PID_BROJA.batch(dists)
+    for d, row in zip(dists, pis):
+        pid = PID_BROJA(d)
+        for node, pi in zip(nodes, row):
+            assert pi == pytest.approx(pid[node], abs=1e-4)
+
+
+def test_ibroja_warm():
+    """
+    Test that ibroja records its optimum for reuse.
+    """
+    d = bivariates['diff']
+    warm = {}
+    uniques = i_broja(d, ((0,), (1,)), (2,), warm=warm)
+    assert set(warm) == {((0,), (1,))}
+    assert i_broja(d, ((0,), (1,)), (2,), warm=warm) == pytest.approx(uniques, abs=1e-4)
+
+
+@pytest.mark.flaky(reruns=5)
+def test_ibroja_executor():
+    """
+    Test that ibroja accepts the parallel optimization arguments.
+    """
+    d = bivariates['cat']
+    uniques = i_broja(d, ((0,), (1,)), (2,), n_jobs=2, executor='thread')
+    assert uniques[(0,)] == pytest.approx(1, abs=1e-4)
+    assert uniques[(1,)] == pytest.approx(1, abs=1e-4)
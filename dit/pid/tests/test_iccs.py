@@ -6,6 +6,8 @@ import pytest
 
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
+
 from dit.pid.iccs import i_ccs, PID_CCS
 from dit.pid.distributions import bivariates, trivariates
 
@@ -100,3 +102,26 @@ def test_pid_ccs4():
 | {0}{1} | 0.8113 | 0.8113 |
 +--------+--------+--------+"""
     assert str(pid) == string
+
+
+@pytest.mark.parametrize('executor', [None, 'thread', ThreadPoolExecutor(2)])
+def test_pid_ccs_parallel(executor):
+    """
+    Test that computing the lattice in parallel agrees with serially.
+    """
+    d = trivariates['anddup']
+    serial = PID_CCS(d)
+    parallel = PID_CCS(d, n_jobs=2, executor=executor)
+    assert parallel == serial
+
+
+def test_pid_ccs_batch():
+    """
+    Test that PID_CCS.batch agrees with decomposing each distribution.
+    """
+    dists = [bivariates[name] for name in ['and', 'diff', 'prob 1']]
+    nodes, pis = PID_CCS.batch(dists)
+    for d, row in zip(dists, pis):
+        pid = PID_CCS(d)
+        for node, pi in zip(nodes, row):
+            assert pi == pytest.approx(pid[node], abs=1e-4)
@@ -4,7 +4,7 @@ Tests for dit.pid.imin.
 
 import pytest
 
-from dit.pid.imin import i_min, PID_WB
+from dit.pid.imin import i_min, s_i, PID_WB
 from dit.pid.distributions import bivariates, trivariates
 
 
@@ -73,3 +73,26 @@ def test_pid_wb3():
     assert pid.complete
     assert pid.nonnegative
     assert pid.consistent
+
+
+def test_pid_wb_batch():
+    """
+    Test that PID_WB.batch agrees with decomposing each distribution.
+    """
+    dists = [trivariates[name] for name in ['anddup', 'sum']]
+    nodes, pis = PID_WB.batch(dists)
+    for d, row in zip(dists, pis):
+        pid = PID_WB(d)
+        for node, pi in zip(nodes, row):
+            assert pi == pytest.approx(pid[node])
+
+
+def test_imin_specific():
+    """
+    Test that imin is the average minimum specific information.
+    """
+    d = trivariates['sum']
+    inputs = ((0,), (1, 2))
+    p_s = d.marginal((3,))
+    red = sum(p_s[s] * min(s_i(d, input_, (3,), s) for input_ in inputs) for s in p_s.outcomes)
+    assert i_min(d, inputs, (3,)) == pytest.approx(red)
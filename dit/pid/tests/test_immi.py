@@ -62,3 +62,15 @@ def test_pid_mmi2():
             assert pid[atom] == pytest.approx(1.0)
         else:
             assert pid[atom] == pytest.approx(0.0)
+
+
+def test_pid_mmi_batch():
+    """
+    Test that PID_MMI.batch agrees with decomposing each distribution.
+    """
+    dists = [bivariates[name] for name in ['and', 'diff', 'prob 1']]
+    nodes, pis = PID_MMI.batch(dists)
+    for d, row in zip(dists, pis):
+        pid = PID_MMI(d)
+        for node, pi in zip(nodes, row):
+            assert pi == pytest.approx(pid[node])
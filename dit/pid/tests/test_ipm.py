@@ -57,3 +57,24 @@ def test_pid_pm2():
     assert pid[((0,),)] == pytest.approx(-1.0)
     assert pid[((1,),)] == pytest.approx(0.0)
     assert pid[((0, 1),)] == pytest.approx(1.0)
+
+
+def test_pid_pm_batch():
+    """
+    Test that PID_PM.batch agrees with decomposing each distribution.
+    """
+    dists = [bivariates[name] for name in ['and', 'diff', 'prob 1']]
+    nodes, pis = PID_PM.batch(dists)
+    for d, row in zip(dists, pis):
+        pid = PID_PM(d)
+        for node, pi in zip(nodes, row):
+            assert pi == pytest.approx(pid[node])
+
+
+def test_ipm_marginal():
+    """
+    Test that variables outside the inputs and output are marginalized.
+    """
+    d = bivariates['diff']
+    e = d.coalesce([[0], [2], [1], [2]])
+    assert i_pm(e, ((0,), (1,)), (3,)) == pytest.approx(i_pm(d, ((0,), (2,)), (2,)))
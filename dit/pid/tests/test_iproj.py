@@ -71,3 +71,14 @@ def test_pid_proj3():
             assert pid[atom] == pytest.approx(1.0)
         else:
             assert pid[atom] == pytest.approx(0.0)
+
+
+def test_pid_proj_parallel():
+    """
+    Test that computing the bivariate redundancies in parallel agrees with
+    serially.
+    """
+    d = trivariates['anddup']
+    serial = PID_Proj(d)
+    parallel = PID_Proj(d, n_jobs=2, executor='thread')
+    assert parallel == serial
@@ -2,7 +2,13 @@
 Tests for dit.pid.lattice.
 """
 
-from dit.pid.lattice import least_upper_bound, pid_lattice
+import pytest
+
+import networkx as nx
+import numpy as np
+
+from dit.pid.lattice import (_pid_lattice_naive, ascendants, descendants,
+                             least_upper_bound, pid_lattice, sort_key)
 
 
 def test_lub():
@@ -13,3 +19,74 @@ def test_lub():
     lub = least_upper_bound(lattice, [((0,), (1,)), ((0,),)])
     assert lub == ((0, 1),)
 
+
+@pytest.mark.parametrize(('n', 'size'), [(1, 1), (2, 4), (3, 18), (4, 166)])
+def test_lattice_size(n, size):
+    """
+    Test that the lattices have the right number of nodes.
+    """
+    lattice = pid_lattice([(i,) for i in range(n)])
+    assert len(lattice) == size
+    assert lattice.root == (tuple(range(n)),)
+
+
+@pytest.mark.parametrize('inputs', [
+    ((0,), (1,), (2,)),
+    ((0, 1), (2,), (3, 4)),
+])
+def test_lattice_naive(inputs):
+    """
+    Test that the lattice agrees with the brute force construction.
+    """
+    fast = pid_lattice(inputs)
+    slow = _pid_lattice_naive(inputs)
+    assert list(fast.nodes()) == list(slow.nodes())
+    assert set(fast.edges()) == set(slow.edges())
+    fast_key, slow_key = sort_key(fast), sort_key(slow)
+    for node in fast:
+        assert set(descendants(fast, node)) == set(descendants(slow, node))
+        assert set(ascendants(fast, node)) == set(ascendants(slow, node))
+        assert fast_key(node) == slow_key(node)
+
+
+def test_lattice_closure():
+    """
+    Test that ascendants and descendants are the transitive closure of the
+    four-input lattice.
+    """
+    lattice = pid_lattice([(i,) for i in range(4)])
+    for node in lattice:
+        assert set(descendants(lattice, node)) == nx.descendants(lattice, node)
+        assert set(ascendants(lattice, node)) == nx.ancestors(lattice, node)
+
+
+def test_lattice_independent():
+    """
+    Test that lattices sharing a structure do not share attributes.
+    """
+    a = pid_lattice(((0,), (1,)))
+    b = pid_lattice(((0,), (1,)))
+    nx.set_node_attributes(a, name='red', values=0)
+    assert not nx.get_node_attributes(b, 'red')
+
+
+def test_lattice_overlapping():
+    """
+    Test that overlapping inputs are ordered by their variables.
+    """
+    inputs = ((0,), (0, 1))
+    lattice = pid_lattice(inputs)
+    assert list(lattice.nodes()) == list(_pid_lattice_naive(inputs).nodes())
+    assert ((0,), (0, 1)) not in lattice
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 4])
+def test_lattice_mobius(n):
+    """
+    Test that the Mobius matrix inverts summing partials over descendants.
+    """
+    lattice = pid_lattice([(i,) for i in range(n)])
+    pis = np.random.RandomState(n).rand(len(lattice))
+    index = lattice._index
+    reds = [sum(pis[index[d]] for d in descendants(lattice, node, self=True)) for node in lattice._nodes]
+    assert np.allclose(lattice._structure.mobius().dot(reds), pis)
@@ -11,7 +11,7 @@ from six import with_metaclass
 
 from collections import defaultdict
 
-from itertools import combinations, islice, permutations
+from itertools import combinations, permutations
 
 import prettytable
 
@@ -19,10 +19,12 @@ import numpy as np
 
 import networkx as nx
 
+from scipy.sparse import csr_matrix
+
 from .. import ditParams
 from ..algorithms import maxent_dist
 from ..other import extropy
-from ..shannon import entropy
+from ..shannon import all_entropies, entropy
 from ..utils import powerset
 
 __all__ = ['ShannonPartition',
@@ -31,22 +33,61 @@ __all__ = ['ShannonPartition',
           ]
 
 
-### TODO: enable caching on this?
 def poset_lattice(elements):
     """
     Return the Hasse diagram of the lattice induced by `elements`.
     """
-    child = lambda a, b: a.issubset(b) and (len(b) - len(a) == 1)
-
     lattice = nx.DiGraph()
 
-    for a, b in combinations(powerset(elements), 2):
-        if child(set(a), set(b)):
-            lattice.add_edge(b, a)
+    for b in powerset(elements):
+        for i in range(len(b)):
+            lattice.add_edge(b, b[:i] + b[i+1:])
+
+    if not lattice:
+        lattice.add_node(())
 
     return lattice
 
 
+_ATOM_MATRICES = {}
+
+
+def _atom_matrix(n):
+    """
+    Return the (shared) matrix taking the measures of every subset of `n`
+    variables to the atoms of their I-diagram.
+
+    Composing the co-information sums with their Mobius inversion, the atom
+    of the variables in `A` conditioned on the rest is the alternating sum
+    of the measures of the subsets containing the complement of `A`. Subsets
+    are indexed by bitmask, so row `A` holds the atom for the mask `A`.
+
+    Parameters
+    ----------
+    n : int
+        The number of variables.
+
+    Returns
+    -------
+    matrix : scipy.sparse.csr_matrix
+        The `2**n` by `2**n` matrix; row 0 is empty.
+    """
+    if n not in _ATOM_MATRICES:
+        full = (1 << n) - 1
+        sizes = [bin(mask).count('1') for mask in range(full + 1)]
+        rows, cols, vals = [], [], []
+        for atom in range(1, full + 1):
+            rest = full & ~atom
+            bits = [1 << i for i in range(n) if atom & (1 << i)]
+            for subset in powerset(bits):
+                mask = rest | sum(subset)
+                rows.append(atom)
+                cols.append(mask)
+                vals.append((-1)**(sizes[mask] + 1 + n - sizes[atom]))
+        _ATOM_MATRICES[n] = csr_matrix((vals, (rows, cols)), shape=(full + 1, full + 1))
+    return _ATOM_MATRICES[n]
+
+
 def constraint_lattice(elements):
     """
     Return a lattice of constrained marginals, with k=1 at the bottom and
@@ -133,6 +174,24 @@ class BaseInformationPartition(with_metaclass(ABCMeta, object)):
         s = "{0}[{1}{2}{3}]".format(symbol, a, sep, b)
         return s
 
+    def _measures(self, rvs):
+        """
+        Compute the measure of each subset of the variables.
+
+        Parameters
+        ----------
+        rvs : tuple
+            The random variables at the top of the lattice.
+
+        Returns
+        -------
+        values : np.ndarray
+            The measure of each subset, indexed by bitmask over `rvs`.
+        """
+        nodes = [tuple(rv for i, rv in enumerate(rvs) if mask & (1 << i))
+                 for mask in range(1 << len(rvs))]
+        return np.array([self._measure(self.dist, node) for node in nodes]) # pylint: disable=no-member
+
     def _partition(self):
         """
         Return all the atoms of the I-diagram for `dist`.
@@ -147,32 +206,18 @@ class BaseInformationPartition(with_metaclass(ABCMeta, object)):
             rvs = tuple(range(self.dist.outcome_length()))
 
         self._lattice = poset_lattice(rvs)
-        rlattice = self._lattice.reverse()
-        Hs = {}
-        Is = {}
-        atoms = {}
-        new_atoms = {}
-
-        # Entropies
-        for node in self._lattice:
-            Hs[node] = self._measure(self.dist, node) # pylint: disable=no-member
 
-        # Subset-sum type thing, basically co-information calculations.
-        for node in self._lattice:
-            Is[node] = sum((-1)**(len(rv)+1)*Hs[rv] for rv in nx.dfs_preorder_nodes(self._lattice, node))
-
-        # Mobius inversion of the above, resulting in the Shannon atoms.
-        for node in list(nx.topological_sort(self._lattice))[:-1]:
-            kids = islice(nx.dfs_preorder_nodes(rlattice, node), 1, None)
-            atoms[node] = Is[node] - sum(atoms[child] for child in kids)
+        # The co-information sums and their Mobius inversion, as one product.
+        values = _atom_matrix(len(rvs)).dot(self._measures(rvs))
 
         # get the atom indices in proper format
-        for atom, value in atoms.items():
-            a_rvs = tuple((_,) for _ in atom)
-            a_crvs = tuple(sorted(set(rvs) - set(atom)))
-            new_atoms[(a_rvs, a_crvs)] = value
+        atoms = {}
+        for mask in range(1, 1 << len(rvs)):
+            a_rvs = tuple((rv,) for i, rv in enumerate(rvs) if mask & (1 << i))
+            a_crvs = tuple(sorted(rv for i, rv in enumerate(rvs) if not mask & (1 << i)))
+            atoms[(a_rvs, a_crvs)] = values[mask]
 
-        self.atoms = new_atoms
+        self.atoms = atoms
 
     def __getitem__(self, item):
         """
@@ -252,6 +297,22 @@ class ShannonPartition(BaseInformationPartition):
     _measure = staticmethod(entropy)
     unit = 'bits'
 
+    def _measures(self, rvs):
+        """
+        Compute the entropy of each node of the lattice in a single sweep.
+
+        Parameters
+        ----------
+        rvs : tuple
+            The random variables at the top of the lattice.
+
+        Returns
+        -------
+        values : np.ndarray
+            The entropy of each subset, indexed by bitmask over `rvs`.
+        """
+        return all_entropies(self.dist, [[rv] for rv in rvs])
+
     @staticmethod
     def _symbol(rvs, crvs):
         """
@@ -5,9 +5,12 @@ import pytest
 
 from itertools import islice
 
+import networkx as nx
+
 from dit.example_dists import n_mod_m
 from dit.multivariate import coinformation as I, dual_total_correlation as B
 from dit.profiles.information_partitions import *
+from dit.profiles.information_partitions import poset_lattice
 from dit.utils import partitions, powerset
 
 
@@ -155,3 +158,14 @@ def test_dd4():
                  ((1, 2), (0,)),
                  ((0,), (1,), (2,))}
     assert deps == true_deps
+
+
+def test_poset_lattice():
+    """
+    Test that the lattice is the Hasse diagram of the subsets.
+    """
+    lattice = poset_lattice(range(3))
+    assert len(lattice) == 8
+    assert set(lattice.edges()) == {(b, a) for b in lattice for a in lattice
+                                    if set(a) < set(b) and len(b) - len(a) == 1}
+    assert nx.is_directed_acyclic_graph(lattice)
@@ -12,86 +12,189 @@ from ..divergences.pmf import relative_entropy
 from ..math.sampling import sample_simplex
 
 
+# The number of elements in the distortion matrices iterated at once.
+_BLOCK_SIZE = 2**22
+
+
 ###############################################################################
 # Rate-Distortion
 
 def _blahut_arimoto(p_x, beta, q_y_x, distortion, max_iters=100):
     """
-    Perform the Blahut-Arimoto algorithm.
+    Perform the Blahut-Arimoto algorithm on a stack of problems at once.
+
+    Each slice along the leading axis of `q_y_x` is iterated independently,
+    and stops being updated once its average distortion has converged.
 
     Parameters
     ----------
     p_x : np.ndarray
         The pmf to work with.
-    beta : float
-        The beta value for the optimization.
+    beta : np.ndarray
+        The beta value for each problem in the stack.
     q_y_x : np.ndarray
-        The initial condition to work with.
-    distortion : np.ndarray
-        The distortion matrix.
+        The initial conditions to work with, of shape (k, n, n).
+    distortion : func
+        The distortion matrix. It must broadcast over leading axes of the
+        conditional distribution passed to it.
     max_iters : int
         The maximum number of iterations.
 
     Returns
     -------
-    result : RateDistortionResult
-        A rate, distortion pair.
+    r : np.ndarray
+        The rate of each problem.
+    d : np.ndarray
+        The distortion of each problem.
     q_xy : np.ndarray
-        The joint distribution q(x, y).
+        The joint distributions q(x, y), of shape (k, n, n).
     """
-    def q_xy(q_y_x):
-        """
-        q(x,y) = q(y|x)p(x)
-        """
-        q_xy = p_x[:, np.newaxis] * q_y_x
-        return q_xy
-
-    def next_q_y(q_y_x):
-        """
-        q(y) = \sum_x q(y|x)p(x)
-        """
-        q_y = np.matmul(p_x, q_y_x)
-        return q_y
+    beta = np.asarray(beta, dtype=float)[:, np.newaxis, np.newaxis]
+    q_y_x = np.array(q_y_x, dtype=float)
 
-    def next_q_y_x(q_y, q_y_x):
+    def next_dist(q_y_x):
         """
-        q(y|x) = q(y) 2^{-\\beta * distortion}
+        The distortion matrix, expanded to the shape of `q_y_x`.
         """
-        d = distortion(p_x, q_y_x)
-        q_y_x = q_y * np.exp2(-beta * d)
-        q_y_x /= q_y_x.sum(axis=1, keepdims=True)
-        return q_y_x
+        return np.array(np.broadcast_to(distortion(p_x, q_y_x), q_y_x.shape))
 
     def av_dist(q_y_x, dist):
         """
         <dist> = \sum_{x, t} q(x,t) * d(x,t)
         """
-        d = np.matmul(p_x, (q_y_x * dist)).sum()
-        return d
-
-    def next_rd(q_y, q_y_x):
-        """
-        Iterate the BA equations.
-        """
-        q_y = next_q_y(q_y_x)
-        q_y_x = next_q_y_x(q_y, q_y_x)
-        d = av_dist(q_y_x, distortion(p_x, q_y_x))
-        return q_y, q_y_x, d
+        return np.matmul(p_x, q_y_x * dist).sum(axis=-1)
 
-    q_y = next_q_y(q_y_x)
-    prev_d = 0
-    d = av_dist(q_y_x, distortion(p_x, q_y_x))
+    dist = next_dist(q_y_x)
+    prev_d = np.zeros(len(q_y_x))
+    d = av_dist(q_y_x, dist)
 
+    active = np.flatnonzero(~np.isclose(prev_d, d))
     iters = 0
-    while not np.isclose(prev_d, d) and iters < max_iters:
+    while active.size and iters < max_iters:
         iters += 1
-        (q_y, q_y_x, d), prev_d = next_rd(q_y, q_y_x), d
 
-    q = q_xy(q_y_x)
-    r = np.nansum(q * np.log2(q / (q.sum(axis=0, keepdims=True) * q.sum(axis=1, keepdims=True))))
-    result = RateDistortionResult(r, d)
+        # q(y) = \sum_x q(y|x)p(x)
+        q_y = np.matmul(p_x, q_y_x[active])
+
+        # q(y|x) = q(y) 2^{-\beta * distortion}
+        q = q_y[:, np.newaxis, :] * np.exp2(-beta[active] * dist[active])
+        q /= q.sum(axis=-1, keepdims=True)
+
+        q_y_x[active] = q
+        dist[active] = next_dist(q)
+        prev_d[active] = d[active]
+        d[active] = av_dist(q, dist[active])
+
+        active = active[~np.isclose(prev_d[active], d[active])]
+
+    q = p_x[:, np.newaxis] * q_y_x
+    q_x = q.sum(axis=-1, keepdims=True)
+    q_y = q.sum(axis=-2, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.nansum(q * np.log2(q / (q_x * q_y)), axis=(-2, -1))
+
+    return r, d, q
+
+
+def _initial_conditions(n, restart):
+    """
+    Construct the initial conditions for a stack of restarts.
+
+    Restart 0 of each problem is the uniform channel, restart 1 a degenerate
+    channel, and the rest are sampled at random.
+
+    Parameters
+    ----------
+    n : int
+        The size of the alphabet.
+    restart : np.ndarray
+        The index of each restart within its problem.
+
+    Returns
+    -------
+    q_y_x : np.ndarray
+        The initial conditions, of shape (len(restart), n, n).
+    """
+    q_y_x = sample_simplex(n, len(restart) * n).reshape(-1, n, n)
+    q_y_x[restart == 0] = 1 / n
+    degenerate = restart == 1
+    q_y_x[degenerate] = 0
+    q_y_x[degenerate, 0, :] = 1
+    return q_y_x
+
 
-    return result, q
+def blahut_arimoto_batch(p_x, betas, distortion=hamming_distortion, max_iters=100, restarts=100, chunksize=None):
+    """
+    Perform a robust form of the Blahut-Arimoto algorithm for many betas.
+
+    Every beta and restart is stacked into a single array, which is solved
+    as a broadcasted computation, `chunksize` problems at a time.
+
+    Parameters
+    ----------
+    p_x : np.ndarray
+        The pmf to work with.
+    betas : iterable
+        The beta values for the optimization.
+    distortion : func
+        The distortion matrix.
+    max_iters : int
+        The maximum number of iterations.
+    restarts : int
+        The number of initial conditions to try for each beta.
+    chunksize : int, None
+        The number of betas and restarts to iterate at once. If None, it is
+        chosen so that each distortion matrix in the stack has a few million
+        elements in all.
+
+    Returns
+    -------
+    results : list of RateDistortionResult
+        The rate, distortion pair for each beta.
+    q_xy : np.ndarray
+        The distributions p(x, y) which achieve the optimal rate, distortion
+        for each beta, of shape (len(betas), n, n).
+    """
+    betas = np.asarray(betas, dtype=float)
+    n = len(p_x)
+    num = len(betas)
+
+    if chunksize is None:
+        chunksize = max(1, _BLOCK_SIZE // n**2)
+
+    problem = np.repeat(np.arange(num), restarts)
+    restart = np.tile(np.arange(restarts), num)
+
+    found = np.zeros(num, dtype=bool)
+    best = np.full(num, np.inf)
+    r = np.zeros(num)
+    d = np.zeros(num)
+    q = np.zeros((num, n, n))
+
+    for start in range(0, len(problem), chunksize):
+        chunk = slice(start, start + chunksize)
+        r_, d_, q_ = _blahut_arimoto(p_x=p_x,
+                                     beta=betas[problem[chunk]],
+                                     q_y_x=_initial_conditions(n, restart[chunk]),
+                                     distortion=distortion,
+                                     max_iters=max_iters
+                                     )
+
+        # Restarts which wandered onto an infinite distortion are never optimal.
+        objective = r_ + betas[problem[chunk]] * d_
+        objective[np.isnan(objective)] = np.inf
+
+        # Keep the first restart achieving the least objective for each beta.
+        for i in np.unique(problem[chunk]):
+            rows = np.flatnonzero(problem[chunk] == i)
+            j = rows[np.argmin(objective[rows])]
+            if not found[i] or objective[j] < best[i]:
+                found[i] = True
+                best[i] = objective[j]
+                r[i], d[i], q[i] = r_[j], d_[j], q_[j]
+
+    results = [RateDistortionResult(r_, d_) for r_, d_ in zip(r, d)]
+    return results, q
 
 
 def blahut_arimoto(p_x, beta, distortion=hamming_distortion, max_iters=100, restarts=100):
@@ -104,9 +207,7 @@ def blahut_arimoto(p_x, beta, distortion=hamming_distortion, max_iters=100, rest
         The pmf to work with.
     beta : float
         The beta value for the optimization.
-    q_y_x : np.ndarray
-        The initial condition to work with.
-    distortion : np.ndarray
+    distortion : func
         The distortion matrix.
     max_iters : int
         The maximum number of iterations.
@@ -120,69 +221,44 @@ def blahut_arimoto(p_x, beta, distortion=hamming_distortion, max_iters=100, rest
     q_xy : np.ndarray
         The distribution p(x, y) which achieves the optimal rate, distortion.
     """
-    n = len(p_x)
-    candidates = []
-    for i in range(restarts):
-
-        if i == 0:
-            q_y_x = np.ones((n, n)) / n
-        elif i == 1:
-            q_y_x = np.zeros((n, n))
-            q_y_x[0, :] = 1
-        else:
-            q_y_x = sample_simplex(n, n)
-
-        result = _blahut_arimoto(p_x=p_x,
-                                 beta=beta,
-                                 q_y_x=q_y_x,
-                                 distortion=distortion,
-                                 max_iters=max_iters
-                                 )
-        candidates.append(result)
-
-    rd = min(candidates, key=lambda result: result[0].rate + beta*result[0].distortion)
-    return rd
+    results, q_xy = blahut_arimoto_batch(p_x=p_x,
+                                         betas=[beta],
+                                         distortion=distortion,
+                                         max_iters=max_iters,
+                                         restarts=restarts
+                                         )
+    return results[0], q_xy[0]
 
 
 ###############################################################################
 # Information Bottleneck
 
-def blahut_arimoto_ib(p_xy, beta, divergence=relative_entropy, max_iters=100, restarts=250):  # pragma: no cover
+def _ib_distortion(p_xy, divergence):
     """
-    Perform a robust form of the Blahut-Arimoto algorithms.
+    Construct the bottleneck distortion d(x, t) = D[ p(Y|x) || q(Y|t) ].
 
     Parameters
     ----------
     p_xy : np.ndarray
         The pmf to work with.
-    beta : float
-        The beta value for the optimization.
-    q_y_x : np.ndarray
-        The initial condition to work with.
     divergence : func
-        The divergence measure to construct a distortion from: D(p(Y|x)||q(Y|t)).
-    max_iters : int
-        The maximum number of iterations.
-    restarts : int
-        The number of initial conditions to try.
+        The divergence measure to construct a distortion from.
 
     Returns
     -------
-    result : RateDistortionResult
-        The rate, distortion pair.
-    q_xyt : np.ndarray
-        The distribution p(x, y, t) which achieves the optimal rate, distortion.
+    distortion : func
+        The distortion matrix, which broadcasts over leading axes of the
+        conditional distribution passed to it.
     """
-    p_x = p_xy.sum(axis=1)
     p_y_x = p_xy / p_xy.sum(axis=1, keepdims=True)
 
     def next_q_y_t(q_t_x):
         """
         q(y|t) = (\sum_x p(x, y) * q(t|x)) / q(t)
         """
-        q_xyt = q_t_x[:, np.newaxis, :] * p_xy[:, :, np.newaxis]
-        q_ty = q_xyt.sum(axis=0).T
-        q_y_t = q_ty / q_ty.sum(axis=1, keepdims=True)
+        q_ty = np.matmul(np.swapaxes(q_t_x, -2, -1), p_xy)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            q_y_t = q_ty / q_ty.sum(axis=-1, keepdims=True)
         q_y_t[np.isnan(q_y_t)] = 1
         return q_y_t
 
@@ -191,20 +267,101 @@ def blahut_arimoto_ib(p_xy, beta, divergence=relative_entropy, max_iters=100, re
         d(x, t) = D[ p(Y|x) || q(Y|t) ]
         """
         q_y_t = next_q_y_t(q_t_x)
-        distortions = np.asarray([divergence(a, b) for a in p_y_x for b in q_y_t]).reshape(q_y_t.shape)
+        if divergence is relative_entropy:
+            p = p_y_x[:, np.newaxis, :]
+            q = q_y_t[..., np.newaxis, :, :]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                distortions = np.nansum(p * np.log2(p), axis=-1) - np.nansum(p * np.log2(q), axis=-1)
+        else:
+            flat = q_y_t.reshape((-1,) + q_y_t.shape[-2:])
+            distortions = np.asarray([[[divergence(a, b) for b in q] for a in p_y_x] for q in flat])
+            distortions = distortions.reshape(q_y_t.shape[:-2] + (len(p_y_x), q_y_t.shape[-2]))
         return distortions
 
-    rd, q_xt = blahut_arimoto(p_x=p_x,
-                              beta=beta,
-                              distortion=distortion,
-                              max_iters=max_iters,
-                              restarts=restarts
-                              )
+    return distortion
+
+
+def blahut_arimoto_ib_batch(p_xy, betas, divergence=relative_entropy, max_iters=100, restarts=250, chunksize=None):
+    """
+    Perform a robust form of the Blahut-Arimoto algorithm for the information
+    bottleneck at many betas.
+
+    Parameters
+    ----------
+    p_xy : np.ndarray
+        The pmf to work with.
+    betas : iterable
+        The beta values for the optimization.
+    divergence : func
+        The divergence measure to construct a distortion from: D(p(Y|x)||q(Y|t)).
+    max_iters : int
+        The maximum number of iterations.
+    restarts : int
+        The number of initial conditions to try for each beta.
+    chunksize : int, None
+        The number of betas and restarts to iterate at once. If None, it is
+        chosen so that the divergences computed for the distortion have a
+        few million elements in all.
+
+    Returns
+    -------
+    results : list of RateDistortionResult
+        The rate, distortion pair for each beta.
+    q_xyt : np.ndarray
+        The distributions p(x, y, t) which achieve the optimal rate, distortion
+        for each beta, of shape (len(betas),) + p_xy.shape + (n,).
+    """
+    p_x = p_xy.sum(axis=1)
+
+    if chunksize is None:
+        # The distortion compares each p(Y|x) with each q(Y|t).
+        chunksize = max(1, _BLOCK_SIZE // p_xy.size // len(p_x))
+
+    results, q_xt = blahut_arimoto_batch(p_x=p_x,
+                                         betas=betas,
+                                         distortion=_ib_distortion(p_xy, divergence),
+                                         max_iters=max_iters,
+                                         restarts=restarts,
+                                         chunksize=chunksize
+                                         )
 
-    q_t_x = q_xt / q_xt.sum(axis=1, keepdims=True)
-    q_xyt = p_xy[:, :, np.newaxis] * q_t_x[:, np.newaxis, :]
+    q_t_x = q_xt / q_xt.sum(axis=-1, keepdims=True)
+    q_xyt = p_xy[:, :, np.newaxis] * q_t_x[:, :, np.newaxis, :]
 
-    return rd, q_xyt
+    return results, q_xyt
+
+
+def blahut_arimoto_ib(p_xy, beta, divergence=relative_entropy, max_iters=100, restarts=250):
+    """
+    Perform a robust form of the Blahut-Arimoto algorithms.
+
+    Parameters
+    ----------
+    p_xy : np.ndarray
+        The pmf to work with.
+    beta : float
+        The beta value for the optimization.
+    divergence : func
+        The divergence measure to construct a distortion from: D(p(Y|x)||q(Y|t)).
+    max_iters : int
+        The maximum number of iterations.
+    restarts : int
+        The number of initial conditions to try.
+
+    Returns
+    -------
+    result : RateDistortionResult
+        The rate, distortion pair.
+    q_xyt : np.ndarray
+        The distribution p(x, y, t) which achieves the optimal rate, distortion.
+    """
+    results, q_xyt = blahut_arimoto_ib_batch(p_xy=p_xy,
+                                             betas=[beta],
+                                             divergence=divergence,
+                                             max_iters=max_iters,
+                                             restarts=restarts
+                                             )
+    return results[0], q_xyt[0]
 
 
 ###############################################################################
@@ -6,7 +6,7 @@ from __future__ import division
 
 import numpy as np
 
-from .blahut_arimoto import blahut_arimoto, blahut_arimoto_ib
+from .blahut_arimoto import blahut_arimoto, blahut_arimoto_batch, blahut_arimoto_ib_batch
 from .distortions import hamming
 from .information_bottleneck import InformationBottleneck, InformationBottleneckDivergence
 from .. import Distribution
@@ -90,6 +90,7 @@ class RDCurve(object):
             msg = "Method 'ba' does not support conditional variables."
             raise ditException(msg)
 
+        self._method = method
         self._get_rd = {'ba': self._get_rd_ba,
                         'sp': self._get_rd_sp,
                         }[method]
@@ -218,33 +219,40 @@ class RDCurve(object):
         """
         Sweep beta and compute the rate-distortion curve.
 
-        Parameters
-        ----------
-        method : {'sp', 'ba'}
-            The method of computation to use. 'sp' denotes scipy.optimize;
-            'ba' denotes blahut-arimoto.
+        If the method is 'ba', every beta is solved at once by a batched
+        Blahut-Arimoto; otherwise the betas are swept from largest to smallest
+        using numerical continuation.
         """
-        rates = []
-        distortions = []
-        ranks = []
-        alphabets = []
+        if self._method == 'ba':
+            results, qs = blahut_arimoto_batch(p_x=self.p_x,
+                                               betas=self.betas,
+                                               distortion=self._distortion.matrix,
+                                               )
+            rates, distortions = zip(*results)
+        else:
+            rates = []
+            distortions = []
+            qs = []
 
-        x0 = None
+            x0 = None
 
-        for beta in self.betas[::-1]:
-            r, d, q, x0 = self._get_rd(beta, initial=x0)
-            rates.append(r)
-            distortions.append(d)
+            for beta in self.betas[::-1]:
+                r, d, q, x0 = self._get_rd(beta, initial=x0)
+                rates.append(r)
+                distortions.append(d)
+                qs.append(q)
 
-            q_x_xhat = q / q.sum(axis=0, keepdims=True)
+            rates = rates[::-1]
+            distortions = distortions[::-1]
+            qs = qs[::-1]
 
-            ranks.append(np.linalg.matrix_rank(q_x_xhat, tol=1e-5))
-            alphabets.append((q.sum(axis=0) > 1e-6).sum())
+        qs = np.asarray(qs)
+        q_x_xhat = qs / qs.sum(axis=-2, keepdims=True)
 
-        self.rates = np.asarray(rates)[::-1]
-        self.distortions = np.asarray(distortions)[::-1]
-        self.ranks = np.asarray(ranks)[::-1]
-        self.alphabets = np.asarray(alphabets)[::-1]
+        self.rates = np.asarray(rates)
+        self.distortions = np.asarray(distortions)
+        self.ranks = np.asarray([np.linalg.matrix_rank(q, tol=1e-5) for q in q_x_xhat])
+        self.alphabets = (qs.sum(axis=-2) > 1e-6).sum(axis=-1)
 
     def plot(self, downsample=5):  # pragma: no cover
         """
@@ -397,27 +405,48 @@ class IBCurve(object):
         q_xyzt = self._bn.construct_joint(self._bn._optima)
         return q_xyzt, x0
 
-    def _get_opt_ba(self, beta, initial=None):  # pragma: no cover
+    def _get_opts_ba(self, betas):
         """
-        Compute the information bottleneck solution for `beta` using blahut-arimoto.
+        Compute the information bottleneck solutions for all `betas` at once
+        using a batched blahut-arimoto.
 
         Parameters
         ----------
-        beta : float
-            The beta value to optimize for.
-        initial : np.ndarray, None
-            An initial optimization vector, useful for numerical continuation.
+        betas : np.ndarray
+            The beta values to optimize for.
 
-        Returns
-        -------
+        Yields
+        ------
+        q : np.ndarray
+            The matrix p(x, y, z, t)
+        x0 : None
+            Blahut-Arimoto does not produce an optimization vector.
+        """
+        q_xyts = blahut_arimoto_ib_batch(p_xy=self.p_xy, betas=betas)[1]
+        for q_xyt in q_xyts:
+            yield q_xyt[:, :, np.newaxis, :], None
+
+    def _get_opts_sp(self, betas):
+        """
+        Compute the information bottleneck solutions for `betas` using
+        scipy.optimize, continuing each optimization from the last.
+
+        Parameters
+        ----------
+        betas : np.ndarray
+            The beta values to optimize for.
+
+        Yields
+        ------
         q : np.ndarray
             The matrix p(x, y, z, t)
         x0 : np.ndarray
             The found optima.
         """
-        q_xyt = blahut_arimoto_ib(p_xy=self.p_xy, beta=beta)[1]
-        q_xyzt = q_xyt[:, :, np.newaxis, :]
-        return q_xyzt, None
+        x0 = None
+        for beta in betas:
+            q_xyzt, x0 = self._get_opt_sp(beta, x0)
+            yield q_xyzt, x0
 
     def compute(self, method='sp'):
         """
@@ -429,9 +458,9 @@ class IBCurve(object):
             The method of computation to use. 'sp' denotes scipy.optimize;
             'ba' denotes blahut-arimoto.
         """
-        get_opt = {'ba': self._get_opt_ba,
-                   'sp': self._get_opt_sp,
-                   }[method]
+        get_opts = {'ba': self._get_opts_ba,
+                    'sp': self._get_opts_sp,
+                    }[method]
 
         complexities = []
         entropies = []
@@ -443,10 +472,7 @@ class IBCurve(object):
 
         x, y, z, t = [[0], [1], [2], [3]]
 
-        x0 = None
-
-        for beta in self.betas[::-1]:
-            q_xyzt, x0 = get_opt(beta, x0)
+        for q_xyzt, _ in get_opts(self.betas[::-1]):
             d = Distribution.from_ndarray(q_xyzt)
             complexities.append(total_correlation(d, [x, t], z))
             entropies.append(entropy(d, x, z))
@@ -30,7 +30,7 @@ Distortion = namedtuple('Distortion', ['name', 'matrix', 'optimizer'])
 def hamming_distortion(p_x, p_y_x):
     """
     """
-    distortion = 1 - np.eye(*p_y_x.shape)
+    distortion = 1 - np.eye(*p_y_x.shape[-2:])
     return distortion
 
 
@@ -38,8 +38,8 @@ def residual_entropy_distortion(p_x, p_y_x):
     """
     """
     p_xy = p_x[:, np.newaxis] * p_y_x
-    h_x_y = -np.log2(p_xy / p_xy.sum(axis=0, keepdims=True))
-    h_y_x = -np.log2(p_xy / p_xy.sum(axis=1, keepdims=True))
+    h_x_y = -np.log2(p_xy / p_xy.sum(axis=-2, keepdims=True))
+    h_y_x = -np.log2(p_xy / p_xy.sum(axis=-1, keepdims=True))
     distortion = h_x_y + h_y_x
     return distortion
 
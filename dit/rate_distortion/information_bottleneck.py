@@ -111,6 +111,24 @@ class InformationBottleneck(BaseAuxVarOptimizer):
             """
             return cmi - relevance(pmf)
 
+        def distortion_gradient(pmf):
+            """
+            Compute the gradient of the distortion.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability mass function.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            return -relevance.gradient(pmf)
+
+        distortion.gradient = distortion_gradient
+
         return distortion
 
     def _objective(self):
@@ -177,6 +195,66 @@ class InformationBottleneck(BaseAuxVarOptimizer):
             obj = self.entropy(pmf) + self._beta * self.distortion(pmf)
             return obj
 
+        def ib_jacobian(self, x):
+            """
+            The gradient of the information bottleneck objective.
+
+            Parameters
+            ----------
+            x : np.ndarray
+                An optimization vector.
+
+            Returns
+            -------
+            jac : np.ndarray
+                The gradient of the objective.
+            """
+            pmf = self.construct_joint(x)
+            grad = self.complexity.gradient(pmf) + self._beta * self.distortion.gradient(pmf)
+            return self._backprop_joint(x, grad)
+
+        def gib_jacobian(self, x):
+            """
+            The gradient of the generalized information bottleneck objective.
+
+            Parameters
+            ----------
+            x : np.ndarray
+                An optimization vector.
+
+            Returns
+            -------
+            jac : np.ndarray
+                The gradient of the objective.
+            """
+            pmf = self.construct_joint(x)
+            grad = self.entropy.gradient(pmf) - self._alpha * self.other.gradient(pmf) + self._beta * self.distortion.gradient(pmf)
+            return self._backprop_joint(x, grad)
+
+        def dib_jacobian(self, x):
+            """
+            The gradient of the deterministic information bottleneck objective.
+
+            Parameters
+            ----------
+            x : np.ndarray
+                An optimization vector.
+
+            Returns
+            -------
+            jac : np.ndarray
+                The gradient of the objective.
+            """
+            pmf = self.construct_joint(x)
+            grad = self.entropy.gradient(pmf) + self._beta * self.distortion.gradient(pmf)
+            return self._backprop_joint(x, grad)
+
+        # Not every distortion measure is differentiable.
+        if hasattr(self.distortion, 'gradient'):
+            ib_objective.jacobian = ib_jacobian
+            gib_objective.jacobian = gib_jacobian
+            dib_objective.jacobian = dib_jacobian
+
         if np.isclose(self._alpha, 1.0):
             return ib_objective
         elif np.isclose(self._alpha, 0.0):
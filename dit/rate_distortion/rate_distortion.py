@@ -134,6 +134,66 @@ class BaseRateDistortion(BaseAuxVarOptimizer):
             obj = self.entropy(pmf) + self._beta * self.distortion(pmf)
             return obj
 
+        def rd_jacobian(self, x):
+            """
+            The gradient of the rate-distortion objective.
+
+            Parameters
+            ----------
+            x : np.ndarray
+                An optimization vector.
+
+            Returns
+            -------
+            jac : np.ndarray
+                The gradient of the objective.
+            """
+            pmf = self.construct_joint(x)
+            grad = self.rate.gradient(pmf) + self._beta * self.distortion.gradient(pmf)
+            return self._backprop_joint(x, grad)
+
+        def grd_jacobian(self, x):
+            """
+            The gradient of the generalized rate-distortion objective.
+
+            Parameters
+            ----------
+            x : np.ndarray
+                An optimization vector.
+
+            Returns
+            -------
+            jac : np.ndarray
+                The gradient of the objective.
+            """
+            pmf = self.construct_joint(x)
+            grad = self.entropy.gradient(pmf) - self._alpha * self.other.gradient(pmf) + self._beta * self.distortion.gradient(pmf)
+            return self._backprop_joint(x, grad)
+
+        def drd_jacobian(self, x):
+            """
+            The gradient of the deterministic rate-distortion objective.
+
+            Parameters
+            ----------
+            x : np.ndarray
+                An optimization vector.
+
+            Returns
+            -------
+            jac : np.ndarray
+                The gradient of the objective.
+            """
+            pmf = self.construct_joint(x)
+            grad = self.entropy.gradient(pmf) + self._beta * self.distortion.gradient(pmf)
+            return self._backprop_joint(x, grad)
+
+        # Not every distortion measure is differentiable.
+        if hasattr(self.distortion, 'gradient'):
+            rd_objective.jacobian = rd_jacobian
+            grd_objective.jacobian = grd_jacobian
+            drd_objective.jacobian = drd_jacobian
+
         if np.isclose(self._alpha, 1.0):
             return rd_objective
         elif np.isclose(self._alpha, 0.0):
@@ -232,6 +292,27 @@ class RateDistortionHamming(BaseRateDistortion):
             d = (hamming * pmf_xt).sum()
             return d
 
+        def distortion_gradient(pmf):
+            """
+            The gradient of the Hamming distortion.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            grad = hamming
+            for i in sorted(idx_xt):
+                grad = np.expand_dims(grad, i)
+            return np.broadcast_to(grad, pmf.shape)
+
+        distortion.gradient = distortion_gradient
+
         return distortion
 
 
@@ -267,6 +348,24 @@ class RateDistortionResidualEntropy(BaseRateDistortion):
             """
             return h(pmf) - i(pmf)
 
+        def distortion_gradient(pmf):
+            """
+            The gradient of the residual entropy distortion.
+
+            Parameters
+            ----------
+            pmf : np.ndarray
+                The joint probability distribution.
+
+            Returns
+            -------
+            grad : np.ndarray
+                The gradient with respect to `pmf`.
+            """
+            return h.gradient(pmf) - i.gradient(pmf)
+
+        distortion.gradient = distortion_gradient
+
         return distortion
 
 
@@ -0,0 +1,66 @@
+"""
+Tests for dit.rate_distortion.blahut_arimoto
+"""
+
+from __future__ import division
+
+import pytest
+
+import numpy as np
+
+from dit.rate_distortion.blahut_arimoto import (blahut_arimoto,
+                                                blahut_arimoto_batch,
+                                                blahut_arimoto_ib_batch,
+                                                )
+from dit.rate_distortion.distortions import residual_entropy_distortion
+from dit.shannon import entropy
+
+
+def test_ba_batch():
+    """
+    Test that every beta of a batch lies on the known curve.
+    """
+    p_x = np.array([1/2, 1/2])
+    betas = np.linspace(0, 10, 11)
+    results, q = blahut_arimoto_batch(p_x, betas)
+    assert q.shape == (11, 2, 2)
+    assert np.allclose(q.sum(axis=(1, 2)), 1)
+    for r, d in results:
+        assert r == pytest.approx(1 - entropy(d), abs=1e-4)
+
+
+def test_ba_batch_single():
+    """
+    Test that a batch agrees with single solutions.
+    """
+    p_x = np.array([1/3, 2/3])
+    betas = [0.5, 2.0]
+    results, _ = blahut_arimoto_batch(p_x, betas, distortion=residual_entropy_distortion)
+    for beta, (r1, d1) in zip(betas, results):
+        (r2, d2), _ = blahut_arimoto(p_x, beta, distortion=residual_entropy_distortion)
+        assert r1 + beta*d1 == pytest.approx(r2 + beta*d2, abs=1e-4)
+
+
+def test_ba_ib_batch():
+    """
+    Test the shape of a batched bottleneck.
+    """
+    p_xy = np.array([[1, 0, 1], [0, 0, 1], [0, 1, 1]]) / 5
+    results, q = blahut_arimoto_ib_batch(p_xy, [1.0, 2.5], restarts=25)
+    assert q.shape == (2, 3, 3, 3)
+    assert np.allclose(q.sum(axis=3), p_xy)
+    assert results[1].rate == pytest.approx(0.8, abs=1e-4)
+
+
+@pytest.mark.parametrize('chunksize', [1, 7, 30])
+def test_ba_ib_batch_chunks(chunksize):
+    """
+    Test that iterating the stack in chunks gives the same solutions.
+    """
+    p_xy = np.array([[1, 0, 1], [0, 0, 1], [0, 1, 1]]) / 5
+    np.random.seed(0)
+    results1, q1 = blahut_arimoto_ib_batch(p_xy, [0.5, 1.0, 2.5], restarts=10)
+    np.random.seed(0)
+    results2, q2 = blahut_arimoto_ib_batch(p_xy, [0.5, 1.0, 2.5], restarts=10, chunksize=chunksize)
+    assert np.allclose(q1, q2)
+    assert np.allclose(results1, results2)
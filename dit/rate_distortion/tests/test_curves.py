@@ -120,3 +120,16 @@ def test_simple_ib_3():
     assert ib.relevances[2] == pytest.approx(0.0, abs=1e-4)
     assert ib.relevances[5] == pytest.approx(0.4080081559717983, abs=1e-4)
     assert ib.relevances[20] == pytest.approx(0.5709505944546684, abs=1e-4)
+
+
+@pytest.mark.flaky(reruns=5)
+def test_simple_ib_4():
+    """
+    Test against known values, using blahut-arimoto.
+    """
+    dist = Distribution(['00', '02', '12', '21', '22'], [1/5]*5)
+    ib = IBCurve(dist, rvs=[[0], [1]], beta_max=10, beta_num=21, method='ba')
+    assert ib.complexities[2] == pytest.approx(0.0, abs=1e-4)
+    assert ib.complexities[5] == pytest.approx(0.8, abs=1e-4)
+    assert ib.relevances[2] == pytest.approx(0.0, abs=1e-4)
+    assert ib.relevances[5] == pytest.approx(0.4, abs=1e-4)
@@ -3,5 +3,6 @@ The basic forms of Shannon's information measures.
 """
 
 from .shannon import (
-	entropy, conditional_entropy, mutual_information, entropy_pmf
+	entropy, conditional_entropy, mutual_information, entropy_pmf,
+	all_entropies
 )
@@ -4,11 +4,16 @@ Some basic Shannon information quantities.
 """
 
 from ..math import LogOperations
-from ..helpers import RV_MODES
+from ..helpers import (group_labels, normalize_rvs, parse_rvs,
+                       variable_labels, RV_MODES)
 
 import numpy as np
 
 
+# The largest number of cells for which `all_entropies` builds a dense array.
+_DENSE_LIMIT = 2**24
+
+
 def entropy_pmf(pmf):
     """
     Returns the entropy of the probability mass function.
@@ -71,9 +76,17 @@ def entropy(dist, rvs=None, rv_mode=None):
             rvs = range(dist.outcome_length()) # pylint: disable=no-member
             rv_mode = RV_MODES.INDICES
 
-        d = dist.marginal(rvs, rv_mode=rv_mode) # pylint: disable=no-member
+        # Entropies of subsets are cached on the distribution.
+        _, indexes = parse_rvs(dist, rvs, rv_mode)
+        cache = dist._entropy_cache() # pylint: disable=no-member
+        key = (frozenset(indexes), frozenset())
+        if key in cache:
+            return cache[key]
+
+        d = dist.marginal(indexes, rv_mode=RV_MODES.INDICES) # pylint: disable=no-member
     else:
         d = dist
+        cache, key = {}, None
 
     pmf = d.pmf
     if d.is_log():
@@ -85,6 +98,7 @@ def entropy(dist, rvs=None, rv_mode=None):
         terms = -pmf * log(pmf)
 
     H = np.nansum(terms)
+    cache[key] = H
     return H
 
 
@@ -122,10 +136,16 @@ def conditional_entropy(dist, rvs_X, rvs_Y, rv_mode=None):
         # instead of 1e-12 or something smaller.
         return 0.0
 
-    MI_XY = mutual_information(dist, rvs_X, rvs_Y, rv_mode=rv_mode)
-    H_X = entropy(dist, rvs_X, rv_mode=rv_mode)
-    H_XgY = H_X - MI_XY
-    return H_XgY
+    # Conditional entropies are cached alongside the subset entropies.
+    _, indexes_X = parse_rvs(dist, rvs_X, rv_mode)
+    _, indexes_Y = parse_rvs(dist, rvs_Y, rv_mode)
+    cache = dist._entropy_cache()
+    key = (frozenset(indexes_X), frozenset(indexes_Y))
+    if key not in cache:
+        MI_XY = mutual_information(dist, rvs_X, rvs_Y, rv_mode=rv_mode)
+        H_X = entropy(dist, rvs_X, rv_mode=rv_mode)
+        cache[key] = H_X - MI_XY
+    return cache[key]
 
 
 def mutual_information(dist, rvs_X, rvs_Y, rv_mode=None):
@@ -163,3 +183,104 @@ def mutual_information(dist, rvs_X, rvs_Y, rv_mode=None):
     H_XY = entropy(dist, set(rvs_X) | set(rvs_Y), rv_mode=rv_mode)
     I = H_X + H_Y - H_XY
     return I
+
+
+def all_entropies(dist, rvs=None, crvs=None, rv_mode=None):
+    """
+    Returns the entropies of every subset of `rvs`, conditioned on `crvs`.
+
+    The entropies are computed in a single sweep. The pmf is arranged as a
+    dense array with one axis per group of random variables, and the marginal
+    of each subset is obtained from the marginal of a superset by summing out
+    a single axis, so that no subset is marginalized from scratch.
+
+    Parameters
+    ----------
+    dist : Distribution
+        The distribution from which the entropies are calculated.
+    rvs : list, None
+        A list of groups of random variables. If None, then each random
+        variable is its own group.
+    crvs : list, None
+        The random variables to condition on. If None, then no variables are
+        conditioned on.
+    rv_mode : str, None
+        Specifies how to interpret `rvs` and `crvs`. Valid options are:
+        {'indices', 'names'}. If equal to 'indices', then the elements of
+        `crvs` and `rvs` are interpreted as random variable indices. If equal
+        to 'names', the the elements are interpreted as random variable names.
+        If `None`, then the value of `dist._rv_mode` is consulted, which
+        defaults to 'indices'.
+
+    Returns
+    -------
+    H : NumPy array, shape (2**len(rvs),)
+        The entropies, indexed by bitmask. ``H[mask]`` is the entropy of the
+        union of the groups ``rvs[i]`` for which bit ``i`` of `mask` is set,
+        conditioned on `crvs`.
+
+    Raises
+    ------
+    ditException
+        Raised if `dist` is not a joint distribution or if `rvs` or `crvs`
+        contain non-existant random variables.
+
+    Examples
+    --------
+    >>> d = dit.example_dists.Xor()
+    >>> all_entropies(d)
+    array([0., 1., 1., 2., 1., 2., 2., 2.])
+
+    """
+    rvs, crvs, rv_mode = normalize_rvs(dist, rvs, crvs, rv_mode)
+    groups = [parse_rvs(dist, set(rv), rv_mode)[1] for rv in rvs]
+    cindexes = parse_rvs(dist, set(crvs), rv_mode)[1]
+
+    pmf = dist.pmf
+    if dist.is_log():
+        pmf = dist.get_base(numerical=True)**pmf
+
+    labels = variable_labels(dist)
+    columns = [group_labels(labels[:, list(group)]) for group in groups]
+    columns.append(group_labels(labels[:, list(cindexes)]))
+
+    n = len(groups)
+    H = np.empty(2**n)
+    shape = tuple(int(column.max()) + 1 if len(column) else 1
+                  for column in columns)
+
+    if np.prod(shape, dtype=float) <= _DENSE_LIMIT:
+        joint = np.ravel_multi_index(columns, shape)
+        joint = np.bincount(joint, weights=pmf, minlength=int(np.prod(shape)))
+
+        def sweep(p, mask, limit):
+            """
+            Compute the entropies of `mask` and its descendants. Each subset
+            is reached by removing bits in decreasing order, so the axes below
+            `limit` are exactly bits 0 through `limit` - 1.
+            """
+            H[mask] = entropy_pmf(p.ravel())
+            for bit in range(limit):
+                sweep(p.sum(axis=bit), mask ^ (1 << bit), bit)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sweep(joint.reshape(shape), 2**n - 1, n)
+    else:
+        # Too large to be dense, so group the outcomes of each subset.
+        columns = np.column_stack(columns)
+        for mask in range(2**n):
+            cols = [i for i in range(n) if mask >> i & 1] + [n]
+            p = np.bincount(group_labels(columns[:, cols]), weights=pmf)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                H[mask] = entropy_pmf(p)
+
+    # Condition on `crvs`, and make subsets of `crvs` exactly zero.
+    H -= H[0]
+    contained = sum(1 << i for i, group in enumerate(groups)
+                    if set(group) <= set(cindexes))
+    H[(np.arange(2**n) & ~contained) == 0] = 0
+
+    if dist.is_log():
+        H /= np.log2(dist.get_base(numerical=True))
+
+    return H
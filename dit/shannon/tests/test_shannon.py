@@ -12,7 +12,8 @@ from dit import Distribution as D, ScalarDistribution as SD
 from dit.shannon import (entropy as H,
                          mutual_information as I,
                          conditional_entropy as CH,
-                         entropy_pmf)
+                         entropy_pmf,
+                         all_entropies)
 
 
 def test_entropy_pmf1d():
@@ -89,3 +90,59 @@ def test_CH1():
     assert CH(d, [0], [1, 2]) == pytest.approx(0.0)
     assert CH(d, [0, 1], [2]) == pytest.approx(1.0)
     assert CH(d, [0], [0]) == pytest.approx(0.0)
+
+
+def test_H_cache():
+    """ Test that cached entropies are invalidated by modifications """
+    d = D(['00', '01', '10', '11'], [1/4]*4)
+    assert H(d, [0]) == pytest.approx(1.0)
+    assert CH(d, [0], [1]) == pytest.approx(1.0)
+    assert (frozenset([0]), frozenset([1])) in d._entropy_cache()
+    d['00'] = 1/2
+    d['01'] = 0
+    assert not d._entropy_cache()
+    assert H(d, [1]) == pytest.approx(0.8112781244591328)
+    d.pmf = np.array([1/2, 1/2, 0, 0])
+    assert H(d, [0]) == pytest.approx(0.0)
+    assert H(d, [1]) == pytest.approx(1.0)
+    d.set_base(2)
+    assert H(d, [1]) == pytest.approx(1.0)
+
+
+def test_H_cache_inplace():
+    """ Test that cached entropies are invalidated by in-place writes to the pmf """
+    d = D(['00', '01', '10', '11'], [1/4]*4)
+    assert H(d) == pytest.approx(2.0)
+    d.pmf[:] = [1/2, 1/2, 0, 0]
+    assert H(d) == pytest.approx(1.0)
+    d.pmf[2:] = [1/4, 1/4]
+    d.pmf[:2] = [1/4, 1/4]
+    assert H(d) == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize('base', ['linear', 2, 'e'])
+@pytest.mark.parametrize(('rvs', 'crvs'), [
+    (None, None),
+    ([[0], [1, 2], [3, 0]], [2]),
+    ([[0, 1], [2], [3]], [0, 1]),
+])
+def test_all_entropies(rvs, crvs, base):
+    """ Test that each subset entropy matches the direct calculation """
+    d = D.from_ndarray(np.arange(1, 25).reshape(2, 3, 2, 2) / 300)
+    d.set_base(base)
+    Hs = all_entropies(d, rvs, crvs)
+    rvs = [[i] for i in range(4)] if rvs is None else rvs
+    crvs = [] if crvs is None else crvs
+    for mask, value in enumerate(Hs):
+        sub = set().union(*[rv for i, rv in enumerate(rvs) if mask >> i & 1])
+        assert value == pytest.approx(CH(d, sub, crvs))
+
+
+def test_all_entropies_sparse(monkeypatch):
+    """ Test the fallback for distributions too large to be dense """
+    import dit.shannon.shannon
+    d = D(['000', '011', '101', '110'], [1/4]*4)
+    dense = all_entropies(d)
+    monkeypatch.setattr(dit.shannon.shannon, '_DENSE_LIMIT', 1)
+    assert np.allclose(all_entropies(d), dense)
+    assert np.allclose(dense, [0, 1, 1, 2, 1, 2, 2, 2])
@@ -0,0 +1,227 @@
+"""
+Saving distributions to, and loading them from, disk.
+
+A distribution is stored as a directory holding one file per column: the pmf
+and the integer-coded outcomes are NumPy ``.npy`` arrays, and everything else
+(the alphabets, random variable names, base and mask) is kept in a small
+metadata file. Since the arrays are stored raw, they can be memory-mapped
+rather than read: a distribution loaded with ``mmap=True`` reads its pmf and
+outcome table from disk only as they are accessed, and processes loading the
+same file share the pages holding them.
+
+"""
+
+import os
+
+import numpy as np
+from six.moves import cPickle as pickle
+
+from .exceptions import ditException
+from .helpers import get_product_func
+from .npdist import Distribution, _make_coded_distribution
+from .npscalardist import _make_distribution
+from .samplespace import CartesianProduct, SampleSpace, ScalarSampleSpace
+
+__all__ = [
+    'save_distribution',
+    'load_distribution',
+    'load_pmf',
+]
+
+_FORMAT_VERSION = 1
+
+_META = 'meta.pkl'
+_PMF = 'pmf.npy'
+_CODES = 'codes.npy'
+
+
+def _encode_space(space):
+    """
+    Returns a picklable description of the sample space or alphabet `space`.
+
+    """
+    if isinstance(space, CartesianProduct):
+        alphabets = [_encode_space(alphabet) for alphabet in space.alphabets]
+        return ('product', space._outcome_class, alphabets)
+    elif isinstance(space, SampleSpace):
+        return ('space', list(space))
+    elif isinstance(space, ScalarSampleSpace):
+        return ('scalar', list(space))
+    else:
+        return ('alphabet', tuple(space))
+
+
+def _decode_space(encoded):
+    """
+    Reconstructs the sample space or alphabet described by `encoded`.
+
+    """
+    kind, value = encoded[0], encoded[-1]
+    if kind == 'product':
+        alphabets = [_decode_space(alphabet) for alphabet in value]
+        return CartesianProduct(alphabets, get_product_func(encoded[1]))
+    elif kind == 'space':
+        return SampleSpace(value)
+    elif kind == 'scalar':
+        return ScalarSampleSpace(value)
+    else:
+        return value
+
+
+def _outcome_indices(dist):
+    """
+    Returns the index of each outcome of `dist` within its sample space.
+
+    """
+    index = {outcome: i for i, outcome in enumerate(dist._sample_space)}
+    return np.array([index[outcome] for outcome in dist.outcomes], dtype=np.intp)
+
+
+def save_distribution(dist, path):
+    """
+    Saves `dist` to the directory `path`.
+
+    Joint distributions over a Cartesian product sample space are stored by
+    their integer-coded outcome table, one column per random variable. Other
+    distributions are stored by the index of each outcome in their sample
+    space.
+
+    Parameters
+    ----------
+    dist : ScalarDistribution or Distribution
+        The distribution to save.
+    path : str
+        The directory to save the distribution in. It is created if it does
+        not already exist.
+
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path)
+
+    meta = {'version': _FORMAT_VERSION,
+            'base': dist.get_base(),
+            'sparse': dist.is_sparse(),
+            'sample_space': _encode_space(dist._sample_space),
+            }
+
+    if dist.is_joint():
+        meta['joint'] = True
+        meta['rv_names'] = dist.get_rv_names()
+        meta['mask'] = tuple(dist._mask)
+        coded = isinstance(dist._sample_space, CartesianProduct)
+        if coded:
+            codes, _ = dist._outcome_codes()
+        else:
+            codes = _outcome_indices(dist)
+        meta['coded'] = coded
+    else:
+        meta['joint'] = False
+        codes = _outcome_indices(dist)
+
+    np.save(os.path.join(path, _PMF), np.asarray(dist.pmf, dtype=float))
+    np.save(os.path.join(path, _CODES), np.asarray(codes))
+    with open(os.path.join(path, _META), 'wb') as f:
+        pickle.dump(meta, f, protocol=2)
+
+
+def _load_meta(path):
+    """
+    Returns the metadata of the distribution saved in `path`.
+
+    """
+    with open(os.path.join(path, _META), 'rb') as f:
+        meta = pickle.load(f)
+    if meta.get('version') != _FORMAT_VERSION:
+        msg = 'Unsupported distribution format version: {0}'
+        raise ditException(msg.format(meta.get('version')))
+    return meta
+
+
+def load_pmf(path, mmap=True):
+    """
+    Loads only the pmf of the distribution saved in `path`.
+
+    This suffices for measures of the distribution as a whole, such as its
+    entropy, which do not depend on its outcomes.
+
+    Parameters
+    ----------
+    path : str
+        The directory the distribution was saved in.
+    mmap : bool
+        If `True`, the pmf is memory-mapped rather than read into memory.
+
+    Returns
+    -------
+    pmf : NumPy array
+        The probabilities (or log probabilities) of the distribution.
+
+    """
+    mode = 'r' if mmap else None
+    return np.load(os.path.join(path, _PMF), mmap_mode=mode)
+
+
+def load_distribution(path, mmap=True):
+    """
+    Loads the distribution saved in `path`.
+
+    Parameters
+    ----------
+    path : str
+        The directory the distribution was saved in.
+    mmap : bool
+        If `True`, the pmf and outcome table are memory-mapped rather than
+        read into memory. The mapping is copy-on-write: the distribution may
+        be modified, but the changes are never written back to disk.
+
+    Returns
+    -------
+    dist : ScalarDistribution or Distribution
+        The distribution, of the type it was saved as.
+
+    Raises
+    ------
+    ditException
+        If `path` was saved in an unsupported format.
+
+    Notes
+    -----
+    The metadata is pickled, so distributions should only be loaded from
+    trusted sources.
+
+    """
+    meta = _load_meta(path)
+    mode = 'c' if mmap else None
+    pmf = np.load(os.path.join(path, _PMF), mmap_mode=mode)
+    codes = np.load(os.path.join(path, _CODES), mmap_mode=mode)
+    sample_space = _decode_space(meta['sample_space'])
+
+    if not meta['joint']:
+        symbols = list(sample_space)
+        d = _make_distribution(outcomes=[symbols[i] for i in codes],
+                               pmf=pmf,
+                               sample_space=sample_space,
+                               base=meta['base'],
+                               sparse=meta['sparse'])
+        return d
+
+    if meta['coded']:
+        d = _make_coded_distribution(codes=codes,
+                                     pmf=pmf,
+                                     base=meta['base'],
+                                     sample_space=sample_space,
+                                     sparse=meta['sparse'])
+    else:
+        symbols = list(sample_space)
+        d = Distribution([symbols[i] for i in codes], pmf,
+                         sample_space=sample_space,
+                         base=meta['base'],
+                         sort=False,
+                         sparse=meta['sparse'],
+                         trim=False,
+                         validate=False)
+
+    d.set_rv_names(meta['rv_names'])
+    d._mask = meta['mask']
+
+    return d
@@ -0,0 +1,67 @@
+"""
+Tests for dit.cdist.
+"""
+
+from __future__ import division
+
+import pytest
+
+import numpy as np
+
+import dit
+from dit import ConditionalDistribution
+from dit.exceptions import ditException
+
+
+def test_rows():
+    """
+    Test that the rows are the conditional distributions.
+    """
+    d = dit.example_dists.Xor()
+    d.pmf = dit.math.pmfops.jittered(d.pmf, .4)
+    _, dists = d.condition_on([0])
+    _, cdist = d.condition_on([0], conditional=True)
+    assert isinstance(cdist, ConditionalDistribution)
+    assert len(cdist) == len(dists)
+    for row, dist in zip(cdist, dists):
+        assert row.is_approx_equal(dist)
+        assert row.outcomes == dist.outcomes
+    assert cdist[-1] is cdist[len(cdist) - 1]
+    assert [row.outcomes for row in cdist[:1]] == [dists[0].outcomes]
+    with pytest.raises(IndexError):
+        cdist[len(cdist)]
+
+
+def test_extract():
+    """
+    Test that rows of a single variable are extracted.
+    """
+    d = dit.example_dists.Xor()
+    _, cdist = d.condition_on([0, 1], rvs=[2], extract=True, conditional=True)
+    assert isinstance(cdist[0], dit.ScalarDistribution)
+    assert set(cdist[0].outcomes) <= {'0', '1'}
+
+
+def test_to_array():
+    """
+    Test the array in different bases and modes.
+    """
+    d = dit.Distribution(['00', '01', '11'], [1/4, 1/4, 1/2])
+    d.set_base(2)
+    _, cdist = d.condition_on([0], conditional=True)
+    assert cdist.outcomes == ('0', '1')
+    assert np.allclose(cdist.to_array(), [[1/2, 1/2], [0, 1]])
+    assert np.allclose(cdist.to_array(base=None), np.log2([[1/2, 1/2], [0, 1]]))
+    assert np.allclose(cdist.to_array(mode='dense'), [[1/2, 1/2], [0, 1]])
+    with pytest.raises(ditException):
+        cdist.to_array(mode='sparse')
+
+
+def test_channel_capacity():
+    """
+    Test that the channel capacity accepts a conditional distribution.
+    """
+    d = dit.example_dists.Xor()
+    marginal, cdist = d.condition_on([0, 1], rvs=[2], conditional=True)
+    cc, _ = dit.algorithms.channel_capacity(cdist, marginal)
+    assert cc == pytest.approx(1)
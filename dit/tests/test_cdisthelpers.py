@@ -3,6 +3,7 @@ import pytest
 
 import numpy as np
 import dit
+from dit.cdisthelpers import cdist_array
 
 
 def test_joint_from_factors():
@@ -55,3 +56,26 @@ def test_bad_marginal():
     pY = dit.Distribution(['0', '1', '2'], [.25, 0, .75])
     pY.make_dense()
     pYXZ = dit.joint_from_factors(pY, pXZgY, strict=False)
+
+
+def test_joint_from_factors_conditional():
+    d = dit.example_dists.Xor()
+    d.pmf = dit.math.pmfops.jittered(d.pmf, .4)
+    d.set_rv_names('XYZ')
+    for rvs in ['X', 'Y', 'XZ']:
+        pX, pYgX = d.condition_on(rvs, conditional=True)
+        pXY = dit.joint_from_factors(pX, pYgX)
+        assert pXY.is_approx_equal(d)
+        assert pXY.get_rv_names() == d.get_rv_names()
+
+
+def test_cdist_array_conditional():
+    d = dit.example_dists.Xor()
+    _, cdists = d.condition_on([0, 1])
+    _, cdist = d.condition_on([0, 1], conditional=True)
+    assert np.allclose(cdist_array(cdist, mode='dense'), cdist_array(cdists, mode='dense'))
+
+    d = dit.random_distribution(3, 2)
+    _, cdists = d.condition_on([0])
+    _, cdist = d.condition_on([0], conditional=True)
+    assert np.allclose(cdist_array(cdist), cdist_array(cdists))
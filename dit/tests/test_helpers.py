@@ -9,7 +9,8 @@ import pytest
 from dit import Distribution
 from dit.exceptions import ditException, InvalidDistribution, InvalidOutcome
 from dit.helpers import construct_alphabets, get_product_func, parse_rvs, \
-                        reorder, normalize_pmfs, numerical_test
+                        reorder, normalize_pmfs, numerical_test, \
+                        variable_labels, group_labels
 
 
 def test_construct_alphabets1():
@@ -88,4 +89,15 @@ def test__numerical_test2():
     # A bad distribution is one with a non-numerical alphabet
     d = Distribution([(0, '0'), (1, '0'), (2, '1'), (3, '1')], [1/8, 1/8, 3/8, 3/8])
     with pytest.raises(TypeError):
-        numerical_test(d)
\ No newline at end of file
+        numerical_test(d)
+
+
+def test_variable_labels():
+    """ Test variable_labels and group_labels """
+    d = Distribution(['0a', '0b', '1a', '1c'], [1/4]*4)
+    labels = variable_labels(d)
+    assert len(set(labels[:, 0])) == 2
+    assert len(set(labels[:, 1])) == 3
+    assert list(group_labels(labels[:, [0]])) in ([0, 0, 1, 1], [1, 1, 0, 0])
+    assert len(set(group_labels(labels))) == 4
+    assert list(group_labels(labels[:, []])) == [0, 0, 0, 0]
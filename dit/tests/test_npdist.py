@@ -168,6 +168,65 @@ def test_coalesce():
     assert d.outcome_length() == 2
 
 
+@pytest.mark.parametrize('sparse', [True, False])
+@pytest.mark.parametrize('base', ['linear', 2, 'e'])
+@pytest.mark.parametrize('rvs', [
+    [[0, 1], [2]],
+    [[2, 0], [1, 1]],
+    [[0], [1], [2], [0]],
+    [[]],
+])
+def test_coalesce_codes(rvs, base, sparse):
+    # The integer-coded engine should agree with a brute-force coalescing.
+    outcomes = ['000', '011', '101', '110', '222']
+    pmf = [1/8, 1/8, 1/4, 1/4, 1/4]
+    d = Distribution(outcomes, pmf, sparse=sparse)
+    expected = {}
+    for outcome, p in zip(outcomes, pmf):
+        new = tuple(''.join(outcome[i] for i in rv) for rv in rvs)
+        expected[new] = expected.get(new, 0) + p
+    d.set_base(base)
+    c = d.coalesce(rvs)
+    c.set_base('linear')
+    assert c.is_sparse() == sparse
+    if sparse:
+        assert set(c.outcomes) == set(expected)
+    else:
+        assert c.outcomes == tuple(c.sample_space())
+    for outcome, p in c.zipped():
+        assert p == pytest.approx(expected.get(outcome, 0))
+
+
+def test_coalesce_codes_extract():
+    outcomes = ['000', '011', '101', '110']
+    pmf = [1/4]*4
+    d = Distribution(outcomes, pmf)
+    d1 = d.coalesce([[2, 0, 0]], extract=True)
+    assert d1.outcomes == ('000', '011', '100', '111')
+    assert d1.alphabet == (('0', '1'),)*3
+    d2 = d1.coalesce([[0], [1, 2]]).marginal([1])
+    assert d2.outcomes == (('00',), ('11',))
+
+
+def test_coalesce_codes_nested():
+    outcomes = ['000', '011', '101', '110']
+    pmf = [1/4]*4
+    d = Distribution(outcomes, pmf)
+    d = d.coalesce([[0, 1], [2]])
+    d = d.coalesce([[1], [0]])
+    assert d.outcomes == ((('0',), ('00',)), (('0',), ('11',)),
+                          (('1',), ('01',)), (('1',), ('10',)))
+
+
+def test_coalesce_unsorted():
+    outcomes = ['10', '01']
+    pmf = [1/4, 3/4]
+    d = Distribution(outcomes, pmf, sort=False)
+    d = d.marginal([0])
+    assert d.outcomes == ('0', '1')
+    assert np.allclose(d.pmf, [3/4, 1/4])
+
+
 def test_copy():
     outcomes = ['0', '1']
     pmf = [1/2, 1/2]
@@ -242,3 +301,67 @@ def test_from_rv():
     d1 = Distribution.from_rv_discrete(rv)
     d2 = Distribution([(1,), (2,)], [3/10, 7/10])
     assert d1.is_approx_equal(d2)
+
+
+def test_coded_outcomes():
+    pmf = np.array([[1/2, 0], [1/4, 1/4]])
+    d = Distribution.from_ndarray(pmf)
+    assert d._stored_outcomes is None
+    assert len(d) == 3
+    assert d[(1, 0)] == pytest.approx(1/4)
+    assert d[(0, 1)] == 0
+    assert (1, 1) in d
+    assert (0, 1) not in d
+    assert d.has_outcome((1, 1), null=False)
+    assert not d.has_outcome((0, 1), null=False)
+    assert d._stored_outcomes is None
+    assert d.outcomes == ((0, 0), (1, 0), (1, 1))
+
+
+def test_coded_make_dense():
+    d = Distribution(['00', '11'], [1/2, 1/2])
+    m = d.marginal([1])
+    m.make_dense()
+    d.make_dense()
+    assert d.outcomes == ('00', '01', '10', '11')
+    assert np.allclose(d.pmf, [1/2, 0, 0, 1/2])
+    assert d['11'] == pytest.approx(1/2)
+    assert d.make_sparse() == 2
+    assert d.outcomes == ('00', '11')
+
+
+def test_coded_copy():
+    d = Distribution(['00', '01', '11'], [1/4, 1/4, 1/2])
+    m1 = d.marginal([1])
+    m2 = m1.copy()
+    m2['1'] = 1/4
+    assert m1['1'] == pytest.approx(3/4)
+    assert m2.outcomes == ('0', '1')
+    assert m1.outcomes == ('0', '1')
+
+
+def test_copy_shares():
+    d = Distribution(['00', '01', '11'], [1/4, 1/4, 1/2])
+    d2 = d.copy()
+    assert d2.pmf is d.pmf
+    assert d2.outcomes is d.outcomes
+    with pytest.raises(ValueError):
+        d.pmf[0] = 1/2
+    d2['01'] = 0
+    d2.normalize()
+    assert d2.pmf is not d.pmf
+    assert np.allclose(d.pmf, [1/4, 1/4, 1/2])
+    assert np.allclose(d2.pmf, [1/3, 0, 2/3])
+    d.pmf[0] = 1/4
+
+
+def test_copy_released():
+    d = Distribution(['00', '01', '11'], [1/4, 1/4, 1/2])
+    d2 = d.copy()
+    d3 = d2.copy()
+    d3.make_sparse()
+    assert not d.pmf.flags.writeable
+    del d2
+    assert d.pmf.flags.writeable
+    assert d3.pmf.flags.writeable
+    assert d3.outcomes == d.outcomes
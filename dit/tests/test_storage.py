@@ -0,0 +1,74 @@
+"""
+Tests for dit.storage.
+"""
+
+from __future__ import division
+
+import pytest
+
+import numpy as np
+
+from dit import Distribution, ScalarDistribution
+from dit.exceptions import ditException
+from dit.example_dists import Xor
+from dit.shannon import entropy, entropy_pmf
+from dit.storage import load_distribution, load_pmf
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_roundtrip(tmpdir, mmap):
+    d = Xor()
+    d.set_rv_names('XYZ')
+    d.save(str(tmpdir))
+    d2 = Distribution.load(str(tmpdir), mmap=mmap)
+    assert d2.is_approx_equal(d)
+    assert d2.get_rv_names() == ('X', 'Y', 'Z')
+    assert d2.outcomes == d.outcomes
+
+
+def test_roundtrip_marginal(tmpdir):
+    d = Xor().copy(base=2).marginal([0, 2])
+    d.save(str(tmpdir))
+    d2 = load_distribution(str(tmpdir))
+    assert d2.get_base() == 2
+    assert d2._mask == d._mask
+    assert d2.outcomes == ('00', '01', '10', '11')
+    assert d2.is_approx_equal(d)
+
+
+def test_roundtrip_coalesced(tmpdir):
+    d = Xor().coalesce([[0, 1], [2]])
+    d.save(str(tmpdir))
+    d2 = load_distribution(str(tmpdir))
+    assert d2.outcomes == d.outcomes
+    assert d2.is_approx_equal(d)
+
+
+def test_roundtrip_scalar(tmpdir):
+    d = ScalarDistribution(['a', 'b', 'c'], [1/2, 0, 1/2], trim=False)
+    d.save(str(tmpdir))
+    d2 = ScalarDistribution.load(str(tmpdir))
+    assert isinstance(d2, ScalarDistribution)
+    assert not d2.is_joint()
+    assert d2.outcomes == ('a', 'b', 'c')
+    assert d2.is_approx_equal(d)
+
+
+def test_load_wrong_class(tmpdir):
+    ScalarDistribution(['a', 'b'], [1/2, 1/2]).save(str(tmpdir))
+    with pytest.raises(ditException):
+        Distribution.load(str(tmpdir))
+
+
+def test_mmap_copy_on_write(tmpdir):
+    Xor().save(str(tmpdir))
+    d = Distribution.load(str(tmpdir))
+    d['000'] = 1/2
+    d.normalize()
+    assert np.allclose(load_pmf(str(tmpdir)), [1/4]*4)
+
+
+def test_load_pmf(tmpdir):
+    d = Xor()
+    d.save(str(tmpdir))
+    assert entropy_pmf(load_pmf(str(tmpdir))) == pytest.approx(entropy(d))
@@ -0,0 +1,131 @@
+"""
+Helpers for dividing independent computations between workers.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from itertools import count
+
+import multiprocessing
+
+from ..exceptions import ditException
+
+__all__ = ('map_in_pool',
+          )
+
+
+# The functions and shared arguments handed to forked workers, keyed by a
+# token. They need not be picklable, as forked workers inherit this registry.
+_FORKED = {}
+_forked_tokens = count()
+
+
+def _fork_context():
+    """
+    Returns the multiprocessing context for forked workers, or None if the
+    platform cannot fork or, as on Python 2, contexts are unavailable.
+
+    Returns
+    -------
+    context : multiprocessing.context.ForkContext, None
+        The fork context.
+    """
+    try:
+        return multiprocessing.get_context('fork')
+    except (AttributeError, ValueError):
+        return None
+
+
+def _call_forked(token, task):
+    """
+    Call a function registered in `_FORKED` on a single task.
+
+    Parameters
+    ----------
+    token : int
+        The key of the function and its shared arguments in the registry.
+    task : tuple
+        The remaining arguments of the function.
+
+    Returns
+    -------
+    result : object
+        The value of the function.
+    """
+    func, shared = _FORKED[token]
+    return func(*shared + task)
+
+
+def map_in_pool(func, args, n_jobs=None, executor=None, shared=()):
+    """
+    Call `func` on each of `args`, in parallel if requested.
+
+    Parameters
+    ----------
+    func : func
+        The function to call.
+    args : list of tuples
+        The arguments of each call, following `shared`.
+    n_jobs : int, None
+        The number of workers. If less than one, use one per CPU. If None and
+        `executor` is None, the calls are made serially.
+    executor : str, Executor, None
+        Either 'process' (the default when `n_jobs` is given) or 'thread' to
+        create a pool of `n_jobs` workers, or a `concurrent.futures.Executor`
+        to submit the calls to. Processes are forked where the platform
+        allows, and threads are used otherwise.
+    shared : tuple
+        The leading arguments common to every call. Forked workers inherit
+        these, along with `func`, rather than receiving them with each call,
+        so neither need be picklable.
+
+    Returns
+    -------
+    results : list
+        The value of each call, in the order of `args`.
+
+    Raises
+    ------
+    ditException
+        Raised if `executor` is not 'process', 'thread', or an Executor.
+    """
+    args = [tuple(task) for task in args]
+    shared = tuple(shared)
+
+    if (n_jobs is None and executor is None) or len(args) < 2:
+        return [func(*shared + task) for task in args]
+
+    if isinstance(executor, Executor):
+        futures = [executor.submit(func, *shared + task) for task in args]
+        return [future.result() for future in futures]
+
+    kind = executor or 'process'
+    if kind not in ('process', 'thread'):
+        msg = "`executor` must be 'process', 'thread', or an Executor."
+        raise ditException(msg)
+
+    if n_jobs is None or n_jobs < 1:
+        n_jobs = multiprocessing.cpu_count()
+    n_jobs = min(n_jobs, len(args))
+
+    context = _fork_context() if kind == 'process' else None
+    if context is None:
+        with ThreadPoolExecutor(n_jobs) as pool:
+            futures = [pool.submit(func, *shared + task) for task in args]
+            return [future.result() for future in futures]
+
+    # The workers are forked after the call is registered, and so inherit the
+    # function and shared arguments without them being pickled.
+    token = next(_forked_tokens)
+    _FORKED[token] = (func, shared)
+    try:
+        try:
+            pool = ProcessPoolExecutor(n_jobs, mp_context=context)
+        except TypeError:  # pragma: no cover
+            # Python < 3.7 has no `mp_context`, but forks on POSIX.
+            pool = ProcessPoolExecutor(n_jobs)
+        with pool:
+            futures = [pool.submit(_call_forked, token, task) for task in args]
+            return [future.result() for future in futures]
+    finally:
+        del _FORKED[token]
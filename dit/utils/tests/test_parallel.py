@@ -0,0 +1,60 @@
+"""
+Tests for dit.utils.parallel.
+"""
+
+import multiprocessing
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dit.exceptions import ditException
+from dit.utils.parallel import map_in_pool
+
+
+def _affine(a, b, x):
+    return a * x + b
+
+
+@pytest.mark.parametrize(('n_jobs', 'executor'), [
+    (None, None),
+    (2, None),
+    (2, 'process'),
+    (2, 'thread'),
+    (0, 'thread'),
+])
+def test_map_in_pool(n_jobs, executor):
+    """ Test that every way of mapping gives the values in order """
+    values = map_in_pool(_affine, [(x,) for x in range(5)], n_jobs=n_jobs,
+                         executor=executor, shared=(2, 1))
+    assert values == [1, 3, 5, 7, 9]
+
+
+def test_map_in_pool_executor():
+    """ Test submitting to an existing executor """
+    with ThreadPoolExecutor(2) as executor:
+        values = map_in_pool(_affine, [(x,) for x in range(5)], executor=executor, shared=(2, 1))
+    assert values == [1, 3, 5, 7, 9]
+
+
+def test_map_in_pool_closure():
+    """ Test that forked workers need not pickle the function or shared arguments """
+    offset = 3
+    func = lambda f, x: f(x) + offset
+    values = map_in_pool(func, [(x,) for x in range(4)], n_jobs=2, executor='process',
+                         shared=(lambda x: x**2,))
+    assert values == [3, 4, 7, 12]
+
+
+def test_map_in_pool_no_fork(monkeypatch):
+    """ Test the fallback to threads when fork contexts are unavailable """
+    monkeypatch.delattr(multiprocessing, 'get_context')
+    func = lambda x: 2 * x
+    values = map_in_pool(func, [(x,) for x in range(4)], n_jobs=2, executor='process')
+    assert values == [0, 2, 4, 6]
+
+
+def test_map_in_pool_bad_executor():
+    """ Test that an unknown executor raises """
+    with pytest.raises(ditException):
+        map_in_pool(_affine, [(x,) for x in range(4)], n_jobs=2, executor='cluster', shared=(2, 1))